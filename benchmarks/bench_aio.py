@@ -0,0 +1,81 @@
+"""Measure event loop latency while coloring large messages.
+
+A ticker task sleeps for 1 ms in a loop and records how late it wakes up,
+while another task colors a batch of large lines inline with `gradient()` or
+through `maxcolor.aio.agradient()`.
+
+    python -m benchmarks.bench_aio
+"""
+import asyncio
+from io import StringIO
+from time import perf_counter
+
+from rich.console import Console
+from rich.table import Table
+
+from maxcolor.aio import agradient
+from maxcolor.maxcolor import gradient
+from maxcolor.spec import GradientSpec
+
+TICK = 0.001
+LINES = [("Sunt sit est labore elit ut laboris est. " * 40) * size for size in (1, 10, 50, 10, 1) * 4]
+
+
+async def ticker(delays: list[float], stop: asyncio.Event) -> None:
+    """Record how late a 1 ms sleep wakes up until `stop` is set."""
+    while not stop.is_set():
+        started = perf_counter()
+        await asyncio.sleep(TICK)
+        delays.append(perf_counter() - started - TICK)
+
+
+async def source():
+    for line in LINES:
+        yield line
+
+
+async def inline() -> None:
+    console = Console(file=StringIO(), force_terminal=True, color_system="truecolor", width=200)
+    async for line in source():
+        console.print(gradient(line), end="")
+
+
+async def streamed(**options) -> None:
+    async for _ in agradient(source(), GradientSpec(), **options):
+        pass
+
+
+async def measure(work) -> tuple[float, float, float]:
+    """Run `work` next to the ticker and return (elapsed s, p99 delay ms, max delay ms)."""
+    delays: list[float] = []
+    stop = asyncio.Event()
+    task = asyncio.create_task(ticker(delays, stop))
+    await asyncio.sleep(0)
+    started = perf_counter()
+    await work
+    elapsed = perf_counter() - started
+    stop.set()
+    await task
+    delays.sort()
+    p99 = delays[int(len(delays) * 0.99)] if delays else 0.0
+    return elapsed, p99 * 1000, max(delays, default=0.0) * 1000
+
+
+def main() -> None:
+    runs = [
+        ("gradient() inline", lambda: inline()),
+        ("agradient() chunked", lambda: streamed(executor_threshold=None)),
+        ("agradient() chunk=256", lambda: streamed(chunk=256, executor_threshold=None)),
+        ("agradient() executor", lambda: streamed(executor_threshold=1 << 14)),
+    ]
+    table = Table(title=f"Event loop latency ({sum(map(len, LINES))} chars in {len(LINES)} lines)")
+    for column in ("Mode", "Total (s)", "p99 delay (ms)", "Max delay (ms)"):
+        table.add_column(column, justify="right")
+    for name, work in runs:
+        elapsed, p99, worst = asyncio.run(measure(work()))
+        table.add_row(name, f"{elapsed:.2f}", f"{p99:.2f}", f"{worst:.2f}")
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Compare the per-frame cost of animating a header.
+
+    python -m benchmarks.bench_animate
+"""
+from io import StringIO
+from time import perf_counter
+
+from rich.console import Console
+from rich.segment import Segments
+from rich.table import Table
+
+from maxcolor.animate import AnimatedGradient
+
+HEADER = "\n".join(["  maxcolor dashboard  ::  shifting rainbow header  ::  " * 2] * 3)
+FRAMES = 600
+
+
+def rich_frame_time(renderable_for_frame) -> float:
+    """The mean time to render one frame with rich, in µs."""
+    console = Console(file=StringIO(), force_terminal=True, color_system="truecolor", width=240)
+    started = perf_counter()
+    for frame in range(FRAMES):
+        console.print(renderable_for_frame(frame))
+    return (perf_counter() - started) / FRAMES * 1_000_000
+
+
+def main() -> None:
+    animation = AnimatedGradient(HEADER, period=60)
+    table = Table(title=f"Per-frame cost ({len(HEADER)} chars, {FRAMES} frames)")
+    for column in ("Mode", "µs / frame", "Bytes / frame"):
+        table.add_column(column, justify="right")
+
+    try:
+        from maxcolor.maxcolor import gradient
+
+        elapsed = rich_frame_time(lambda frame: gradient(HEADER, seed=frame))
+        table.add_row("gradient() every frame", f"{elapsed:.0f}", "")
+    except ImportError:
+        table.add_row("gradient() every frame", "n/a", "")
+    elapsed = rich_frame_time(lambda frame: Segments(animation.frame(frame % animation.period)))
+    table.add_row("AnimatedGradient in rich", f"{elapsed:.0f}", "")
+
+    for color_system in ("truecolor", "256"):
+        animation = AnimatedGradient(HEADER, period=60, color_system=color_system)
+        full = sum(len(animation.render(frame % 60)) for frame in range(FRAMES)) / FRAMES
+        started = perf_counter()
+        size = 0
+        for frame in range(FRAMES):
+            size += len(animation.render_diff(frame % 60, (frame + 1) % 60))
+        elapsed = (perf_counter() - started) / FRAMES * 1_000_000
+        table.add_row(f"full redraw, {color_system}", "", f"{full:.0f}")
+        table.add_row(f"render_diff(), {color_system}", f"{elapsed:.0f}", f"{size / FRAMES:.0f}")
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Compare printing a banner with and without the disk cache.
+
+Each run is a fresh interpreter, as at CLI startup. The banner time is
+measured inside the child and covers everything after the interpreter starts,
+including imports.
+
+    python -m benchmarks.bench_cache
+"""
+import os
+import subprocess
+import sys
+import tempfile
+from statistics import median
+from time import perf_counter
+
+from rich.console import Console
+from rich.table import Table
+
+RUNS = 10
+TEXT = "\n".join(["maxcolor " * 10] * 12)
+SPEC_SCRIPT = """
+from time import perf_counter
+started = perf_counter()
+from maxcolor.cache import banner
+from maxcolor.spec import GradientSpec
+output = banner({text!r}, GradientSpec(granularity=1), width=100, cache={cache})
+print(perf_counter() - started)
+"""
+PANEL_SCRIPT = """
+from time import perf_counter
+started = perf_counter()
+from maxcolor.cache import DiskCache, cache_key, default_cache
+
+def render():
+    from io import StringIO
+    from rich.console import Console
+    from maxcolor.maxcolor import gradient_panel
+    console = Console(file=StringIO(), width=100, force_terminal=True, color_system="truecolor")
+    with console.capture() as capture:
+        console.print(gradient_panel({text!r}, title="maxcolor", stable=True))
+    return capture.get()
+
+if {cache}:
+    output = default_cache().render(cache_key({text!r}, ("gradient_panel", "maxcolor"), 100, "truecolor"), render)
+else:
+    output = render()
+print(perf_counter() - started)
+"""
+
+
+def startup(script: str, cache: str, environment: dict) -> tuple[float, float]:
+    """Run a script `RUNS` times in new interpreters.
+
+    Returns:
+        `tuple[float,float]`: The median time of the banner and of the whole process, in ms.
+    """
+    command = [sys.executable, "-c", script.format(text=TEXT, cache=cache)]
+    subprocess.run(command, env=environment, check=True, stdout=subprocess.DEVNULL)  # Warm up the cache
+    inner, outer = [], []
+    for _ in range(RUNS):
+        started = perf_counter()
+        result = subprocess.run(command, env=environment, check=True, capture_output=True, text=True)
+        outer.append(perf_counter() - started)
+        inner.append(float(result.stdout))
+    return median(inner) * 1000, median(outer) * 1000
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        environment = dict(os.environ, XDG_CACHE_HOME=directory)
+        environment["PYTHONPATH"] = os.pathsep.join(filter(None, [os.getcwd(), environment.get("PYTHONPATH")]))
+        table = Table(title=f"Banner startup ({len(TEXT)} chars, median of {RUNS} runs)")
+        for column in ("Mode", "Banner (ms)", "Process (ms)"):
+            table.add_column(column, justify="right")
+        for name, script, cache in (
+            ("GradientSpec banner, no cache", SPEC_SCRIPT, "False"),
+            ("GradientSpec banner, warm cache", SPEC_SCRIPT, "None"),
+            ("gradient_panel, no cache", PANEL_SCRIPT, "False"),
+            ("gradient_panel, warm cache", PANEL_SCRIPT, "True"),
+        ):
+            inner, outer = startup(script, cache, environment)
+            table.add_row(name, f"{inner:.1f}", f"{outer:.1f}")
+        Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
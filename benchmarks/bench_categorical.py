@@ -0,0 +1,43 @@
+"""Measure the per-call cost of categorical colors and how well they spread labels.
+
+    python -m benchmarks.bench_categorical
+"""
+from collections import Counter
+from time import perf_counter
+
+from rich.console import Console
+from rich.table import Table
+
+from maxcolor.categorical import CategoricalColors
+
+CALLS = 1_000_000
+SERVICES = [f"service-{number}" for number in range(40)]
+REQUEST_IDS = [f"{number:08x}" for number in range(100_000)]
+
+
+def call_time(colors: CategoricalColors, labels: list[str]) -> float:
+    """The mean time of `style()`, cycling through the labels, in ns."""
+    style = colors.style
+    count = len(labels)
+    started = perf_counter()
+    for number in range(CALLS):
+        style(labels[number % count])
+    return (perf_counter() - started) / CALLS * 1e9
+
+
+def main() -> None:
+    table = Table(title=f"CategoricalColors.style() over {CALLS:,} calls")
+    for column in ("Palette", "Labels", "ns / call", "Largest color share"):
+        table.add_column(column, justify="right")
+    for palette, colors in (("spectrum (10)", CategoricalColors), ("ring of 64", lambda: CategoricalColors(size=64))):
+        for name, labels in (("40 services", SERVICES), ("100k request IDs", REQUEST_IDS)):
+            mapper = colors()
+            elapsed = call_time(mapper, labels)
+            shares = Counter(mapper.index(label) for label in labels)
+            largest = max(shares.values()) / len(labels)
+            table.add_row(palette, name, f"{elapsed:.0f}", f"{largest:.1%} (even: {1 / len(mapper):.1%})")
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Measure the cost of mapping a million values to colors.
+
+    python -m benchmarks.bench_colormap
+"""
+import random
+from array import array
+from time import perf_counter
+
+from rich.console import Console
+from rich.table import Table
+
+from maxcolor.colormap import Colormap
+
+COUNT = 1_000_000
+
+
+def timed(function, values) -> float:
+    """The time of one call, in ms."""
+    started = perf_counter()
+    function(values)
+    return (perf_counter() - started) * 1000
+
+
+def main() -> None:
+    generator = random.Random(0)
+    values = array("d", (generator.gauss(50, 20) for _ in range(COUNT)))
+    table = Table(title=f"Mapping {COUNT:,} values")
+    for column in ("Input", "Colormap", "Output", "ms"):
+        table.add_column(column, justify="right")
+
+    inputs = [("array('d')", values), ("list", values.tolist())]
+    try:
+        import numpy
+
+        inputs.append(("numpy", numpy.frombuffer(values, dtype=numpy.float64)))
+    except ImportError:
+        pass
+    colormaps = [
+        ("256, min/max", Colormap()),
+        ("256, clipped 0-100", Colormap(vmin=0, vmax=100)),
+        ("1024, clipped 0-100", Colormap(size=1024, vmin=0, vmax=100)),
+    ]
+    for input_name, data in inputs:
+        for colormap_name, colormap in colormaps:
+            table.add_row(input_name, colormap_name, "packed", f"{timed(colormap.packed, data):.0f}")
+        colormap = colormaps[1][1]
+        colormap.styles(data[:1])  # Build the shared styles outside the timing
+        table.add_row(input_name, colormaps[1][0], "styles", f"{timed(colormap.styles, data):.0f}")
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Compare per-request latency of the colorizing daemon with a cold start.
+
+    python -m benchmarks.bench_daemon
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from statistics import median
+from time import perf_counter
+
+from rich.console import Console
+from rich.table import Table
+
+from maxcolor.daemon import DaemonClient
+
+RUNS = 20
+REQUESTS = 2000
+LINE = "2024-05-01 12:00:00 worker-3 finished job 1842 in 12.4 ms\n"
+COLD_SCRIPT = """
+import sys
+from rich.console import Console
+from maxcolor.maxcolor import gradient
+Console(force_terminal=True).print(gradient(sys.stdin.read(), stable=True), end="")
+"""
+
+
+def process_latency(command: list[str], environment: dict) -> float:
+    """The median wall time of a command that colors one line from stdin, in ms."""
+    times = []
+    for _ in range(RUNS):
+        started = perf_counter()
+        subprocess.run(command, input=LINE.encode(), env=environment, check=True, stdout=subprocess.DEVNULL)
+        times.append(perf_counter() - started)
+    return median(times) * 1000
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        socket_path = os.path.join(directory, "maxcolor.sock")
+        environment = dict(os.environ)
+        environment["PYTHONPATH"] = os.pathsep.join(filter(None, [os.getcwd(), environment.get("PYTHONPATH")]))
+        client_command = [sys.executable, "-m", "maxcolor", "--client", "--socket", socket_path]
+
+        table = Table(title=f"Latency of coloring one line ({len(LINE)} chars)")
+        for column in ("Mode", "ms / request"):
+            table.add_column(column, justify="right")
+        try:
+            table.add_row("cold start, gradient() + rich", f"{process_latency([sys.executable, '-c', COLD_SCRIPT], environment):.2f}")
+        except subprocess.CalledProcessError:
+            table.add_row("cold start, gradient() + rich", "n/a")
+        table.add_row("maxcolor --client, no daemon", f"{process_latency(client_command, environment):.2f}")
+
+        daemon = subprocess.Popen([sys.executable, "-m", "maxcolor", "--daemon", "--socket", socket_path], env=environment)
+        try:
+            while not os.path.exists(socket_path):
+                time.sleep(0.01)
+            table.add_row("maxcolor --client, daemon", f"{process_latency(client_command, environment):.2f}")
+            with DaemonClient(socket_path) as client:
+                client.colorize(LINE)
+                started = perf_counter()
+                for _ in range(REQUESTS):
+                    client.colorize(LINE)
+                elapsed = perf_counter() - started
+            table.add_row("DaemonClient, open connection", f"{elapsed / REQUESTS * 1000:.3f}")
+        finally:
+            daemon.terminate()
+            daemon.wait()
+        Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
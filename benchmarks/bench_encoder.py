@@ -0,0 +1,61 @@
+"""Compare the output size of `SGREncoder` with rich's default rendering.
+
+    python -m benchmarks.bench_encoder
+"""
+from io import StringIO
+from time import perf_counter
+
+from rich.console import Console
+from rich.table import Table
+
+from maxcolor.encoder import SGREncoder
+from maxcolor.maxcolor import gradient
+
+MESSAGE = (
+    "Sunt sit est labore elit ut laboris est. Aute cupidatat sit officia deserunt sint "
+    "adipisicing et minim aliqua enim. Tempor eiusmod dolore excepteur dolore id aliquip.\n"
+) * 20
+ENCODERS = [
+    ("truecolor", SGREncoder("truecolor")),
+    ("truecolor, 5 bit", SGREncoder("truecolor", precision=5)),
+    ("256", SGREncoder("256")),
+    ("standard", SGREncoder("standard")),
+]
+
+
+def rich_bytes(text, color_system: str) -> tuple[int, float]:
+    """Render with rich and return the output size and time in ms."""
+    file = StringIO()
+    console = Console(file=file, force_terminal=True, color_system=color_system, width=200)
+    started = perf_counter()
+    console.print(text, end="")
+    elapsed = perf_counter() - started
+    return len(file.getvalue().encode("utf-8")), elapsed * 1000
+
+
+def main() -> None:
+    console = Console()
+    for granularity in ("char", 4, "word"):
+        text = gradient(MESSAGE, granularity=granularity)
+        table = Table(title=f"granularity={granularity!r} ({len(MESSAGE)} chars)")
+        for column in ("Encoder", "Bytes", "vs rich", "Time (ms)"):
+            table.add_column(column, justify="right")
+        baseline, elapsed = rich_bytes(text, "truecolor")
+        table.add_row("rich truecolor", f"{baseline}", "100.0%", f"{elapsed:.2f}")
+        rich_256, elapsed = rich_bytes(text, "256")
+        table.add_row("rich 256", f"{rich_256}", f"{rich_256 / baseline:.1%}", f"{elapsed:.2f}")
+        for name, encoder in ENCODERS:
+            started = perf_counter()
+            encoder.encode(text)
+            elapsed = (perf_counter() - started) * 1000
+            table.add_row(
+                f"SGREncoder {name}",
+                f"{encoder.bytes_emitted}",
+                f"{encoder.bytes_emitted / baseline:.1%}",
+                f"{elapsed:.2f}",
+            )
+        console.print(table)
+
+
+if __name__ == "__main__":
+    main()
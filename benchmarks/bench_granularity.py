@@ -0,0 +1,64 @@
+"""Benchmark the span budget of `gradient()`.
+
+Compares the number of spans, the rendered output size and the build/render
+time of a 200 column status line and a larger paragraph at each granularity.
+
+    python -m benchmarks.bench_granularity
+"""
+from io import StringIO
+from time import perf_counter
+
+from rich.console import Console
+from rich.table import Table
+
+from maxcolor.maxcolor import gradient
+
+STATUS_LINE = ("maxcolor | gradient status line | " * 8)[:200]
+PARAGRAPH = (
+    "Sunt sit est labore elit ut laboris est. Aute cupidatat sit officia deserunt sint "
+    "adipisicing et minim aliqua enim. Tempor eiusmod dolore excepteur dolore id aliquip "
+    "enim incididunt ex. Non ipsum eu cillum proident ex.\n"
+) * 50
+CASES = [
+    ("char", {}),
+    ("4 chars", {"granularity": 4}),
+    ("word", {"granularity": "word"}),
+    ("line", {"granularity": "line"}),
+    ("max_spans=20", {"max_spans": 20}),
+]
+REPEAT = 20
+
+
+def measure(message: str, **kwargs) -> tuple[int, int, float, float]:
+    """Build and render a gradient `REPEAT` times.
+
+    Returns:
+        `tuple[int,int,float,float]`: spans, output bytes, build ms and render ms.
+    """
+    build = render = 0.0
+    for _ in range(REPEAT):
+        started = perf_counter()
+        text = gradient(message, **kwargs)
+        built = perf_counter()
+        file = StringIO()
+        Console(file=file, force_terminal=True, color_system="truecolor", width=200).print(text)
+        render += perf_counter() - built
+        build += built - started
+    output = file.getvalue().encode("utf-8")
+    return len(text.spans), len(output), build / REPEAT * 1000, render / REPEAT * 1000
+
+
+def main() -> None:
+    console = Console()
+    for name, message in (("200 column status line", STATUS_LINE), ("paragraph", PARAGRAPH)):
+        table = Table(title=f"{name} ({len(message)} chars)")
+        for column in ("Granularity", "Spans", "Bytes", "Build (ms)", "Render (ms)"):
+            table.add_column(column, justify="right")
+        for label, kwargs in CASES:
+            spans, size, build, render = measure(message, **kwargs)
+            table.add_row(label, f"{spans}", f"{size}", f"{build:.3f}", f"{render:.3f}")
+        console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Measure the per-record overhead of gradient log formatting in microseconds.
+
+    python -m benchmarks.bench_logging
+"""
+import logging
+from io import StringIO
+from time import perf_counter
+
+from loguru import logger
+from rich.console import Console
+from rich.table import Table
+
+from maxcolor.formatter import GradientFormatter, loguru_format
+
+RECORDS = 20_000
+FORMAT = "%(asctime)s %(levelname)-8s %(name)s: %(message)s"
+LEVELS = (logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR)
+NAMES = ("api", "api.auth", "db.pool", "worker.queue", "cache")
+CONSOLE = Console(file=StringIO(), force_terminal=True, color_system="truecolor")
+
+
+def make_records(count: int) -> list[logging.LogRecord]:
+    return [
+        logging.LogRecord(NAMES[index % 5], LEVELS[index % 4], __file__, index, "[req %d] handled", (index,), None)
+        for index in range(count)
+    ]
+
+
+def per_record(format, records: list) -> float:
+    """Format every record and return the mean time per record in µs."""
+    started = perf_counter()
+    for record in records:
+        format(record)
+    return (perf_counter() - started) / len(records) * 1_000_000
+
+
+def gradient_formatter(record: logging.LogRecord) -> str:
+    """The naive approach: build a rich gradient for every record."""
+    from maxcolor.maxcolor import gradient
+
+    with CONSOLE.capture() as capture:
+        CONSOLE.print(gradient(record.levelname), gradient(record.name), record.getMessage())
+    return capture.get()
+
+
+def loguru_per_record(format, count: int) -> float:
+    """Log `count` messages through loguru into a string sink and return µs per record."""
+    sink = StringIO()
+    logger.remove()
+    logger.add(sink, format=format, colorize=True)
+    started = perf_counter()
+    for index in range(count):
+        logger.log(("DEBUG", "INFO", "WARNING", "ERROR")[index % 4], "[req {}] handled", index)
+    elapsed = perf_counter() - started
+    logger.remove()
+    return elapsed / count * 1_000_000
+
+
+def main() -> None:
+    records = make_records(RECORDS)
+    table = Table(title=f"Per-record formatting overhead ({RECORDS} records)")
+    for column in ("Formatter", "µs / record"):
+        table.add_column(column, justify="right")
+
+    table.add_row("logging.Formatter", f"{per_record(logging.Formatter(FORMAT).format, records):.2f}")
+    formatter = GradientFormatter(FORMAT, prefix=r"\[req")
+    table.add_row("GradientFormatter", f"{per_record(formatter.format, records):.2f}")
+    try:
+        elapsed = per_record(gradient_formatter, records[:500])
+        table.add_row("gradient() per record", f"{elapsed:.2f}")
+    except ImportError:
+        table.add_row("gradient() per record", "n/a")
+    table.add_row("loguru plain", f"{loguru_per_record('{time} | {level: <8} | {name} - {message}', RECORDS):.2f}")
+    table.add_row("loguru_format()", f"{loguru_per_record(loguru_format(), RECORDS):.2f}")
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Measure palette lookups and gradients as the palette grows.
+
+    python -m benchmarks.bench_palette
+"""
+from time import perf_counter
+
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.run import message
+from maxcolor.maxcolor import gradient
+from maxcolor.palette import Palette
+
+SIZES = (4, 10, 64, 1024)
+LOOKUPS = 200_000
+MESSAGE = 10_000
+
+
+def palette(size: int) -> Palette:
+    """A palette of `size` distinct colors."""
+    return Palette([(index * 37) & 0xFFFFFF for index in range(size)])
+
+
+def per_call(function, calls: int) -> float:
+    """The mean time of a call, in ns."""
+    started = perf_counter()
+    for number in range(calls):
+        function(number)
+    return (perf_counter() - started) / calls * 1e9
+
+
+def main() -> None:
+    table = Table(title="Palette lookups and gradients")
+    for column in ("Colors", "index() ns", "path() ns", "walk(9) ns", f"gradient() {MESSAGE:,} chars ms"):
+        table.add_column(column, justify="right")
+    text = message(MESSAGE)
+    for size in SIZES:
+        colors = palette(size)
+        hex_colors = colors.hex_colors
+        started = perf_counter()
+        gradient(text, palette=colors, seed=0)
+        elapsed = perf_counter() - started
+        table.add_row(
+            f"{size:,}",
+            f"{per_call(lambda number: colors.index(hex_colors[number % size]), LOOKUPS):.0f}",
+            f"{per_call(lambda number: colors.path(number, number + 3), LOOKUPS):.0f}",
+            f"{per_call(lambda number: colors.walk(number, 9), LOOKUPS):.0f}",
+            f"{elapsed * 1000:.2f}",
+        )
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Measure loading a palette file by parsing it and through its compiled sidecar.
+
+    python -m benchmarks.bench_palette_file
+"""
+import json
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from rich.console import Console
+from rich.table import Table
+
+from maxcolor.palette_file import load_palette, read_palette_file, read_sidecar
+
+SIZES = (10, 64, 1024)
+LOADS = 500
+
+
+def write_palettes(directory: Path, size: int) -> list[Path]:
+    """A JSON and a TOML palette file of `size` named colors."""
+    colors = {f"color_{index}": f"#{(index * 37) & 0xFFFFFF:06x}" for index in range(size)}
+    json_file = directory / f"palette_{size}.json"
+    json_file.write_text(json.dumps({"name": f"palette_{size}", "colors": colors}))
+    toml_file = directory / f"palette_{size}.toml"
+    toml_file.write_text(
+        f'name = "palette_{size}"\n[colors]\n' + "".join(f'{name} = "{color}"\n' for name, color in colors.items())
+    )
+    return [json_file, toml_file]
+
+
+def per_load(function, path: Path) -> float:
+    """The mean time of a load, in µs."""
+    started = perf_counter()
+    for _ in range(LOADS):
+        function(path)
+    return (perf_counter() - started) / LOADS * 1e6
+
+
+def main() -> None:
+    table = Table(title="Palette file loads")
+    table.add_column("File")
+    for column in ("Colors", "Parse µs", "Sidecar µs", "Speedup"):
+        table.add_column(column, justify="right")
+    with tempfile.TemporaryDirectory() as directory:
+        for size in SIZES:
+            for path in write_palettes(Path(directory), size):
+                load_palette(path)  # Compile the sidecar
+                assert read_sidecar(path) == read_palette_file(path)
+                parse = per_load(read_palette_file, path)
+                sidecar = per_load(load_palette, path)
+                table.add_row(path.suffix, f"{size:,}", f"{parse:.1f}", f"{sidecar:.1f}", f"{parse / sidecar:.1f}x")
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Measure how `colorize_file()` scales with the number of worker processes.
+
+    python -m benchmarks.bench_parallel [size_in_mb]
+"""
+import os
+import sys
+import tempfile
+from time import perf_counter
+
+from rich.console import Console
+from rich.table import Table
+
+from maxcolor.parallel import colorize_file
+
+LINE = b"2022-11-16 15:41:07 | INFO     | maxcolor.parallel | colored chunk in order\n"
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    cpus = os.cpu_count() or 1
+    jobs = sorted({1, 2, 4, 8, 16, cpus} & set(range(1, cpus + 1)))
+
+    with tempfile.NamedTemporaryFile(suffix=".log", delete=False) as file:
+        line_count = size * (1 << 20) // len(LINE)
+        file.write(LINE * line_count)
+    try:
+        table = Table(title=f"colorize_file() on {size} MB, {cpus} CPUs")
+        for column in ("Workers", "Seconds", "MB/s", "Speedup"):
+            table.add_column(column, justify="right")
+        baseline = None
+        for workers in jobs:
+            with open(os.devnull, "wb") as target:
+                started = perf_counter()
+                colorize_file(file.name, target, workers=workers)
+                elapsed = perf_counter() - started
+            baseline = baseline or elapsed
+            table.add_row(f"{workers}", f"{elapsed:.2f}", f"{size / elapsed:.0f}", f"{baseline / elapsed:.2f}x")
+        Console().print(table)
+    finally:
+        os.unlink(file.name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Measure the per-chunk latency and CPU cost of `maxcolor run`.
+
+    python -m benchmarks.bench_run
+"""
+import os
+import resource
+import subprocess
+import sys
+from time import perf_counter
+
+from rich.console import Console
+from rich.table import Table
+
+from maxcolor.run import PassthroughColorizer
+
+LINE = b"tests/test_module.py::test_case PASSED                              [ 42%]\r\n"
+COLORED_LINE = b"\x1b[32mtests/test_module.py::test_case \x1b[1mPASSED\x1b[0m                 [ 42%]\r\n"
+CHUNKS = {
+    "one line": LINE,
+    "4 KiB plain": (LINE * 64)[:4096],
+    "4 KiB with child colors": (COLORED_LINE * 64)[:4096],
+    "64 KiB plain": (LINE * 1024)[: 1 << 16],
+}
+HEAVY_COMMAND = [sys.executable, "-c", "import sys\nfor i in range(300000): sys.stdout.write(f'line {i} of heavy output\\n')"]
+
+
+def chunk_latency(chunk: bytes, repeat: int = 2000) -> float:
+    """The mean time to color one chunk, in µs."""
+    passthrough = PassthroughColorizer()
+    started = perf_counter()
+    for _ in range(repeat):
+        passthrough.feed(chunk)
+    return (perf_counter() - started) / repeat * 1_000_000
+
+
+def child_cpu(command: list[str]) -> tuple[float, float]:
+    """Run a command with stdout to /dev/null and return (wall s, CPU s of all children)."""
+    before = resource.getrusage(resource.RUSAGE_CHILDREN)
+    started = perf_counter()
+    subprocess.run(command, stdout=subprocess.DEVNULL, stdin=subprocess.DEVNULL, check=False)
+    elapsed = perf_counter() - started
+    after = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return elapsed, (after.ru_utime + after.ru_stime) - (before.ru_utime + before.ru_stime)
+
+
+def main() -> None:
+    console = Console()
+    table = Table(title="PassthroughColorizer.feed() latency")
+    for column in ("Chunk", "Bytes", "µs / chunk"):
+        table.add_column(column, justify="right")
+    for name, chunk in CHUNKS.items():
+        table.add_row(name, f"{len(chunk)}", f"{chunk_latency(chunk):.1f}")
+    console.print(table)
+
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join(filter(None, [os.getcwd(), environment.get("PYTHONPATH")]))
+    table = Table(title="Heavy output (300k lines)")
+    for column in ("Mode", "Wall (s)", "CPU (s)"):
+        table.add_column(column, justify="right")
+    wall, cpu = child_cpu(HEAVY_COMMAND)
+    table.add_row("command alone", f"{wall:.2f}", f"{cpu:.2f}")
+    os.environ["PYTHONPATH"] = environment["PYTHONPATH"]
+    wall, cpu = child_cpu([sys.executable, "-m", "maxcolor", "run", "--", *HEAVY_COMMAND])
+    table.add_row("maxcolor run", f"{wall:.2f}", f"{cpu:.2f}")
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Measure the cost of pushing a value into a sparkline and redrawing it.
+
+    python -m benchmarks.bench_sparkline
+"""
+import math
+from io import StringIO
+from time import perf_counter
+
+from rich.console import Console
+from rich.table import Table
+
+from maxcolor.sparkline import HeatBar, Sparkline
+
+WIDTH = 80
+PUSHES = 5000
+
+
+def series(index: int) -> float:
+    return 50 + 40 * math.sin(index / 7) + 5 * math.sin(index * 1.3)
+
+
+def push_time(chart) -> float:
+    """The mean time to push one value, in µs."""
+    started = perf_counter()
+    for index in range(PUSHES):
+        chart.push(series(index))
+    return (perf_counter() - started) / PUSHES * 1_000_000
+
+
+def rebuild_time(chart_type, **kwargs) -> float:
+    """The mean time to rebuild a chart from its whole window, in µs."""
+    started = perf_counter()
+    for index in range(PUSHES // 10):
+        chart_type([series(index + offset) for offset in range(WIDTH)], width=WIDTH, **kwargs)
+    return (perf_counter() - started) / (PUSHES // 10) * 1_000_000
+
+
+def redraw_time(chart) -> float:
+    """The mean time to render a chart with rich, in µs."""
+    console = Console(file=StringIO(), force_terminal=True, color_system="truecolor", width=WIDTH + 10)
+    started = perf_counter()
+    for _ in range(PUSHES // 10):
+        console.print(chart)
+    return (perf_counter() - started) / (PUSHES // 10) * 1_000_000
+
+
+def main() -> None:
+    table = Table(title=f"{WIDTH} cell charts")
+    for column in ("Chart", "Scale", "push µs", "rebuild µs", "redraw µs"):
+        table.add_column(column, justify="right")
+    for chart_type in (Sparkline, HeatBar):
+        for scale, kwargs in (("window min/max", {}), ("fixed 0-100", {"vmin": 0, "vmax": 100})):
+            chart = chart_type(width=WIDTH, **kwargs)
+            table.add_row(
+                chart_type.__name__,
+                scale,
+                f"{push_time(chart):.1f}",
+                f"{rebuild_time(chart_type, **kwargs):.1f}",
+                f"{redraw_time(chart):.1f}",
+            )
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Stress the gradient entry points from many threads and measure throughput.
+
+Every call is seeded, so each result must match the single threaded reference
+exactly; any cross-thread interference shows up as a mismatch. Nothing may be
+written to stdout while the threads run.
+
+    python -m benchmarks.bench_threads
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from io import StringIO
+from time import perf_counter
+
+from rich.console import Console
+from rich.table import Table
+
+from maxcolor.maxcolor import gradient, gradient_panel, not_gradient, rainbow
+
+CALLS = 2000
+THREADS = (1, 4, 16)
+MESSAGE = "Sunt sit est labore elit ut laboris est. Aute cupidatat sit officia deserunt sint."
+ENTRY_POINTS = {
+    "gradient": lambda seed: gradient(MESSAGE, seed=seed),
+    "rainbow": lambda seed: rainbow(MESSAGE, seed=seed),
+    "not_gradient": lambda seed: not_gradient(MESSAGE, seed=seed),
+    "gradient_panel": lambda seed: gradient_panel(MESSAGE, title="Title", width=60, seed=seed),
+}
+_local = threading.local()
+
+
+def render(renderable) -> str:
+    """Render with the calling thread's own console."""
+    console = getattr(_local, "console", None)
+    if console is None:
+        console = _local.console = Console(file=StringIO(), force_terminal=True, color_system="truecolor", width=80)
+    with console.capture() as capture:
+        console.print(renderable)
+    return capture.get()
+
+
+def run(name: str, threads: int) -> tuple[float, int]:
+    """Call an entry point `CALLS` times from `threads` threads.
+
+    Returns:
+        `tuple[float,int]`: The calls per second, and the number of results that differ from the reference.
+    """
+    call = ENTRY_POINTS[name]
+    reference = [render(call(seed)) for seed in range(16)]
+    stdout = StringIO()
+    with redirect_stdout(stdout), ThreadPoolExecutor(threads) as executor:
+        started = perf_counter()
+        results = list(executor.map(lambda index: (index % 16, render(call(index % 16))), range(CALLS)))
+        elapsed = perf_counter() - started
+    if stdout.getvalue():
+        raise RuntimeError(f"{name} wrote to stdout from worker threads.")
+    mismatches = sum(output != reference[seed] for seed, output in results)
+    return CALLS / elapsed, mismatches
+
+
+def main() -> None:
+    table = Table(title=f"Thread throughput ({CALLS} calls, seeded)")
+    table.add_column("Entry point")
+    for threads in THREADS:
+        table.add_column(f"{threads} threads (calls/s)", justify="right")
+    table.add_column("Mismatches", justify="right")
+    for name in ENTRY_POINTS:
+        row = [name]
+        mismatches = 0
+        for threads in THREADS:
+            rate, wrong = run(name, threads)
+            row.append(f"{rate:,.0f}")
+            mismatches += wrong
+        row.append(str(mismatches))
+        table.add_row(*row)
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
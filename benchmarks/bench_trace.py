@@ -0,0 +1,67 @@
+"""Measure the cost of tracing the color range helpers.
+
+    python -m benchmarks.bench_trace
+"""
+from time import perf_counter
+
+from rich.console import Console
+from rich.table import Table
+
+from maxcolor import trace
+from maxcolor.maxcolor import generate_color_range, random_color_range
+
+STOPS = 10_000
+RUNS = 1_000
+ROUNDS = 20
+
+
+def best_time(function) -> float:
+    """The best time of `ROUNDS` calls, in ms."""
+    best = float("inf")
+    for _ in range(ROUNDS):
+        started = perf_counter()
+        function()
+        best = min(best, perf_counter() - started)
+    return best * 1000
+
+
+def traced(function):
+    def run():
+        with trace.trace():
+            function()
+
+    return run
+
+
+def main() -> None:
+    def ranges():
+        random_color_range("hex", STOPS - 1, seed=0)
+
+    def generated():
+        for _ in range(RUNS):
+            generate_color_range("red", "blue")
+
+    cases = {
+        f"random_color_range, {STOPS:,} stops": ranges,
+        f"generate_color_range x {RUNS:,}": generated,
+    }
+    table = Table(title=f"Tracing overhead, best of {ROUNDS}")
+    for column in ("Call", "Untraced ms", "Traced ms", "Overhead µs", "Events"):
+        table.add_column(column, justify="right")
+    for name, function in cases.items():
+        untraced = best_time(function)
+        with_trace = best_time(traced(function))
+        with trace.trace() as events:
+            function()
+        table.add_row(
+            name,
+            f"{untraced:.3f}",
+            f"{with_trace:.3f}",
+            f"{(with_trace - untraced) * 1000:,.0f}",
+            f"{events.recorded:,}",
+        )
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
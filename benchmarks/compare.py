@@ -0,0 +1,203 @@
+"""Compare two benchmark results files and report regressions.
+
+    python -m benchmarks.compare benchmarks/baseline.json benchmark-results.json
+    python -m benchmarks.compare baseline.json results.json --threshold peak_bytes=0.2
+
+Tracked metrics, and the increase each may grow by before it is a regression:
+
+    build_per_char   build time per character            25%
+    render_per_char  render time per character           25%
+    call             time per call of a color helper     25%
+    import           time to import maxcolor.maxcolor    25%
+    spans_per_char   spans per character                 0%
+    peak_bytes       tracemalloc peak                    10%
+    retained_bytes   bytes held by the built renderable  10%
+
+Times are divided by the calibration time recorded with each file, so they
+compare across machines. A build and its spans are shared by every color
+system, so they are one metric per case, not one per color system. Memory
+changes under `MIN_PEAK_CHANGE` bytes are ignored as allocator noise.
+
+Only spans, memory and import time fail the check. The per-case times in
+`WARNING_METRICS` swing by more than their thresholds between two runs of the
+same tree on a shared machine, so their regressions are reported as warnings;
+pass `--strict-time` to fail on them on a quiet machine.
+
+This compares two finished files. `python -m benchmarks.run --compare` also
+times any failing `TIME_METRICS` again before reporting them.
+"""
+import argparse
+import json
+import sys
+from typing import NamedTuple, Optional
+
+from rich.console import Console
+from rich.table import Table
+
+THRESHOLDS = {
+    "build_per_char": 0.25,
+    "render_per_char": 0.25,
+    "call": 0.25,
+    "import": 0.25,
+    "spans_per_char": 0.0,
+    "peak_bytes": 0.10,
+    "retained_bytes": 0.10,
+}
+TIME_METRICS = ("build_per_char", "render_per_char", "call", "import")
+WARNING_METRICS = ("build_per_char", "render_per_char", "call")
+MIN_PEAK_CHANGE = 4096
+
+Key = tuple[str, Optional[int], Optional[str], str]
+
+
+class Regression(NamedTuple):
+    """A metric that grew by more than its threshold."""
+
+    name: str
+    size: Optional[int]
+    color_system: Optional[str]
+    metric: str
+    baseline: float
+    current: float
+    threshold: float
+
+    @property
+    def change(self) -> float:
+        return self.current / self.baseline - 1
+
+
+def parse_thresholds(overrides: list[str]) -> dict[str, float]:
+    """The default thresholds updated with `METRIC=RATIO` overrides."""
+    thresholds = dict(THRESHOLDS)
+    for override in overrides:
+        metric, _, ratio = override.partition("=")
+        if metric not in THRESHOLDS:
+            raise ValueError(f"Invalid metric: {metric}. Valid metrics are {', '.join(THRESHOLDS)}.")
+        try:
+            thresholds[metric] = float(ratio)
+        except ValueError:
+            raise ValueError(f"Invalid threshold: {override}. Expected METRIC=RATIO, e.g. {metric}=0.25.") from None
+    return thresholds
+
+
+def metrics(results: dict) -> dict[Key, float]:
+    """The tracked metrics of a results file, with times in units of its calibration."""
+    calibration = results["metadata"]["calibration_s"]
+    values: dict[Key, float] = {}
+    for result in results["results"]:
+        name, size, color_system = result["name"], result["size"], result["color_system"]
+        if size:
+            values[(name, size, None, "build_per_char")] = result["build_s"] / size / calibration
+            values[(name, size, color_system, "render_per_char")] = result["render_s"] / size / calibration
+            values[(name, size, None, "spans_per_char")] = result["spans"] / size
+        elif "call_s" in result:
+            values[(name, size, color_system, "call")] = result["call_s"] / calibration
+        values[(name, size, color_system, "peak_bytes")] = result["peak_bytes"]
+        if "retained_bytes" in result:
+            values[(name, size, color_system, "retained_bytes")] = result["retained_bytes"]
+    values[("maxcolor.maxcolor", None, None, "import")] = results["metadata"]["import_s"] / calibration
+    return values
+
+
+def compare(baseline: dict, current: dict, thresholds: Optional[dict[str, float]] = None) -> list[Regression]:
+    """The metrics of `current` that regressed from `baseline`.
+
+    Metrics measured in only one of the files are skipped.
+    """
+    thresholds = thresholds or THRESHOLDS
+    before, after = metrics(baseline), metrics(current)
+    regressions = []
+    for key, old in before.items():
+        new = after.get(key)
+        metric = key[3]
+        if new is None or old <= 0 or new <= old * (1 + thresholds[metric]) * (1 + 1e-9):
+            continue
+        if metric.endswith("_bytes") and new - old < MIN_PEAK_CHANGE:
+            continue
+        regressions.append(Regression(*key, baseline=old, current=new, threshold=thresholds[metric]))
+    return regressions
+
+
+def failures(regressions: list[Regression], strict_time: bool = False) -> list[Regression]:
+    """The regressions that fail the check: all of them with `strict_time`, else those not in `WARNING_METRICS`."""
+    return [regression for regression in regressions if strict_time or regression.metric not in WARNING_METRICS]
+
+
+def _table(regressions: list[Regression], title: str, style: str) -> Table:
+    table = Table(title=title, title_style=f"bold {style}")
+    table.add_column("Case")
+    for column in ("Metric", "Baseline", "Current", "Change", "Allowed"):
+        table.add_column(column, justify="right", no_wrap=True)
+    for regression in sorted(regressions, key=lambda regression: -regression.change):
+        case = regression.name
+        if regression.size is not None:
+            case += f" {regression.size:,} chars"
+        if regression.color_system is not None:
+            case += f", {regression.color_system}"
+        table.add_row(
+            case,
+            regression.metric,
+            f"{regression.baseline:.4g}",
+            f"{regression.current:.4g}",
+            f"[{style}]+{regression.change:.1%}[/]",
+            f"+{regression.threshold:.0%}",
+        )
+    return table
+
+
+def print_report(
+    regressions: list[Regression],
+    baseline: dict,
+    current: dict,
+    console: Optional[Console] = None,
+    strict_time: bool = False,
+) -> None:
+    console = console or Console()
+    compared = len(metrics(baseline).keys() & metrics(current).keys())
+    before, after = baseline["metadata"], current["metadata"]
+    console.print(
+        f"Baseline: maxcolor {before['maxcolor']}, Python {before['python']}, calibration {before['calibration_s'] * 1000:.1f} ms\n"
+        f"Current:  maxcolor {after['maxcolor']}, Python {after['python']}, calibration {after['calibration_s'] * 1000:.1f} ms"
+    )
+    failing = failures(regressions, strict_time)
+    warnings = [regression for regression in regressions if regression not in failing]
+    if warnings:
+        console.print(_table(warnings, f"{len(warnings)} timings slower (warnings only)", "yellow"))
+    if failing:
+        console.print(_table(failing, f"{len(failing)} of {compared} metrics regressed", "red"))
+    else:
+        console.print(f"[bold green]No regressions[/] in {compared} metrics.")
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.compare", description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", help="The baseline results file.")
+    parser.add_argument("current", help="The results file to check.")
+    parser.add_argument(
+        "--threshold",
+        action="append",
+        default=[],
+        metavar="METRIC=RATIO",
+        help="Override the allowed regression of a metric, e.g. build_per_char=0.5. May be repeated.",
+    )
+    parser.add_argument(
+        "--strict-time",
+        action="store_true",
+        help="Fail on slower build, render and call times too, instead of only warning. For quiet machines.",
+    )
+    args = parser.parse_args(argv)
+    try:
+        thresholds = parse_thresholds(args.threshold)
+    except ValueError as error:
+        parser.error(str(error))
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)
+    with open(args.current, encoding="utf-8") as file:
+        current = json.load(file)
+    regressions = compare(baseline, current, thresholds)
+    print_report(regressions, baseline, current, strict_time=args.strict_time)
+    return 1 if failures(regressions, args.strict_time) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
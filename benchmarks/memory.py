@@ -0,0 +1,172 @@
+"""Measure the memory of building and rendering gradients, grouped by source line.
+
+    python -m benchmarks.memory
+    python -m benchmarks.memory --sizes 1000,100000 --lines 10
+
+For each text entry point and message size this reports the peak bytes while
+building the renderable, the bytes the renderable retains afterwards (its
+`Span` and `Style` objects, strings, ...), and the peak while rendering it.
+The retained bytes are broken down by the source line that allocated them, so
+an optimization shows up as a line that shrinks or disappears.
+
+`benchmarks.run` records the same measurements in its JSON results.
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+from typing import Any, Callable, NamedTuple, Optional
+
+from rich.console import Console
+from rich.table import Table
+
+SIZES = (1_000, 100_000, 1_000_000)
+TOP_LINES = 8
+# Two frames, so allocations in generated code (namedtuple constructors) can be charged to their caller
+FRAMES = 2
+# Allocations of the profiler itself and of imports aren't part of any entry point
+IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+    tracemalloc.Filter(False, __file__),
+)
+
+
+class LineUsage(NamedTuple):
+    """The memory still held from allocations on one source line."""
+
+    line: str
+    bytes: int
+    count: int
+
+
+class MemoryProfile(NamedTuple):
+    """The memory of building and rendering one renderable."""
+
+    build_peak_bytes: int
+    retained_bytes: int
+    render_peak_bytes: int
+    lines: list[LineUsage]
+
+    @property
+    def peak_bytes(self) -> int:
+        return max(self.build_peak_bytes, self.render_peak_bytes)
+
+
+def _location(traceback: tracemalloc.Traceback) -> str:
+    # The most recent frame that has a source file
+    frame = next((frame for frame in reversed(traceback) if not frame.filename.startswith("<")), traceback[-1])
+    filename = frame.filename
+    marker = f"site-packages{os.sep}"
+    if marker in filename:
+        filename = filename.split(marker, 1)[1]
+    elif filename.startswith(os.getcwd()):
+        filename = os.path.relpath(filename)
+    return f"{filename}:{frame.lineno}"
+
+
+def profile(build: Callable[[], Any], render: Callable[[Any], Any], top: int = TOP_LINES) -> MemoryProfile:
+    """Trace the allocations of building a renderable and then rendering it.
+
+    Args:
+        build (`Callable[[], Any]`): Builds the renderable.
+        render (`Callable[[Any], Any]`): Renders it.
+        top (`int`): The number of source lines to report. Defaults to 8.
+
+    Returns:
+        `MemoryProfile`: The peaks, the retained bytes, and the lines retaining the most.
+    """
+    # A collection inside the traced window would move the peaks from run to run
+    gc.collect()
+    collecting = gc.isenabled()
+    gc.disable()
+    tracemalloc.start(FRAMES)
+    try:
+        before = tracemalloc.take_snapshot().filter_traces(IGNORED)
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        renderable = build()
+        current, peak = tracemalloc.get_traced_memory()
+        build_peak, retained = peak - baseline, current - baseline
+        after = tracemalloc.take_snapshot().filter_traces(IGNORED)
+        usage: dict[str, list[int]] = {}
+        for statistic in after.compare_to(before, "traceback"):
+            totals = usage.setdefault(_location(statistic.traceback), [0, 0])
+            totals[0] += statistic.size_diff
+            totals[1] += statistic.count_diff
+        lines = sorted(
+            (LineUsage(line, size, count) for line, (size, count) in usage.items() if size > 0),
+            key=lambda line: -line.bytes,
+        )[:top]
+        tracemalloc.reset_peak()
+        render(renderable)
+        render_peak = tracemalloc.get_traced_memory()[1] - baseline
+        return MemoryProfile(build_peak, retained, render_peak, lines)
+    finally:
+        tracemalloc.stop()
+        if collecting:
+            gc.enable()
+
+
+def print_profiles(profiles: list[tuple[str, int, MemoryProfile]], console: Optional[Console] = None) -> None:
+    """Print the totals of each profile, then the top lines of each entry point at its largest size."""
+    console = console or Console()
+    table = Table(title="Memory per entry point")
+    for column in ("Entry point", "Chars", "Build KiB", "Retained KiB", "Retained B/char", "Render KiB"):
+        table.add_column(column, justify="right", no_wrap=True)
+    for name, size, memory in profiles:
+        table.add_row(
+            name,
+            f"{size:,}",
+            f"{memory.build_peak_bytes / 1024:,.0f}",
+            f"{memory.retained_bytes / 1024:,.0f}",
+            f"{memory.retained_bytes / size:,.0f}",
+            f"{memory.render_peak_bytes / 1024:,.0f}",
+        )
+    console.print(table)
+
+    largest = {name: (size, memory) for name, size, memory in profiles}
+    for name, (size, memory) in largest.items():
+        table = Table(title=f"{name}, {size:,} chars: retained by source line")
+        table.add_column("Line")
+        for column in ("KiB", "Blocks", "Share"):
+            table.add_column(column, justify="right", no_wrap=True)
+        for usage in memory.lines:
+            if usage.bytes < 1024:
+                continue
+            share = usage.bytes / memory.retained_bytes if memory.retained_bytes else 0.0
+            table.add_row(usage.line, f"{usage.bytes / 1024:,.0f}", f"{usage.count:,}", f"{share:.0%}")
+        console.print(table)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    from benchmarks.run import message, render, text_entry_points
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.memory", description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=lambda value: tuple(int(size) for size in value.split(",")),
+        default=SIZES,
+        help="Comma separated message sizes in characters. Defaults to 1000,100000,1000000.",
+    )
+    parser.add_argument("--lines", type=int, default=TOP_LINES, help="The number of source lines to report.")
+    parser.add_argument("--color-system", default="truecolor", help="The console color system. Defaults to truecolor.")
+    args = parser.parse_args(argv)
+
+    profiles = []
+    for name, function in text_entry_points().items():
+        for size in args.sizes:
+            text = message(size)
+            memory = profile(
+                lambda: function(text), lambda renderable: render(renderable, args.color_system), args.lines
+            )
+            profiles.append((name, size, memory))
+    print_profiles(profiles)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
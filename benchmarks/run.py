@@ -0,0 +1,395 @@
+"""Benchmark every public entry point and write the results as JSON.
+
+    python -m benchmarks.run
+    python -m benchmarks.run --sizes 10,1000,100000 --output results.json
+    python -m benchmarks.run --compare benchmarks/baseline.json
+
+The text entry points (`gradient`, `not_gradient`, `rainbow`,
+`gradient_panel`) are measured at each message size: the time to build the
+renderable, the time to render it on a truecolor and a 256 color console, the
+memory of building and rendering it (see `benchmarks.memory`), and the number
+of spans. The color
+helpers are measured per call. Message sizes run from 10 to 10M characters by
+default; the largest take minutes and several GB of memory.
+
+`--compare` re-runs the suite at the sizes of a stored baseline and fails if
+spans, memory or import time regressed beyond their thresholds; slower build,
+render and call times are reported as warnings unless `--strict-time` is given
+(see `benchmarks.compare`). Times are divided by a calibration loop measured on
+the same machine, so a baseline recorded elsewhere still compares. Each time is
+the median of its repeats, and a failing time is measured again, up to
+`REMEASURE_ROUNDS` times, before it counts: a busy machine slows one
+measurement, a regression slows every one.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+from io import StringIO
+from time import perf_counter
+from typing import Any, Callable, Optional
+
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.memory import profile
+
+SIZES = (10, 1_000, 100_000, 1_000_000, 10_000_000)
+COLOR_SYSTEMS = ("truecolor", "256")
+WORDS = "Sunt sit est labore elit ut laboris est aute cupidatat sit officia deserunt sint adipisicing "
+LINE_WIDTH = 100
+MIN_TIME = 1.0
+MIN_REPEATS = 5
+REMEASURE_ROUNDS = 3
+HELPER_CALLS = 200
+CALIBRATION_ROUNDS = 20
+IMPORT_ROUNDS = 20
+
+
+def message(size: int) -> str:
+    """A lorem ipsum message of exactly `size` characters, in lines of `LINE_WIDTH`."""
+    line = (WORDS * (LINE_WIDTH // len(WORDS) + 1))[: LINE_WIDTH - 1] + "\n"
+    return (line * (size // LINE_WIDTH + 1))[:size]
+
+
+def median_time(function: Callable[[], Any]) -> tuple[float, Any]:
+    """The median time of one call over at least `MIN_REPEATS` calls and `MIN_TIME` seconds, and the last result."""
+    times: list[float] = []
+    total = 0.0
+    while total < MIN_TIME or len(times) < MIN_REPEATS:
+        started = perf_counter()
+        result = function()
+        elapsed = perf_counter() - started
+        times.append(elapsed)
+        total += elapsed
+    return statistics.median(times), result
+
+
+def peak_bytes(function: Callable[[], Any]) -> int:
+    """The peak memory allocated while calling a function once."""
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def count_spans(renderable: Any) -> int:
+    """The number of spans of a Text, or of the title and Text body of a Panel."""
+    spans = len(getattr(renderable, "spans", ()))
+    for part in ("renderable", "title"):
+        spans += len(getattr(getattr(renderable, part, None), "spans", ()))
+    return spans
+
+
+def render(renderable: Any, color_system: str) -> int:
+    """Render to a console of a color system and return the size of the output."""
+    file = StringIO()
+    Console(file=file, force_terminal=True, color_system=color_system, width=LINE_WIDTH + 4).print(renderable)
+    return len(file.getvalue())
+
+
+# ============================================================================ #
+#     Entry Points
+
+
+def text_entry_points() -> dict[str, Callable[[str], Any]]:
+    """The entry points that color a message, seeded for reproducible spans."""
+    from maxcolor.maxcolor import gradient, gradient_panel, not_gradient, rainbow
+
+    return {
+        "gradient": lambda text: gradient(text, seed=0),
+        "not_gradient": lambda text: not_gradient(text, seed=0),
+        "rainbow": lambda text: rainbow(text, seed=0),
+        "gradient_panel": lambda text: gradient_panel(text, title="Benchmark", seed=0),
+    }
+
+
+def helper_entry_points() -> dict[str, Callable[[], Any]]:
+    """The color helpers, each measured per call."""
+    from maxcolor.maxcolor import _hex_colors, color_range_generator, hex_to_rgb, random_color_range, rgb_to_hex
+
+    # Importing `maxcolor.index` opens a log file under ./logs, so keep it out of the working tree
+    working_directory = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            from maxcolor.index import ColorIndex
+        finally:
+            os.chdir(working_directory)
+
+    colors = _hex_colors()
+    return {
+        "hex_to_rgb": lambda: hex_to_rgb("#249df1"),
+        "rgb_to_hex": lambda: rgb_to_hex((36, 157, 241)),
+        "ColorIndex": lambda: ColorIndex(start=2, end=7),
+        "random_color_range": lambda: random_color_range(seed=0),
+        "color_range_generator": lambda: list(color_range_generator(colors, 2, 7)),
+    }
+
+
+def time_call(function: Callable[[], Any]) -> float:
+    """The median time of one call of a color helper, timed in batches of `HELPER_CALLS`."""
+
+    def batch() -> None:
+        for _ in range(HELPER_CALLS):
+            function()
+
+    call, _ = median_time(batch)
+    return call / HELPER_CALLS
+
+
+def run_suite(sizes: tuple[int, ...] = SIZES, color_systems: tuple[str, ...] = COLOR_SYSTEMS) -> list[dict]:
+    """Measure every entry point.
+
+    Returns:
+        `list[dict]`: One result per entry point, message size and color system.
+    """
+    results = []
+    for name, function in text_entry_points().items():
+        for size in sizes:
+            text = message(size)
+            build, renderable = median_time(lambda: function(text))
+            spans = count_spans(renderable)
+            for color_system in color_systems:
+                render_time, output = median_time(lambda: render(renderable, color_system))
+                memory = profile(lambda: function(text), lambda renderable: render(renderable, color_system))
+                results.append(
+                    {
+                        "name": name,
+                        "size": size,
+                        "color_system": color_system,
+                        "build_s": build,
+                        "render_s": render_time,
+                        "peak_bytes": memory.peak_bytes,
+                        "build_peak_bytes": memory.build_peak_bytes,
+                        "retained_bytes": memory.retained_bytes,
+                        "render_peak_bytes": memory.render_peak_bytes,
+                        "retained_by_line": [usage._asdict() for usage in memory.lines],
+                        "spans": spans,
+                        "output_bytes": output,
+                    }
+                )
+    for name, function in helper_entry_points().items():
+        results.append(
+            {
+                "name": name,
+                "size": None,
+                "color_system": None,
+                "call_s": time_call(function),
+                "peak_bytes": peak_bytes(function),
+            }
+        )
+    return results
+
+
+def remeasure(results: dict, regressions: list) -> None:
+    """Time the cases of regressed time metrics again, keeping the faster of the old and new time.
+
+    Args:
+        results (`dict`): The results file being compared, updated in place.
+        regressions (`list[Regression]`): The regressions of `benchmarks.compare.compare()`.
+    """
+    text_functions = text_entry_points()
+    helper_functions = helper_entry_points()
+    for regression in regressions:
+        name, size, color_system, metric = regression[:4]
+        if metric == "import":
+            results["metadata"]["import_s"] = min(results["metadata"]["import_s"], import_time())
+            continue
+        # A build is shared by every color system, so update all of them
+        cases = [
+            result
+            for result in results["results"]
+            if result["name"] == name
+            and result["size"] == size
+            and (metric != "render_per_char" or result["color_system"] == color_system)
+        ]
+        if metric == "build_per_char":
+            text = message(size)
+            field, measured = "build_s", median_time(lambda: text_functions[name](text))[0]
+        elif metric == "render_per_char":
+            text = message(size)
+            renderable = text_functions[name](text)
+            field, measured = "render_s", median_time(lambda: render(renderable, color_system))[0]
+        elif metric == "call":
+            field, measured = "call_s", time_call(helper_functions[name])
+        else:
+            continue
+        for result in cases:
+            result[field] = min(result[field], measured)
+
+
+def _calibration_work() -> int:
+    # Formatting, slicing and list building, like the work of a gradient
+    parts = []
+    for number in range(100_000):
+        parts.append(f"#{number & 0xFFFFFF:06x}"[1:4])
+    return len("".join(parts))
+
+
+def calibrate() -> float:
+    """The best time of a fixed pure Python workload, in seconds. Times are divided by this to compare machines."""
+    best = float("inf")
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(CALIBRATION_ROUNDS):
+            started = perf_counter()
+            _calibration_work()
+            best = min(best, perf_counter() - started)
+    finally:
+        if collecting:
+            gc.enable()
+    return best
+
+
+def import_time(module: str = "maxcolor.maxcolor") -> float:
+    """The best time to import a module in a fresh interpreter, in seconds.
+
+    The import is timed inside the interpreter, so neither process start-up nor
+    Python's own start-up is counted. Bytecode is written and warmed up first,
+    so a stale or disabled `__pycache__` (`PYTHONDONTWRITEBYTECODE`) measures
+    the import rather than compiling the source.
+    """
+    code = f"from time import perf_counter; started = perf_counter(); import {module}; print(perf_counter() - started)"
+    environment = {key: value for key, value in os.environ.items() if key != "PYTHONDONTWRITEBYTECODE"}
+
+    def run() -> float:
+        output = subprocess.run(
+            [sys.executable, "-c", code], check=True, capture_output=True, text=True, env=environment
+        ).stdout
+        return float(output.split()[-1])
+
+    run()
+    return min(run() for _ in range(IMPORT_ROUNDS))
+
+
+def metadata(calibration_s: float) -> dict:
+    """The environment the suite ran in, with its calibration and import time."""
+    from maxcolor.maxcolor import __version__
+
+    return {
+        "maxcolor": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "calibration_s": calibration_s,
+        "import_s": import_time(),
+    }
+
+
+def print_results(results: list[dict], console: Optional[Console] = None) -> None:
+    console = console or Console()
+    table = Table(title="Text entry points")
+    for column in ("Entry point", "Chars", "Colors", "Build ms", "Render ms", "Peak KiB", "Retained KiB", "Spans"):
+        table.add_column(column, justify="right", no_wrap=True)
+    for result in results:
+        if result["size"] is not None:
+            table.add_row(
+                result["name"],
+                f"{result['size']:,}",
+                result["color_system"],
+                f"{result['build_s'] * 1000:.3f}",
+                f"{result['render_s'] * 1000:.3f}",
+                f"{result['peak_bytes'] / 1024:,.0f}",
+                f"{result['retained_bytes'] / 1024:,.0f}",
+                f"{result['spans']:,}",
+            )
+    console.print(table)
+    table = Table(title="Color helpers")
+    for column in ("Entry point", "µs / call", "Peak bytes"):
+        table.add_column(column, justify="right")
+    for result in results:
+        if result["size"] is None:
+            table.add_row(result["name"], f"{result['call_s'] * 1_000_000:.2f}", f"{result['peak_bytes']:,}")
+    console.print(table)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=lambda value: tuple(int(size) for size in value.split(",")),
+        default=SIZES,
+        help="Comma separated message sizes in characters. Defaults to 10 through 10M.",
+    )
+    parser.add_argument(
+        "--color-systems",
+        type=lambda value: tuple(value.split(",")),
+        default=COLOR_SYSTEMS,
+        help="Comma separated console color systems. Defaults to truecolor,256.",
+    )
+    parser.add_argument("-o", "--output", default="benchmark-results.json", help="The JSON results file.")
+    parser.add_argument(
+        "--compare",
+        metavar="BASELINE",
+        help="Compare with a baseline results file, at its sizes and color systems, and exit 1 on a regression.",
+    )
+    parser.add_argument(
+        "--threshold",
+        action="append",
+        default=[],
+        metavar="METRIC=RATIO",
+        help="Override the allowed regression of a metric, e.g. build_per_char=0.5. May be repeated.",
+    )
+    parser.add_argument(
+        "--strict-time",
+        action="store_true",
+        help="Fail on slower build, render and call times too, instead of only warning. For quiet machines.",
+    )
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    from benchmarks.compare import TIME_METRICS, compare, failures, parse_thresholds, print_report
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        thresholds = parse_thresholds(args.threshold)
+    except ValueError as error:
+        parser.error(str(error))
+    baseline = None
+    sizes, color_systems = args.sizes, args.color_systems
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+        # Re-run only what the baseline measured, so every result has a counterpart
+        cases = [result for result in baseline["results"] if result["size"] is not None]
+        sizes = tuple(sorted({result["size"] for result in cases}))
+        color_systems = tuple(dict.fromkeys(result["color_system"] for result in cases))
+
+    # Calibrate before and after the suite, so a machine that was briefly busy doesn't skew every time
+    calibration = calibrate()
+    measured = run_suite(sizes, color_systems)
+    results = {"metadata": metadata(min(calibration, calibrate())), "results": measured}
+    regressions = compare(baseline, results, thresholds) if baseline else []
+    for _ in range(REMEASURE_ROUNDS):
+        failing = failures(regressions, args.strict_time)
+        timed = [regression for regression in failing if regression.metric in TIME_METRICS]
+        if not timed:
+            break
+        print(f"Timing {len(timed)} slower metrics again", file=sys.stderr)
+        remeasure(results, timed)
+        regressions = compare(baseline, results, thresholds)
+    print_results(results["results"])
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2)
+    print(f"Wrote {len(results['results'])} results to {args.output}", file=sys.stderr)
+    if baseline is None:
+        return 0
+    print_report(regressions, baseline, results, strict_time=args.strict_time)
+    return 1 if failures(regressions, args.strict_time) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+"""Gradient text, panels and colors for rich.
+
+The gradient functions are imported on first use, so importing `maxcolor` (or
+one of its lightweight modules such as `maxcolor.kernel`) doesn't load rich.
+"""
+from maxcolor.profiling import profile
+
+# Public name -> the module that defines it
+_EXPORTS = {
+    "gradient": "maxcolor.maxcolor",
+    "not_gradient": "maxcolor.maxcolor",
+    "rainbow": "maxcolor.maxcolor",
+    "gradient_panel": "maxcolor.maxcolor",
+    "hex_to_rgb": "maxcolor.maxcolor",
+    "rgb_to_hex": "maxcolor.maxcolor",
+    "random_color_range": "maxcolor.maxcolor",
+    "color_range_generator": "maxcolor.maxcolor",
+    "generate_color_range": "maxcolor.maxcolor",
+    "content_seed": "maxcolor.maxcolor",
+    "get_console": "maxcolor.maxcolor",
+    "__version__": "maxcolor.maxcolor",
+    "GradientSpec": "maxcolor.spec",
+    "Palette": "maxcolor.palette",
+    "load_palette": "maxcolor.palette_file",
+}
+
+__all__ = ["profile", *_EXPORTS]
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,3 @@
+from maxcolor.cli import main
+
+raise SystemExit(main())
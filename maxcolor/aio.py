@@ -0,0 +1,72 @@
+"""asyncio support: color async line sources without blocking the event loop.
+
+`agradient()` is an async generator. It only pulls the next line from its
+source when the consumer asks for the next colored line, so a slow consumer
+applies backpressure all the way to the source.
+"""
+import asyncio
+from concurrent.futures import Executor
+from typing import AsyncIterable, AsyncIterator, Optional
+
+from maxcolor.spec import GradientSpec
+
+DEFAULT_CHUNK = 2048
+DEFAULT_EXECUTOR_THRESHOLD = 1 << 18
+
+
+async def acolorize(
+    line: str,
+    spec: GradientSpec,
+    chunk: int = DEFAULT_CHUNK,
+    executor_threshold: Optional[int] = DEFAULT_EXECUTOR_THRESHOLD,
+    executor: Optional[Executor] = None,
+) -> str:
+    """Color one message cooperatively.
+
+    Args:
+        line (`str`): The message to color.
+        spec (`GradientSpec`): The compiled gradient.
+        chunk (`int`): The number of spans colored between yields to the event loop. Defaults to 2048.
+        executor_threshold (`Optional[int]`): Messages of at least this many characters are colored in `executor` instead. None disables the executor. Defaults to 256 KiB.
+        executor (`Optional[Executor]`): The executor for large messages. Defaults to the loop's default executor.
+
+    Returns:
+        `str`: The colored message as an ANSI string.
+    """
+    if executor_threshold is not None and len(line) >= executor_threshold:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, spec.render, line)
+
+    pieces = []
+    for piece in spec.iter_render(line, chunk):
+        pieces.append(piece)
+        # Give other tasks a turn between pieces
+        await asyncio.sleep(0)
+    return "".join(pieces)
+
+
+async def agradient(
+    lines: AsyncIterable[str],
+    spec: Optional[GradientSpec] = None,
+    chunk: int = DEFAULT_CHUNK,
+    executor_threshold: Optional[int] = DEFAULT_EXECUTOR_THRESHOLD,
+    executor: Optional[Executor] = None,
+) -> AsyncIterator[str]:
+    """Color every line of an async source.
+
+    Lines are pulled from `lines` one at a time, only after the previous colored
+    line has been consumed.
+
+    Args:
+        lines (`AsyncIterable[str]`): The source of lines.
+        spec (`Optional[GradientSpec]`): The compiled gradient. Defaults to a rainbow `GradientSpec()`.
+        chunk (`int`): See `acolorize()`. Defaults to 2048.
+        executor_threshold (`Optional[int]`): See `acolorize()`. Defaults to 256 KiB.
+        executor (`Optional[Executor]`): See `acolorize()`. Defaults to the loop's default executor.
+
+    Yields:
+        `str`: The colored lines as ANSI strings.
+    """
+    spec = spec or GradientSpec()
+    async for line in lines:
+        yield await acolorize(line, spec, chunk, executor_threshold, executor)
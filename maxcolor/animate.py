@@ -0,0 +1,240 @@
+"""Animated gradients that shift through a precomputed ring of colors.
+
+One cycle of the animation is compiled once into a double-length color table:
+the colors of a frame at phase `p` are the contiguous window
+`table[period - p : 2 * period - p]`, so no frame ever interpolates a color or
+wraps an index. Frames are cached as they are first drawn, and time is
+quantized to the frame rate cap, so a frame is only rebuilt when its phase
+actually changes.
+
+`AnimatedGradient` is a rich renderable for `rich.live.Live`; `play()` draws it
+straight to a terminal, re-emitting only the cells whose color changed.
+"""
+import sys
+import time
+from typing import IO, Iterator, Optional, Sequence
+
+from maxcolor.encoder import RESET, ColorSystemName, cap_precision, color_params
+from maxcolor.kernel import RGB, SPECTRUM, interpolate, parse_color
+
+HIDE_CURSOR = "\x1b[?25l"
+SHOW_CURSOR = "\x1b[?25h"
+SAVE_CURSOR = "\x1b7"
+RESTORE_CURSOR = "\x1b8"
+# Unchanged cells shorter than this between two changes are redrawn rather than skipped with a cursor move
+DIFF_GAP = 6
+
+
+class AnimatedGradient:
+    """A shifting gradient over a block of text."""
+
+    text: str
+    stops: tuple[RGB, ...]
+    period: int
+    speed: float
+    fps: float
+    color_system: ColorSystemName
+    precision: int
+
+    def __init__(
+        self,
+        text: str,
+        stops: Optional[Sequence[RGB | str]] = None,
+        period: Optional[int] = None,
+        speed: float = 0.5,
+        fps: float = 20,
+        color_system: ColorSystemName = "truecolor",
+        precision: int = 8,
+    ):
+        """Compile the color table of an animation.
+
+        Args:
+            text (`str`): The text to animate. May span several lines.
+            stops (`Optional[Sequence[tuple[int,int,int]|str]]`): The color stops of one cycle. Defaults to the full spectrum (a rainbow).
+            period (`Optional[int]`): The number of columns in one cycle of the gradient. Defaults to the width of the text.
+            speed (`float`): Cycles per second. Defaults to 0.5.
+            fps (`float`): The frame rate cap. Time is quantized to frames, so no more than `fps` distinct frames are drawn per second. Defaults to 20.
+            color_system (`str`): `truecolor`, `256`, or `standard`, for `play()`. Defaults to `truecolor`.
+            precision (`int`): Bits per color channel (1-8). Defaults to 8.
+        """
+        if fps <= 0:
+            raise ValueError(f"Invalid fps: {fps}. Must be greater than zero.")
+        if not 1 <= precision <= 8:
+            raise ValueError(f"Invalid precision: {precision}. Must be between 1 and 8 bits.")
+        if stops is not None and not len(stops):
+            raise ValueError("Invalid stops: an animation needs at least one color stop.")
+        self.text = text
+        self.lines = text.split("\n")
+        self.width = max((len(line) for line in self.lines), default=0)
+        self.stops = tuple(SPECTRUM.values()) if stops is None else tuple(parse_color(stop) for stop in stops)
+        self.period = max(1, period or self.width)
+        self.speed = speed
+        self.fps = fps
+        self.color_system = color_system
+        self.precision = precision
+        self.start = time.monotonic()
+
+        # One cycle returns to the first stop, so the ring wraps seamlessly
+        ring = list(self.stops) + [self.stops[0]]
+        colors = [cap_precision(rgb, precision) for rgb in interpolate(ring, self.period + 1)[: self.period]]
+        self.colors = colors * 2
+        self.params = [color_params(rgb, color_system) for rgb in colors] * 2
+        self._frames: dict[int, list] = {}
+        self._styles: Optional[list] = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self.text)} chars, period={self.period}, speed={self.speed}, fps={self.fps})"
+
+    def phase(self, now: Optional[float] = None) -> int:
+        """The phase (0 to `period - 1`) of the frame at a time, quantized to the frame rate cap."""
+        frame = int(((time.monotonic() if now is None else now) - self.start) * self.fps)
+        return int(frame * self.speed * self.period / self.fps) % self.period
+
+    def window(self, phase: int) -> list[str]:
+        """The SGR parameters of every column at a phase."""
+        period = self.period
+        window = self.params[period - phase : 2 * period - phase]
+        if self.width <= period:
+            return window
+        return [window[column % period] for column in range(self.width)]
+
+    # ============================================================================ #
+    #     rich
+
+    def _rich_styles(self) -> list:
+        if self._styles is None:
+            from rich.color import Color
+            from rich.style import Style
+
+            self._styles = [Style(color=Color.from_rgb(*rgb)) for rgb in self.colors]
+        return self._styles
+
+    def frame(self, phase: int) -> list:
+        """The rich Segments of the frame at a phase, built once per phase."""
+        segments = self._frames.get(phase)
+        if segments is None:
+            from rich.segment import Segment
+
+            period = self.period
+            styles = self._rich_styles()[period - phase : 2 * period - phase]
+            segments = []
+            for number, line in enumerate(self.lines):
+                if number:
+                    segments.append(Segment.line())
+                run_start = 0
+                for column in range(1, len(line) + 1):
+                    # Coalesce neighbouring columns that share a style
+                    if column == len(line) or styles[column % period] is not styles[run_start % period]:
+                        segments.append(Segment(line[run_start:column], styles[run_start % period]))
+                        run_start = column
+            self._frames[phase] = segments
+        return segments
+
+    def __rich_console__(self, console, options) -> Iterator:
+        # Without a live terminal there's nothing to animate, so draw the first frame
+        yield from self.frame(self.phase() if console.is_terminal else 0)
+
+    def __rich_measure__(self, console, options):
+        from rich.measure import Measurement
+
+        return Measurement(self.width, self.width)
+
+    # ============================================================================ #
+    #     Terminal
+
+    def render(self, phase: int) -> str:
+        """The full frame at a phase as an ANSI string."""
+        window = self.window(phase)
+        output = []
+        for number, line in enumerate(self.lines):
+            if number:
+                output.append("\n")
+            current = None
+            for column, character in enumerate(line):
+                params = window[column]
+                if params != current and not character.isspace():
+                    output.append(f"\x1b[{params}m")
+                    current = params
+                output.append(character)
+        output.append(RESET)
+        return "".join(output)
+
+    def render_diff(self, previous: int, phase: int) -> str:
+        """Redraw only the cells whose color differs between two phases.
+
+        The cursor must be saved (`ESC 7`) at the first column of the first line of
+        the block. When so much changed that a diff would be larger than the
+        frame, the whole frame is redrawn instead.
+        """
+        old, new = self.window(previous), self.window(phase)
+        output = []
+        for number, line in enumerate(self.lines):
+            changed = [
+                column for column in range(len(line))
+                if old[column] != new[column] and not line[column].isspace()
+            ]
+            index = 0
+            while index < len(changed):
+                # Merge changes separated by short gaps into one run, drawn after a single cursor move
+                first = last = changed[index]
+                index += 1
+                while index < len(changed) and changed[index] - last <= DIFF_GAP:
+                    last = changed[index]
+                    index += 1
+                output.append(RESTORE_CURSOR)
+                if number:
+                    output.append(f"\x1b[{number}B")
+                if first:
+                    output.append(f"\x1b[{first}C")
+                current = None
+                for column in range(first, last + 1):
+                    if new[column] != current and not line[column].isspace():
+                        output.append(f"\x1b[{new[column]}m")
+                        current = new[column]
+                    output.append(line[column])
+        if not output:
+            return ""
+        output.append(RESET)
+        diff = "".join(output)
+        # Carriage returns too, in case the terminal doesn't translate newlines
+        full = RESTORE_CURSOR + self.render(phase).replace("\n", "\r\n")
+        return full if len(full) < len(diff) else diff
+
+    def play(self, file: Optional[IO[str]] = None, duration: Optional[float] = None) -> None:
+        """Animate the text in place on a terminal until `duration` seconds pass or Ctrl+C.
+
+        Nothing is written between frames whose phase doesn't change, and a file
+        that isn't a terminal gets a single static frame.
+
+        Args:
+            file (`Optional[IO[str]]`): The output. Defaults to `sys.stdout`.
+            duration (`Optional[float]`): Seconds to animate for. Defaults to None (until interrupted).
+        """
+        file = file or sys.stdout
+        if not file.isatty():
+            file.write(self.render(0) + "\n")
+            return
+        rows = len(self.lines)
+        # Print the block first, so any scrolling happens before the cursor is saved
+        file.write(HIDE_CURSOR + self.render(self.phase()) + "\n")
+        file.write(f"\x1b[{rows}A\r{SAVE_CURSOR}")
+        file.flush()
+        previous = self.phase()
+        interval = 1 / self.fps
+        ends = None if duration is None else time.monotonic() + duration
+        try:
+            while ends is None or time.monotonic() < ends:
+                time.sleep(interval - (time.monotonic() - self.start) % interval)
+                phase = self.phase()
+                if phase == previous:
+                    continue
+                diff = self.render_diff(previous, phase)
+                if diff:
+                    file.write(diff)
+                    file.flush()
+                previous = phase
+        except KeyboardInterrupt:
+            pass
+        finally:
+            file.write(f"{RESTORE_CURSOR}\x1b[{rows}B\r{RESET}{SHOW_CURSOR}")
+            file.flush()
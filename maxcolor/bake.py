@@ -0,0 +1,144 @@
+"""Bake gradient constants into a Python module at build time.
+
+Applications that print the same colored strings every run can import them
+precomputed instead of computing gradients at startup:
+
+    python -m maxcolor.bake constants.json -o myapp/colors.py
+
+The JSON file names each constant and its text, with optional spec settings
+shared in `defaults` or set per constant:
+
+    {
+        "defaults": {"stops": ["magenta", "cyan"], "granularity": "char"},
+        "constants": {
+            "TITLE": "My Application",
+            "WARNING": {"text": "Warning", "stops": ["yellow", "red"]}
+        }
+    }
+
+Every constant `NAME` becomes `NAME` (an ANSI string) and `NAME_MARKUP` (rich
+markup). Neighbouring characters with the same color, and whitespace, are
+coalesced into a single run.
+"""
+import argparse
+import json
+from pathlib import Path
+from typing import Mapping, Optional, Sequence
+
+from maxcolor.encoder import cap_precision
+from maxcolor.spec import GradientSpec
+
+SPEC_SETTINGS = ("stops", "granularity", "max_spans", "color_system", "precision")
+HEADER = '''"""Gradient constants generated by `python -m maxcolor.bake`{source}.
+
+Do not edit by hand; regenerate this module instead.
+"""
+'''
+
+
+def markup_runs(text: str, spec: GradientSpec) -> list[tuple[str, Optional[str]]]:
+    """Split a text into runs of a single color.
+
+    Args:
+        text (`str`): The text to color.
+        spec (`GradientSpec`): The compiled gradient.
+
+    Returns:
+        `list[tuple[str,Optional[str]]]`: The `(text, hex_color)` of every run. Uncolored runs have no color.
+    """
+    runs: list[list] = []
+    position = 0
+    for start, end, rgb in spec.spans(text):
+        if start > position:
+            runs.append([text[position:start], None])
+        red, green, blue = cap_precision(rgb, spec.precision)
+        runs.append([text[start:end], f"#{red:02x}{green:02x}{blue:02x}"])
+        position = end
+    if position < len(text):
+        runs.append([text[position:], None])
+
+    coalesced: list[list] = []
+    for run in runs:
+        if coalesced:
+            previous = coalesced[-1]
+            # Whitespace shows no foreground color, so it joins the run before it
+            if run[1] == previous[1] or (run[0].isspace() and previous[1] is not None):
+                previous[0] += run[0]
+                continue
+        coalesced.append(run)
+    return [(part, color) for part, color in coalesced]
+
+
+def to_markup(text: str, spec: GradientSpec) -> str:
+    """The rich markup of a gradient, with one tag per run."""
+    from rich.markup import escape
+
+    return "".join(
+        f"[{color}]{escape(part)}[/{color}]" if color else escape(part)
+        for part, color in markup_runs(text, spec)
+    )
+
+
+def bake(constants: Mapping[str, tuple[str, GradientSpec]], source: Optional[str] = None) -> str:
+    """Generate the source of a module of gradient constants.
+
+    Args:
+        constants (`Mapping[str, tuple[str, GradientSpec]]`): The text and spec of every constant, by name.
+        source (`Optional[str]`): The file the constants were read from, noted in the module docstring. Defaults to None.
+
+    Returns:
+        `str`: The Python source.
+    """
+    lines = [HEADER.format(source=f" from {source}" if source else "")]
+    names = []
+    for name, (text, spec) in constants.items():
+        if not name.isidentifier():
+            raise ValueError(f"Invalid constant name: {name}. Must be a valid Python identifier.")
+        lines.append(f"# {spec!r}")
+        lines.append(f"{name} = {spec.render(text)!r}")
+        lines.append(f"{name}_MARKUP = {to_markup(text, spec)!r}")
+        lines.append("")
+        names.extend((name, f"{name}_MARKUP"))
+    lines.append(f"__all__ = {names!r}")
+    return "\n".join(lines) + "\n"
+
+
+def load_constants(path: str | Path) -> dict[str, tuple[str, GradientSpec]]:
+    """Read the constants of a JSON file.
+
+    Returns:
+        `dict[str, tuple[str, GradientSpec]]`: The text and spec of every constant, by name.
+    """
+    config = json.loads(Path(path).read_text(encoding="utf-8"))
+    defaults = config.get("defaults", {})
+    constants = {}
+    for name, value in config["constants"].items():
+        if isinstance(value, str):
+            value = {"text": value}
+        settings = {**defaults, **value}
+        unknown = set(settings) - set(SPEC_SETTINGS) - {"text"}
+        if unknown:
+            raise ValueError(f"Invalid settings for {name}: {', '.join(sorted(unknown))}.")
+        spec = GradientSpec(**{key: settings[key] for key in SPEC_SETTINGS if key in settings})
+        constants[name] = (settings["text"], spec)
+    return constants
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m maxcolor.bake", description="Bake gradient constants into a Python module.")
+    parser.add_argument("constants", help="The JSON file of constants.")
+    parser.add_argument("-o", "--output", help="The module to write. Defaults to stdout.")
+    args = parser.parse_args(argv)
+    try:
+        source = bake(load_constants(args.constants), Path(args.constants).name)
+    except (OSError, KeyError, ValueError) as error:
+        parser.error(str(error))
+    if args.output:
+        Path(args.output).write_text(source, encoding="utf-8")
+    else:
+        print(source, end="")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,293 @@
+"""Persistent cache of rendered gradient output.
+
+Rendered ANSI strings are stored in a single file under the XDG cache
+directory. The file starts with a sorted index of fixed-size records, followed
+by the output blobs:
+
+    header  magic `MXC1`, entry count (u32)
+    index   key (16 bytes), offset (u64), length (u32), stamp (u64) - sorted by key
+    blobs   the UTF-8 encoded output of every entry
+
+Reads memory-map the file and binary search the index, so a warm start reads
+only the pages it needs. Writes rebuild the file in a temporary file and move it
+into place with `os.replace()`, so readers never see a partial file. Writers
+hold an exclusive `flock` on a lock file next to the cache across the read,
+merge and replace, so concurrent processes don't drop each other's entries.
+When the blobs outgrow `max_bytes`, the least recently written entries are
+evicted.
+"""
+import mmap
+import os
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from hashlib import blake2b
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+from maxcolor.spec import GradientSpec
+
+MAGIC = b"MXC1"
+HEADER = struct.Struct("<4sI")
+RECORD = struct.Struct("<16sQIQ")
+KEY_SIZE = 16
+DEFAULT_MAX_BYTES = 8 << 20
+CACHE_FILE = "render-cache.bin"
+
+
+def default_cache_dir() -> Path:
+    """The maxcolor cache directory, `$XDG_CACHE_HOME/maxcolor` or `~/.cache/maxcolor`."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "maxcolor"
+
+
+def cache_key(text: str, spec_key: tuple, width: Optional[int] = None, color_system: Optional[str] = None) -> bytes:
+    """The 16 byte key of a rendered output.
+
+    Args:
+        text (`str`): The plain text that was rendered.
+        spec_key (`tuple`): Everything else that decides the output, e.g. `GradientSpec.key`.
+        width (`Optional[int]`): The width the output was rendered at. Defaults to None.
+        color_system (`Optional[str]`): The color system of the output. Defaults to None.
+
+    Returns:
+        `bytes`: The BLAKE2b digest of the key.
+    """
+    digest = blake2b(text.encode("utf-8"), digest_size=KEY_SIZE)
+    digest.update(b"\0" + repr((spec_key, width, color_system)).encode("utf-8"))
+    return digest.digest()
+
+
+@contextmanager
+def _locked(path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on a lock file, serializing writers across processes. Without `fcntl` (Windows), only threads are serialized."""
+    try:
+        import fcntl
+    except ImportError:
+        yield
+        return
+    with open(path, "ab") as file:
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)  # Released when the file is closed
+        yield
+
+
+class DiskCache:
+    """A size-capped, memory-mapped store of rendered output."""
+
+    path: Path
+    max_bytes: int
+    hits: int
+    misses: int
+
+    def __init__(self, path: Optional[str | Path] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Open a cache file. The file is created on the first write.
+
+        Args:
+            path (`Optional[str|Path]`): The cache file. Defaults to `render-cache.bin` in `default_cache_dir()`.
+            max_bytes (`int`): The maximum total size of the stored output. Defaults to 8 MiB.
+        """
+        self.path = Path(path) if path is not None else default_cache_dir() / CACHE_FILE
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._map: Optional[mmap.mmap] = None
+        self._count = 0
+        self._stat: Optional[tuple] = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self.path)!r}, entries={len(self)}, hits={self.hits}, misses={self.misses})"
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._open()
+            return self._count
+
+    def _open(self) -> None:
+        """Map the cache file, remapping it if it was replaced since it was last mapped."""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            self._close()
+            return
+        key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if key == self._stat:
+            return
+        self._close()
+        self._stat = key
+        if stat.st_size < HEADER.size:
+            return
+        with open(self.path, "rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count = HEADER.unpack_from(mapped)
+        if magic != MAGIC or HEADER.size + count * RECORD.size > len(mapped):
+            mapped.close()
+            return
+        self._map = mapped
+        self._count = count
+
+    def _close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+        self._map = None
+        self._count = 0
+        self._stat = None
+
+    def close(self) -> None:
+        """Unmap the cache file."""
+        with self._lock:
+            self._close()
+
+    def _find(self, key: bytes) -> Optional[bytes]:
+        """Binary search the index of the mapped file."""
+        mapped = self._map
+        if mapped is None:
+            return None
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            position = HEADER.size + middle * RECORD.size
+            found = mapped[position : position + KEY_SIZE]
+            if found < key:
+                low = middle + 1
+            elif found > key:
+                high = middle
+            else:
+                _, offset, length, _ = RECORD.unpack_from(mapped, position)
+                return mapped[offset : offset + length]
+        return None
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        """The stored output of a key, or None."""
+        with self._lock:
+            self._open()
+            value = self._find(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def _entries(self) -> dict[bytes, tuple[int, bytes]]:
+        """Every entry of the mapped file as `{key: (stamp, value)}`."""
+        entries = {}
+        mapped = self._map
+        for number in range(self._count if mapped is not None else 0):
+            key, offset, length, stamp = RECORD.unpack_from(mapped, HEADER.size + number * RECORD.size)  # type: ignore
+            entries[key] = (stamp, mapped[offset : offset + length])  # type: ignore
+        return entries
+
+    def put_many(self, items: dict[bytes, bytes]) -> None:
+        """Store several outputs with a single rewrite of the cache file."""
+        if not items:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, _locked(self.path.with_name(self.path.name + ".lock")):
+            # Re-read under the lock: another process may have replaced the file since it was mapped
+            self._open()
+            entries = self._entries()
+            stamp = time.time_ns()
+            for key, value in items.items():
+                entries[key] = (stamp, value)
+
+            # Evict the least recently written entries until the blobs fit
+            total = sum(len(value) for _, value in entries.values())
+            if total > self.max_bytes:
+                for key, (_, value) in sorted(entries.items(), key=lambda item: item[1][0]):
+                    if total <= self.max_bytes:
+                        break
+                    del entries[key]
+                    total -= len(value)
+
+            keys = sorted(entries)
+            offset = HEADER.size + len(keys) * RECORD.size
+            index = [HEADER.pack(MAGIC, len(keys))]
+            for key in keys:
+                stamp, value = entries[key]
+                index.append(RECORD.pack(key, offset, len(value), stamp))
+                offset += len(value)
+
+            import tempfile
+
+            descriptor, temporary = tempfile.mkstemp(prefix=".render-cache-", dir=self.path.parent)
+            try:
+                with os.fdopen(descriptor, "wb") as file:
+                    file.writelines(index)
+                    file.writelines(entries[key][1] for key in keys)
+                os.replace(temporary, self.path)
+            except BaseException:
+                os.unlink(temporary)
+                raise
+            self._close()
+
+    def put(self, key: bytes, value: bytes) -> None:
+        """Store one output."""
+        self.put_many({key: value})
+
+    def render(self, key: bytes, render: Callable[[], str]) -> str:
+        """The stored output of a key, or the output of `render()`, which is then stored.
+
+        Example:
+            >>> key = cache_key("Hello", ("panel", 3), width=80, color_system="truecolor")
+            >>> header = cache.render(key, lambda: capture_panel("Hello"))
+        """
+        value = self.get(key)
+        if value is not None:
+            return value.decode("utf-8")
+        output = render()
+        try:
+            self.put(key, output.encode("utf-8"))
+        except OSError:
+            pass  # A read-only or full cache directory must not break rendering
+        return output
+
+
+_default: Optional[DiskCache] = None
+
+
+def default_cache() -> DiskCache:
+    """The shared cache in the default cache directory."""
+    global _default
+    if _default is None:
+        _default = DiskCache()
+    return _default
+
+
+def banner(
+    text: str,
+    spec: Optional[GradientSpec] = None,
+    width: Optional[int] = None,
+    cache: Optional[DiskCache] | bool = None,
+) -> str:
+    """Render a gradient banner, reusing the output of earlier runs.
+
+    Once a banner has been rendered, later calls (in any process) read it from
+    the disk cache without computing the gradient.
+
+    Args:
+        text (`str`): The banner text.
+        spec (`Optional[GradientSpec]`): The compiled gradient. Defaults to a rainbow `GradientSpec()`.
+        width (`Optional[int]`): Center every line of the banner in this many columns. Defaults to None.
+        cache (`Optional[DiskCache]|bool`): The cache to use, or False to disable caching. Defaults to `default_cache()`.
+
+    Returns:
+        `str`: The banner as an ANSI string.
+    """
+    spec = spec or GradientSpec()
+
+    def _render() -> str:
+        rendered = spec.render(text)
+        if width is None:
+            return rendered
+        # Pad outside the escape sequences, so the padding doesn't use up the gradient
+        return "\n".join(
+            " " * ((width - len(line)) // 2) + part if line else part
+            for line, part in zip(text.split("\n"), rendered.split("\n"))
+        )
+
+    if cache is False:
+        return _render()
+    if cache is None or cache is True:
+        cache = default_cache()
+    return cache.render(cache_key(text, spec.key, width, spec.color_system), _render)
@@ -0,0 +1,139 @@
+"""Stable colors for categorical labels such as services, hosts and request IDs.
+
+A label is hashed (CRC-32, so the same label gets the same color in every run
+and process) onto a palette, either the spectrum itself or a larger ring
+blended from it. The hash is spread over the ring by multiplying with the
+golden ratio, and while some colors are still unused, a label whose color is
+already taken steps around the ring by the golden ratio to the next free one.
+So the first labels seen all get different colors, far apart on the ring, and
+a label only shares a color once every color is in use. Which label steps
+depends on which was seen first, so only a label that didn't collide is
+guaranteed the same color in every process.
+
+Each palette entry has one shared rich Style, and the label to entry mapping
+is memoized in a bounded dict, so coloring a label that was seen before is a
+single dict lookup.
+"""
+import zlib
+from math import gcd
+from typing import Hashable, Optional, Sequence
+
+from maxcolor.encoder import ColorSystemName, color_params
+from maxcolor.kernel import RGB, SPECTRUM, interpolate, parse_color
+
+# 2**32 divided by the golden ratio: multiplying by it spreads consecutive hashes evenly around the ring
+GOLDEN_HASH = 0x9E3779B9
+GOLDEN_RATIO = (1 + 5**0.5) / 2
+
+
+def _golden_step(size: int) -> int:
+    """The step closest to `size` over the golden ratio that still visits every color of the ring."""
+    step = max(1, round(size / GOLDEN_RATIO))
+    while gcd(step, size) != 1:
+        step += 1
+    return step
+
+
+class CategoricalColors:
+    """Assign each label a stable color from a palette."""
+
+    palette: tuple[RGB, ...]
+    maxsize: int
+
+    def __init__(
+        self,
+        stops: Optional[Sequence[RGB | str]] = None,
+        size: Optional[int] = None,
+        maxsize: int = 4096,
+    ):
+        """Compile a palette.
+
+        Args:
+            stops (`Optional[Sequence[tuple[int,int,int]|str]]`): The colors of the palette. Defaults to the full spectrum.
+            size (`Optional[int]`): Blend the stops into a ring of this many colors, to tell more labels apart. Defaults to None (the stops themselves).
+            maxsize (`int`): The number of labels memoized before the memo is cleared. Defaults to 4096.
+        """
+        colors = [parse_color(stop) for stop in stops] if stops else list(SPECTRUM.values())
+        if size is not None:
+            if size < 1:
+                raise ValueError(f"Invalid size: {size}. Must be at least one color.")
+            # The ring returns to the first stop, so its last color isn't a repeat of the first
+            colors = interpolate(colors + colors[:1], size + 1)[:size]
+        if maxsize < 1:
+            raise ValueError(f"Invalid maxsize: {maxsize}. Must be at least one label.")
+        self.palette = tuple(colors)
+        self.maxsize = maxsize
+        self.hex_colors = tuple(f"#{red:02x}{green:02x}{blue:02x}" for red, green, blue in self.palette)
+        self._step = _golden_step(len(self.palette))
+        self._memo: dict[Hashable, int] = {}
+        # The palette entries of the memoized labels
+        self._taken: set[int] = set()
+        self._styles: Optional[list] = None
+        # Labels straight to their Style, so the common call is a single lookup
+        self._style_memo: dict[Hashable, object] = {}
+        self._params: dict[tuple[str, bool], tuple[str, ...]] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self.palette)} colors, {len(self._memo)}/{self.maxsize} labels)"
+
+    def __len__(self) -> int:
+        return len(self.palette)
+
+    def index(self, label: Hashable) -> int:
+        """The palette index of a label."""
+        try:
+            return self._memo[label]
+        except KeyError:
+            pass
+        key = label if isinstance(label, bytes) else str(label).encode("utf-8")
+        size = len(self.palette)
+        index = (zlib.crc32(key) * GOLDEN_HASH & 0xFFFFFFFF) * size >> 32
+        if len(self._memo) >= self.maxsize:
+            # Start over, and forget the styles too, so they keep matching the indexes
+            self._memo.clear()
+            self._taken.clear()
+            self._style_memo.clear()
+        taken = self._taken
+        if index in taken and len(taken) < size:
+            step = self._step
+            while index in taken:
+                index = (index + step) % size
+        taken.add(index)
+        self._memo[label] = index
+        return index
+
+    def hex(self, label: Hashable) -> str:
+        """The `#rrggbb` color of a label."""
+        return self.hex_colors[self.index(label)]
+
+    def rgb(self, label: Hashable) -> RGB:
+        """The rgb color of a label."""
+        return self.palette[self.index(label)]
+
+    def style(self, label: Hashable):
+        """The rich Style of a label. Labels with the same color share one Style object."""
+        try:
+            return self._style_memo[label]
+        except KeyError:
+            pass
+        styles = self._styles
+        if styles is None:
+            from rich.color import Color
+            from rich.style import Style
+
+            styles = self._styles = [Style(color=Color.from_rgb(*rgb)) for rgb in self.palette]
+        style = styles[self.index(label)]
+        if len(self._style_memo) >= self.maxsize:
+            self._style_memo.clear()
+        self._style_memo[label] = style
+        return style
+
+    __call__ = style
+
+    def params(self, label: Hashable, color_system: ColorSystemName = "truecolor", background: bool = False) -> str:
+        """The SGR parameters of a label's color, e.g. `38;2;255;0;0`."""
+        table = self._params.get((color_system, background))
+        if table is None:
+            table = tuple(color_params(rgb, color_system, background) for rgb in self.palette)
+            self._params[(color_system, background)] = table
+        return table[self.index(label)]
@@ -0,0 +1,276 @@
+"""The `maxcolor` command line: gradient text from stdin to stdout.
+
+    cat build.log | maxcolor --stops magenta,cyan --depth 256
+    python -m maxcolor --lines < access.log
+    maxcolor --file huge.log --jobs 8 > huge.ansi
+    maxcolor --daemon &  echo "$line" | maxcolor --client --granularity word
+    maxcolor run --lines -- make test
+    maxcolor --palette brand.toml < build.log
+"""
+import argparse
+import sys
+from typing import Optional
+
+from maxcolor.kernel import SPECTRUM, parse_color
+
+DEPTHS = {"truecolor": "truecolor", "256": "256", "16": "standard"}
+
+
+def _stops(value: str) -> list[tuple[int, int, int]]:
+    """Parse a comma separated list of colors. `r;g;b` is accepted for rgb colors."""
+    try:
+        return [parse_color(color) for color in value.split(",") if color.strip()]
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(str(error)) from error
+
+
+def _palette_stops(value: str) -> list[tuple[int, int, int]]:
+    """Load the colors of a JSON or TOML palette file, through its compiled sidecar."""
+    from maxcolor.palette_file import load_palette
+
+    try:
+        return list(load_palette(value))
+    except (OSError, ValueError) as error:
+        raise argparse.ArgumentTypeError(str(error)) from error
+
+
+def _readable_file(value: str) -> str:
+    """A file that can be opened for reading, so a missing file is a usage error rather than a traceback."""
+    try:
+        with open(value, "rb"):
+            pass
+    except OSError as error:
+        raise argparse.ArgumentTypeError(f"{value}: {error.strerror}") from error
+    return value
+
+
+def _granularity(value: str) -> str | int:
+    """Parse `char`, `word`, `line`, or a number of characters per color."""
+    if value in ("char", "word", "line"):
+        return value
+    try:
+        return int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid granularity: {value}. Valid values are char, word, line, or an integer.")
+
+
+def add_color_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments that describe the streaming gradient."""
+    colors = parser.add_mutually_exclusive_group()
+    colors.add_argument(
+        "-s",
+        "--stops",
+        type=_stops,
+        help=f"Comma separated color stops: {', '.join(SPECTRUM)}, #rrggbb, or r;g;b. Defaults to a rainbow.",
+    )
+    colors.add_argument(
+        "--palette",
+        dest="stops",
+        metavar="FILE",
+        type=_palette_stops,
+        help="Use the colors of a JSON or TOML palette file as the stops.",
+    )
+    parser.add_argument(
+        "-l",
+        "--lines",
+        action="store_true",
+        help="Color each line by its line number instead of by character offset.",
+    )
+    parser.add_argument(
+        "-p",
+        "--period",
+        type=int,
+        default=None,
+        help="Characters (or lines with --lines) in one cycle of the gradient. Defaults to 240 characters or 24 lines.",
+    )
+    parser.add_argument(
+        "-b", "--band", type=int, default=16, help="Characters that share one color. Defaults to 16."
+    )
+    parser.add_argument(
+        "-d",
+        "--depth",
+        choices=list(DEPTHS),
+        default="truecolor",
+        help="Color depth of the output. Defaults to truecolor.",
+    )
+    parser.add_argument(
+        "--precision", type=int, default=8, help="Bits per color channel (1-8). Defaults to 8."
+    )
+    parser.add_argument(
+        "-e",
+        "--encoder",
+        choices=["minimal", "rich"],
+        default="minimal",
+        help="`minimal` emits only color changes, `rich` resets before every color. Defaults to minimal.",
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser of the `maxcolor` command."""
+    parser = argparse.ArgumentParser(
+        prog="maxcolor",
+        description="Color text from stdin with a gradient and write it to stdout.",
+        epilog="Use `maxcolor run [options] -- command ...` to color the output of a command live.",
+    )
+    add_color_arguments(parser)
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=1 << 16,
+        help="Bytes read from stdin at once. Defaults to 65536.",
+    )
+    parser.add_argument(
+        "-f",
+        "--file",
+        type=_readable_file,
+        help="Color a file instead of stdin. The file is memory-mapped and colored in parallel.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for --file. Defaults to the number of CPUs.",
+    )
+    service = parser.add_mutually_exclusive_group()
+    service.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Serve colorize requests on a Unix socket, keeping specs warm between requests.",
+    )
+    service.add_argument(
+        "--client",
+        action="store_true",
+        help="Color all of stdin as one gradient on the daemon, or in-process if no daemon is running.",
+    )
+    parser.add_argument("--socket", help="The daemon socket. Defaults to $XDG_RUNTIME_DIR/maxcolor.sock.")
+    parser.add_argument(
+        "-g",
+        "--granularity",
+        type=_granularity,
+        default="char",
+        help="With --client: char, word, line, or characters per color. Defaults to char.",
+    )
+    return parser
+
+
+def build_run_parser() -> argparse.ArgumentParser:
+    """Build the argument parser of the `maxcolor run` command."""
+    parser = argparse.ArgumentParser(
+        prog="maxcolor run",
+        description="Run a command under a pseudo-terminal and color its output live.",
+    )
+    add_color_arguments(parser)
+    parser.add_argument("command", nargs=argparse.REMAINDER, help="The command to run, after `--`.")
+    return parser
+
+
+def settings_from_args(args: argparse.Namespace) -> dict:
+    """The `StreamColorizer` settings described by the parsed arguments."""
+    return {
+        "stops": tuple(args.stops) if args.stops else None,
+        "mode": "line" if args.lines else "period",
+        "period": args.period or (24 if args.lines else 240),
+        "band": args.band,
+        "color_system": DEPTHS[args.depth],
+        "precision": args.precision,
+        "encoder": args.encoder,
+    }
+
+
+def spec_settings_from_args(args: argparse.Namespace) -> dict:
+    """The `GradientSpec` settings described by the parsed arguments, as JSON compatible values."""
+    settings: dict = {
+        "granularity": args.granularity,
+        "color_system": DEPTHS[args.depth],
+        "precision": args.precision,
+    }
+    if args.stops:
+        settings["stops"] = [list(stop) for stop in args.stops]
+    return settings
+
+
+def run_client(args: argparse.Namespace) -> int:
+    """Color stdin on the daemon (or in-process) and write it to stdout."""
+    from maxcolor.daemon import DaemonError, colorize
+
+    text = sys.stdin.buffer.read().decode("utf-8", errors="replace")
+    try:
+        output = colorize(text, path=args.socket, **spec_settings_from_args(args))
+    except (DaemonError, ValueError) as error:
+        print(f"maxcolor: {error}", file=sys.stderr)
+        return 1
+    sys.stdout.buffer.write(output.encode("utf-8"))
+    sys.stdout.buffer.flush()
+    return 0
+
+
+def run_command(argv: list[str]) -> int:
+    """Run `maxcolor run`."""
+    from maxcolor.run import run
+    from maxcolor.stream import StreamColorizer
+
+    parser = build_run_parser()
+    args = parser.parse_args(argv)
+    command = args.command[1:] if args.command[:1] == ["--"] else args.command
+    if not command:
+        parser.error("No command to run. Usage: maxcolor run [options] -- command ...")
+    try:
+        colorizer = StreamColorizer(**settings_from_args(args))
+    except ValueError as error:
+        parser.error(str(error))
+    return run(command, colorizer)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Run the `maxcolor` command.
+
+    Returns:
+        `int`: The exit status.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["run"]:
+        return run_command(argv[1:])
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.daemon:
+        from maxcolor.daemon import DaemonError, serve
+
+        try:
+            serve(args.socket)
+        except KeyboardInterrupt:
+            pass
+        except DaemonError as error:
+            parser.error(str(error))
+        return 0
+    if args.client:
+        return run_client(args)
+
+    from maxcolor.stream import StreamColorizer
+
+    settings = settings_from_args(args)
+    try:
+        colorizer = StreamColorizer(**settings)
+    except ValueError as error:
+        parser.error(str(error))
+
+    try:
+        if args.file:
+            from maxcolor.parallel import colorize_file
+
+            colorize_file(args.file, sys.stdout.buffer, workers=args.jobs, **settings)
+            return 0
+        colorizer.pipe(
+            sys.stdin.buffer,
+            sys.stdout.buffer,
+            chunk_size=args.chunk_size,
+            flush=sys.stdin.isatty(),
+        )
+    except KeyboardInterrupt:
+        sys.stdout.buffer.write(colorizer.finish().encode("utf-8"))
+        return 130
+    except BrokenPipeError:
+        # The reader went away (e.g. `| head`); don't let the interpreter complain on exit
+        sys.stdout = None  # type: ignore
+        return 0
+    return 0
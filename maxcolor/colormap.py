@@ -0,0 +1,208 @@
+"""Map numeric values to colors of the maxcolor palette.
+
+A `Colormap` blends its color stops once into a lookup table of packed
+`0xRRGGBB` colors. Mapping values is then a normalization to a table index and
+a lookup, done in one pass over the whole array: vectorized with NumPy when the
+values are a NumPy array, or as a single comprehension over any other sequence
+(`array('d')`, `list`, ...).
+"""
+from array import array
+from math import isfinite
+from typing import Any, Optional, Sequence
+
+from maxcolor.encoder import ColorSystemName, cap_precision, color_params
+from maxcolor.kernel import RGB, SPECTRUM, interpolate, parse_color
+
+LUT_SIZES = (256, 1024)
+
+
+def _is_numpy(values: Any) -> bool:
+    return type(values).__module__ == "numpy" and hasattr(values, "dtype")
+
+
+class Colormap:
+    """A lookup table that maps numbers to colors."""
+
+    stops: tuple[RGB, ...]
+    size: int
+    vmin: Optional[float]
+    vmax: Optional[float]
+    clip: bool
+    lut: array
+
+    def __init__(
+        self,
+        stops: Optional[Sequence[RGB | str]] = None,
+        size: int = 256,
+        vmin: Optional[float] = None,
+        vmax: Optional[float] = None,
+        clip: bool = True,
+        precision: int = 8,
+    ):
+        """Compile the lookup table of a colormap.
+
+        Args:
+            stops (`Optional[Sequence[tuple[int,int,int]|str]]`): The color stops, from the lowest value to the highest. Defaults to the full spectrum.
+            size (`int`): The number of entries in the lookup table, 256 or 1024. Defaults to 256.
+            vmin (`Optional[float]`): The value mapped to the first color. Defaults to None (the minimum of each array mapped).
+            vmax (`Optional[float]`): The value mapped to the last color. Defaults to None (the maximum of each array mapped).
+            clip (`bool`): Whether values outside `vmin`-`vmax` take the first or last color. If False, they raise a ValueError. Defaults to True.
+            precision (`int`): Bits per color channel (1-8). Defaults to 8.
+        """
+        if size not in LUT_SIZES:
+            raise ValueError(f"Invalid size: {size}. Valid values are {', '.join(map(str, LUT_SIZES))}.")
+        if vmin is not None and vmax is not None and vmin > vmax:
+            raise ValueError(f"Invalid range: vmin {vmin} is greater than vmax {vmax}.")
+        if not 1 <= precision <= 8:
+            raise ValueError(f"Invalid precision: {precision}. Must be between 1 and 8 bits.")
+        self.stops = tuple(parse_color(stop) for stop in stops) if stops else tuple(SPECTRUM.values())
+        self.size = size
+        self.vmin = vmin
+        self.vmax = vmax
+        self.clip = clip
+        self.precision = precision
+        self.lut = array(
+            "I",
+            (
+                (red << 16) | (green << 8) | blue
+                for red, green, blue in (cap_precision(rgb, precision) for rgb in interpolate(self.stops, size))
+            ),
+        )
+        self._styles: dict[bool, list] = {}
+        self._params: dict[tuple[str, bool], list[str]] = {}
+        self._numpy_lut = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(stops={len(self.stops)}, size={self.size}, vmin={self.vmin}, vmax={self.vmax})"
+
+    def __len__(self) -> int:
+        return self.size
+
+    # ============================================================================ #
+    #     Normalization
+
+    def _bounds(self, values: Any) -> tuple[float, float]:
+        vmin, vmax = self.vmin, self.vmax
+        if vmin is None or vmax is None:
+            # Only finite values set the range, so one NaN or inf doesn't collapse it
+            if _is_numpy(values):
+                import numpy
+
+                finite = numpy.asarray(values, dtype=numpy.float64)
+                finite = finite[numpy.isfinite(finite)]
+                low, high = (float(finite.min()), float(finite.max())) if finite.size else (0.0, 0.0)
+            else:
+                finite = [value for value in values if isfinite(value)] if values else []
+                low, high = (min(finite), max(finite)) if finite else (0.0, 0.0)
+            vmin = low if vmin is None else vmin
+            vmax = high if vmax is None else vmax
+        return vmin, vmax
+
+    def indices(self, values: Any) -> Any:
+        """The lookup table index of every value.
+
+        Values at or below `vmin` take the first color and values at or above
+        `vmax` the last, so with equal bounds a value is first or last by which
+        side it is on. NaN takes the first color.
+
+        Args:
+            values (`Sequence[float]|numpy.ndarray`): The values.
+
+        Returns:
+            `array('H')|numpy.ndarray`: The indices, as a NumPy array if `values` is one.
+        """
+        vmin, vmax = self._bounds(values)
+        top = self.size - 1
+        scale = top / (vmax - vmin) if vmax > vmin else 0.0
+        if _is_numpy(values):
+            import numpy
+
+            values = numpy.asarray(values, dtype=numpy.float64)
+            if not self.clip and ((values < vmin) | (values > vmax)).any():
+                raise ValueError(f"Values outside the range {vmin}-{vmax} with clip disabled.")
+            with numpy.errstate(invalid="ignore"):
+                scaled = numpy.where(values >= vmax, top, (values - vmin) * scale)
+            # Comparisons with NaN are False, so NaN lands on the first color like the values below vmin
+            return numpy.where(values > vmin, scaled, 0).astype(numpy.uint16)
+
+        if not self.clip and any(value < vmin or value > vmax for value in values):
+            raise ValueError(f"Values outside the range {vmin}-{vmax} with clip disabled.")
+        indices = [
+            (top if value >= vmax else int((value - vmin) * scale)) if value > vmin else 0
+            for value in values
+        ]
+        return array("H", indices)
+
+    # ============================================================================ #
+    #     Colors
+
+    def __call__(self, value: float) -> int:
+        """The packed `0xRRGGBB` color of a single value. Requires `vmin` and `vmax`."""
+        if self.vmin is None or self.vmax is None:
+            raise ValueError("Mapping a single value requires vmin and vmax.")
+        return self.lut[self.indices((value,))[0]]
+
+    def packed(self, values: Any) -> Any:
+        """The packed `0xRRGGBB` color of every value.
+
+        Args:
+            values (`Sequence[float]|numpy.ndarray`): The values.
+
+        Returns:
+            `array('I')|numpy.ndarray`: The packed colors, as a NumPy `uint32` array if `values` is one.
+        """
+        indices = self.indices(values)
+        if _is_numpy(values):
+            if self._numpy_lut is None:
+                import numpy
+
+                self._numpy_lut = numpy.frombuffer(self.lut, dtype=numpy.uint32)
+            return self._numpy_lut[indices]
+        lut = self.lut
+        return array("I", [lut[index] for index in indices])
+
+    def hex(self, values: Any) -> list[str]:
+        """The `#rrggbb` color of every value."""
+        return [f"#{color:06x}" for color in self.packed(values)]
+
+    def styles(self, values: Any, background: bool = False) -> list:
+        """The rich Style of every value.
+
+        One Style is built per lookup table entry and shared, so equal colors are the same object.
+
+        Args:
+            values (`Sequence[float]|numpy.ndarray`): The values.
+            background (`bool`): Whether to color the background instead of the foreground. Defaults to False.
+
+        Returns:
+            `list[rich.style.Style]`: The styles.
+        """
+        styles = self._styles.get(background)
+        if styles is None:
+            from rich.color import Color
+            from rich.style import Style
+
+            colors = [Color.from_rgb((packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF) for packed in self.lut]
+            styles = [Style(bgcolor=color) if background else Style(color=color) for color in colors]
+            self._styles[background] = styles
+        return [styles[index] for index in self.indices(values).tolist()]
+
+    def params(self, values: Any, color_system: ColorSystemName = "truecolor", background: bool = False) -> list[str]:
+        """The SGR parameters of every value, e.g. `38;2;255;0;0`.
+
+        Args:
+            values (`Sequence[float]|numpy.ndarray`): The values.
+            color_system (`str`): `truecolor`, `256`, or `standard`. Defaults to `truecolor`.
+            background (`bool`): Whether to select the background color. Defaults to False.
+
+        Returns:
+            `list[str]`: The SGR parameters.
+        """
+        table = self._params.get((color_system, background))
+        if table is None:
+            table = [
+                color_params(((packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF), color_system, background)
+                for packed in self.lut
+            ]
+            self._params[(color_system, background)] = table
+        return [table[index] for index in self.indices(values).tolist()]
@@ -0,0 +1,279 @@
+"""A local colorizing daemon, so short-lived callers skip interpreter startup and imports.
+
+`serve()` listens on a Unix domain socket and keeps compiled specs (and their
+encoder caches) warm between requests. `DaemonClient` talks to it, and
+`colorize()` falls back to rendering in-process when no daemon is running.
+
+Every message is a frame: a big-endian u32 length followed by that many bytes.
+
+    request   frame(JSON spec settings)  frame(UTF-8 text)
+    response  frame(status byte + payload)
+
+The status byte is `0` with the rendered ANSI as the payload, or `1` with an
+error message. A connection can carry any number of requests.
+"""
+import json
+import os
+import signal
+import socket
+import socketserver
+import struct
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from maxcolor.spec import GradientSpec
+
+FRAME = struct.Struct(">I")
+MAX_FRAME = 64 << 20
+SPEC_CACHE_SIZE = 256
+OK = b"\x00"
+ERROR = b"\x01"
+SOCKET_NAME = "maxcolor.sock"
+
+
+class DaemonError(Exception):
+    """The daemon could not serve a request."""
+
+
+def default_socket_path() -> Path:
+    """The daemon socket, in `$XDG_RUNTIME_DIR` or else the maxcolor cache directory."""
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime:
+        return Path(runtime) / SOCKET_NAME
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "maxcolor" / SOCKET_NAME
+
+
+# ============================================================================ #
+#     Framing
+
+
+def _receive_exactly(connection: socket.socket, size: int) -> Optional[bytes]:
+    """Read exactly `size` bytes, or None if the peer closed the connection first."""
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = connection.recv_into(view[received:])
+        if not count:
+            return None
+        received += count
+    return bytes(buffer)
+
+
+def send_frame(connection: socket.socket, payload: bytes) -> None:
+    """Send one length-prefixed frame."""
+    connection.sendall(FRAME.pack(len(payload)) + payload)
+
+
+def receive_frame(connection: socket.socket) -> Optional[bytes]:
+    """Receive one length-prefixed frame, or None at the end of the connection."""
+    header = _receive_exactly(connection, FRAME.size)
+    if header is None:
+        return None
+    (size,) = FRAME.unpack(header)
+    if size > MAX_FRAME:
+        raise DaemonError(f"Frame of {size} bytes exceeds the limit of {MAX_FRAME} bytes.")
+    if not size:
+        return b""
+    payload = _receive_exactly(connection, size)
+    if payload is None:
+        raise DaemonError("Connection closed in the middle of a frame.")
+    return payload
+
+
+# ============================================================================ #
+#     Server
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    server: "ColorServer"
+
+    def handle(self) -> None:
+        connection = self.request
+        while True:
+            try:
+                settings = receive_frame(connection)
+                if settings is None:
+                    return
+                text = receive_frame(connection)
+                if text is None:
+                    return
+            except (DaemonError, OSError):
+                return
+            try:
+                spec = self.server.spec(settings)
+                response = OK + spec.render(text.decode("utf-8", errors="replace")).encode("utf-8")
+            except Exception as error:
+                # Bad settings can fail anywhere in the spec, and the client is owed an answer either way
+                response = ERROR + (str(error) or error.__class__.__name__).encode("utf-8")
+            try:
+                send_frame(connection, response)
+            except OSError:
+                return
+
+
+class ColorServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """A Unix socket server that renders gradients with cached specs."""
+
+    daemon_threads = True
+
+    def __init__(self, path: str | Path):
+        self._specs: dict[bytes, "GradientSpec"] = {}
+        self._lock = threading.Lock()
+        super().__init__(str(path), _Handler)
+
+    def server_bind(self) -> None:
+        super().server_bind()
+        # Nobody can connect until `server_activate()` listens, so the socket is private before it is reachable
+        os.chmod(self.server_address, 0o600)
+
+    def spec(self, settings: bytes) -> "GradientSpec":
+        """The compiled spec of a settings frame, compiled once per distinct frame."""
+        spec = self._specs.get(settings)
+        if spec is None:
+            from maxcolor.spec import GradientSpec
+
+            options = json.loads(settings) if settings else {}
+            if not isinstance(options, dict):
+                raise ValueError("Spec settings must be a JSON object.")
+            spec = GradientSpec(**options)
+            with self._lock:
+                if len(self._specs) >= SPEC_CACHE_SIZE:
+                    self._specs.clear()
+                self._specs[settings] = spec
+        return spec
+
+
+def _terminate(signum, frame) -> None:
+    raise SystemExit(0)
+
+
+def serve(path: Optional[str | Path] = None, ready: Optional[threading.Event] = None) -> None:
+    """Serve colorize requests on a Unix socket until interrupted.
+
+    Args:
+        path (`Optional[str|Path]`): The socket path. Defaults to `default_socket_path()`.
+        ready (`Optional[threading.Event]`): Set once the socket is listening. Defaults to None.
+    """
+    path = Path(path) if path is not None else default_socket_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists():
+        # Replace a stale socket, but never steal one that a live daemon is using
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                probe.connect(str(path))
+            raise DaemonError(f"A daemon is already listening on {path}.")
+        except (ConnectionRefusedError, FileNotFoundError):
+            path.unlink(missing_ok=True)
+    with ColorServer(path) as server:
+        previous = None
+        if threading.current_thread() is threading.main_thread():
+            # Exit through the `finally` below on SIGTERM too, so the socket is removed
+            previous = signal.signal(signal.SIGTERM, _terminate)
+        if ready is not None:
+            ready.set()
+        try:
+            server.serve_forever()
+        finally:
+            path.unlink(missing_ok=True)
+            if previous is not None:
+                signal.signal(signal.SIGTERM, previous)
+
+
+# ============================================================================ #
+#     Client
+
+
+class DaemonClient:
+    """A connection to the colorizing daemon."""
+
+    path: Path
+
+    def __init__(self, path: Optional[str | Path] = None, timeout: Optional[float] = 5.0):
+        """Create a client. The connection is opened on the first request.
+
+        Args:
+            path (`Optional[str|Path]`): The socket path. Defaults to `default_socket_path()`.
+            timeout (`Optional[float]`): The socket timeout in seconds. Defaults to 5.
+        """
+        self.path = Path(path) if path is not None else default_socket_path()
+        self.timeout = timeout
+        self._connection: Optional[socket.socket] = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self.path)!r})"
+
+    def __enter__(self) -> "DaemonClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def colorize(self, text: str, **settings) -> str:
+        """Render text on the daemon.
+
+        Args:
+            text (`str`): The text to color.
+            **settings: The `GradientSpec` settings, e.g. `stops=["magenta", "cyan"]`.
+
+        Raises:
+            `OSError`: If the daemon is not reachable.
+            `DaemonError`: If the daemon rejected the request.
+
+        Returns:
+            `str`: The ANSI output.
+        """
+        if self._connection is None:
+            connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            connection.settimeout(self.timeout)
+            try:
+                connection.connect(str(self.path))
+            except OSError:
+                connection.close()
+                raise
+            self._connection = connection
+        try:
+            send_frame(self._connection, json.dumps(settings, sort_keys=True).encode("utf-8"))
+            send_frame(self._connection, text.encode("utf-8"))
+            response = receive_frame(self._connection)
+        except OSError:
+            self.close()
+            raise
+        if response is None:
+            self.close()
+            raise DaemonError("The daemon closed the connection.")
+        if response[:1] != OK:
+            raise DaemonError(response[1:].decode("utf-8", errors="replace"))
+        return response[1:].decode("utf-8")
+
+
+def colorize(text: str, path: Optional[str | Path] = None, fallback: bool = True, **settings) -> str:
+    """Render text on the daemon, or in-process if no daemon is running.
+
+    Args:
+        text (`str`): The text to color.
+        path (`Optional[str|Path]`): The socket path. Defaults to `default_socket_path()`.
+        fallback (`bool`): Whether to render in-process when the daemon is unreachable. Defaults to True.
+        **settings: The `GradientSpec` settings.
+
+    Returns:
+        `str`: The ANSI output.
+    """
+    try:
+        with DaemonClient(path) as client:
+            return client.colorize(text, **settings)
+    except OSError:
+        if not fallback:
+            raise
+    # Only the fallback needs the renderer, so the client stays quick to import
+    from maxcolor.spec import GradientSpec
+
+    return GradientSpec(**settings).render(text)
@@ -0,0 +1,373 @@
+"""Minimal-SGR output encoder for gradient results.
+
+Rich resets and re-emits the complete style of every segment. A gradient
+changes only its foreground color from one character to the next, so most of
+those bytes are redundant. `SGREncoder` tracks the terminal state and emits
+only the attributes that changed.
+"""
+from functools import lru_cache
+from typing import IO, Iterable, Literal, Optional, Tuple
+
+from maxcolor import metrics
+
+ColorSystemName = Literal["truecolor", "256", "standard"]
+SpanColor = int | Tuple[int, int, int] | str
+
+RESET = "\x1b[0m"
+CACHE_SIZE = 1 << 16
+COLOR_SYSTEMS = ("truecolor", "256", "standard")
+
+# (attribute, on, off) SGR parameters. Bold and dim share their off code.
+ATTRIBUTES = (
+    ("bold", "1", "22"),
+    ("dim", "2", "22"),
+    ("italic", "3", "23"),
+    ("underline", "4", "24"),
+    ("blink", "5", "25"),
+    ("reverse", "7", "27"),
+    ("conceal", "8", "28"),
+    ("strike", "9", "29"),
+)
+# Attributes that are visible on whitespace, so a foreground change can't be skipped.
+VISIBLE_ON_SPACE = ("underline", "reverse", "strike")
+
+STANDARD_RGB = (
+    (0, 0, 0),
+    (128, 0, 0),
+    (0, 128, 0),
+    (128, 128, 0),
+    (0, 0, 128),
+    (128, 0, 128),
+    (0, 128, 128),
+    (192, 192, 192),
+    (128, 128, 128),
+    (255, 0, 0),
+    (0, 255, 0),
+    (255, 255, 0),
+    (0, 0, 255),
+    (255, 0, 255),
+    (0, 255, 255),
+    (255, 255, 255),
+)
+CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+
+
+# ============================================================================ #
+#     Color Conversion
+
+
+def to_rgb(color: SpanColor) -> Tuple[int, int, int]:
+    """Convert a packed int, rgb tuple, or hex string to an rgb tuple."""
+    if isinstance(color, int):
+        return (color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF
+    if isinstance(color, str):
+        value = int(color.lstrip("#"), 16)
+        return (value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF
+    return tuple(color)  # type: ignore
+
+
+def cap_precision(rgb: Tuple[int, int, int], precision: int) -> Tuple[int, int, int]:
+    """Round each channel of an rgb color to `precision` bits."""
+    if precision >= 8:
+        return rgb
+    levels = (1 << precision) - 1
+    return tuple(round(channel * levels / 255) * 255 // levels for channel in rgb)  # type: ignore
+
+
+@lru_cache(maxsize=4096)
+def rgb_to_eight_bit(red: int, green: int, blue: int) -> int:
+    """Convert an rgb color to the nearest xterm 256 color number."""
+
+    def _cube(channel: int) -> int:
+        return 0 if channel < 48 else 1 if channel < 115 else (channel - 35) // 40
+
+    cr, cg, cb = _cube(red), _cube(green), _cube(blue)
+    cube = (CUBE_LEVELS[cr], CUBE_LEVELS[cg], CUBE_LEVELS[cb])
+    average = (red + green + blue) // 3
+    gray_index = 23 if average > 238 else max(0, (average - 3) // 10)
+    gray = 8 + gray_index * 10
+
+    cube_distance = (cube[0] - red) ** 2 + (cube[1] - green) ** 2 + (cube[2] - blue) ** 2
+    gray_distance = (gray - red) ** 2 + (gray - green) ** 2 + (gray - blue) ** 2
+    if gray_distance < cube_distance:
+        return 232 + gray_index
+    return 16 + 36 * cr + 6 * cg + cb
+
+
+@lru_cache(maxsize=4096)
+def rgb_to_standard(red: int, green: int, blue: int) -> int:
+    """Convert an rgb color to the nearest of the 16 standard colors."""
+    return min(
+        range(16),
+        key=lambda number: sum((a - b) ** 2 for a, b in zip(STANDARD_RGB[number], (red, green, blue))),
+    )
+
+
+def standard_params(number: int, background: bool = False) -> str:
+    """The SGR parameter of one of the 16 standard colors."""
+    base = 30 if number < 8 else 90 - 8
+    return str(base + number + (10 if background else 0))
+
+
+@lru_cache(maxsize=8192)
+def color_params(
+    rgb: Tuple[int, int, int],
+    color_system: ColorSystemName = "truecolor",
+    background: bool = False,
+) -> str:
+    """The SGR parameters that select an rgb color in a color system.
+
+    Args:
+        rgb (`tuple[int,int,int]`): The color.
+        color_system (`str`): `truecolor`, `256`, or `standard`. Defaults to `truecolor`.
+        background (`bool`): Whether to select the background color. Defaults to False.
+
+    Returns:
+        `str`: The SGR parameters, e.g. `38;2;255;0;0`.
+    """
+    red, green, blue = rgb
+    if color_system == "truecolor":
+        return f"{48 if background else 38};2;{red};{green};{blue}"
+    if color_system == "256":
+        return f"{48 if background else 38};5;{rgb_to_eight_bit(red, green, blue)}"
+    if color_system == "standard":
+        return standard_params(rgb_to_standard(red, green, blue), background)
+    raise ValueError(f"Invalid color system: {color_system}. Valid values are {', '.join(COLOR_SYSTEMS)}.")
+
+
+# ============================================================================ #
+#     Encoder
+
+
+class SGREncoder:
+    """Encode gradient text as ANSI, emitting only the attributes that change."""
+
+    color_system: ColorSystemName
+    precision: int
+    bytes_emitted: int
+    total_bytes: int
+    renders: int
+    cache_misses: int
+
+    def __init__(self, color_system: ColorSystemName = "truecolor", precision: int = 8):
+        """Create an encoder.
+
+        Args:
+            color_system (`str`): `truecolor`, `256`, or `standard`. Defaults to `truecolor`.
+            precision (`int`): Bits per color channel (1-8). Lower values merge similar neighbouring colors. Defaults to 8.
+        """
+        if color_system not in COLOR_SYSTEMS:
+            raise ValueError(f"Invalid color system: {color_system}. Valid values are {', '.join(COLOR_SYSTEMS)}.")
+        if not 1 <= precision <= 8:
+            raise ValueError(f"Invalid precision: {precision}. Must be between 1 and 8 bits.")
+        self.color_system = color_system
+        self.precision = precision
+        self.bytes_emitted = 0
+        self.total_bytes = 0
+        self.renders = 0
+        self.cache_misses = 0
+        self._console = None
+        self._color_cache: dict = {}
+        self._state_cache: dict = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.color_system!r}, precision={self.precision})"
+
+    def _count(self, output_bytes: int, lookups: int, misses: int) -> None:
+        # One update per render rather than per cache lookup
+        metrics.add("output_bytes", "encoder", output_bytes)
+        metrics.add("style_cache_hits", "encoder", lookups - misses)
+        metrics.add("style_cache_misses", "encoder", misses)
+
+    def _record(self, output: bytes) -> bytes:
+        self.bytes_emitted = len(output)
+        self.total_bytes += self.bytes_emitted
+        self.renders += 1
+        return output
+
+    def _fg(self, color: SpanColor) -> str:
+        """The foreground parameters of a span color, cached per encoder."""
+        params = self._color_cache.get(color)
+        if params is None:
+            self.cache_misses += 1
+            if len(self._color_cache) >= CACHE_SIZE:
+                self._color_cache.clear()
+            rgb = cap_precision(to_rgb(color), self.precision)
+            params = self._color_cache[color] = color_params(rgb, self.color_system)
+        return params
+
+    def render_spans(
+        self,
+        plain: str,
+        spans: Iterable[Tuple[int, int, SpanColor]],
+        start: int = 0,
+        end: Optional[int] = None,
+    ) -> str:
+        """Render plain text colored by sorted, non-overlapping foreground spans as an ANSI string.
+
+        Args:
+            plain (`str`): The plain text.
+            spans (`Iterable[tuple[int,int,int|tuple|str]]`): `(start, end, color)` of each span.
+            start (`int`): Render `plain` from this offset. Defaults to 0.
+            end (`Optional[int]`): Render `plain` up to this offset. Defaults to the end of `plain`.
+
+        Returns:
+            `str`: The ANSI output, reset at the end.
+        """
+        end = len(plain) if end is None else end
+        output = []
+        append = output.append
+        current = None
+        position = start
+        misses = self.cache_misses
+        lookups = 0
+        for span_start, span_end, color in spans:
+            lookups += 1
+            if span_start > position:
+                gap = plain[position:span_start]
+                # The foreground color of whitespace is invisible, so keep the current one
+                if current is not None and not gap.isspace():
+                    append("\x1b[39m")
+                    current = None
+                append(gap)
+            part = plain[span_start:span_end]
+            params = self._fg(color)
+            if params != current and (current is None or not part.isspace()):
+                append(f"\x1b[{params}m")
+                current = params
+            append(part)
+            position = span_end
+        if position < end:
+            tail = plain[position:end]
+            if current is not None and not tail.isspace():
+                append(RESET)
+                current = None
+            append(tail)
+        if current is not None:
+            append(RESET)
+        result = "".join(output)
+        if metrics.enabled:
+            size = len(result) if result.isascii() else len(result.encode("utf-8"))
+            self._count(size, lookups, self.cache_misses - misses)
+        return result
+
+    def encode_spans(self, plain: str, spans: Iterable[Tuple[int, int, SpanColor]]) -> bytes:
+        """Encode plain text colored by sorted, non-overlapping foreground spans.
+
+        This is the fast path for the output of `maxcolor.kernel.gradient_spans()`.
+
+        Args:
+            plain (`str`): The plain text.
+            spans (`Iterable[tuple[int,int,int|tuple|str]]`): `(start, end, color)` of each span.
+
+        Returns:
+            `bytes`: The UTF-8 encoded ANSI output.
+        """
+        return self._record(self.render_spans(plain, spans).encode("utf-8"))
+
+    def _state(self, style) -> Tuple[Optional[str], Optional[str], frozenset]:
+        """Convert a rich Style to (foreground, background, attributes)."""
+        state = self._state_cache.get(style)
+        if state is None:
+            self.cache_misses += 1
+            if len(self._state_cache) >= CACHE_SIZE:
+                self._state_cache.clear()
+            foreground = background = None
+            if style.color is not None and not style.color.is_default:
+                foreground = self._rich_color(style.color, False)
+            if style.bgcolor is not None and not style.bgcolor.is_default:
+                background = self._rich_color(style.bgcolor, True)
+            attributes = frozenset(name for name, _, _ in ATTRIBUTES if getattr(style, name))
+            state = self._state_cache[style] = (foreground, background, attributes)
+        return state
+
+    def _rich_color(self, color, background: bool) -> str:
+        """Convert a rich Color, keeping standard and 256 colors as they were written."""
+        from rich.color import ColorType
+
+        if color.type == ColorType.STANDARD:
+            return standard_params(color.number, background)
+        if color.type == ColorType.EIGHT_BIT and self.color_system != "standard":
+            return f"{48 if background else 38};5;{color.number}"
+        rgb = cap_precision(tuple(color.get_truecolor()), self.precision)
+        return color_params(rgb, self.color_system, background)  # type: ignore
+
+    def encode(self, text) -> bytes:
+        """Encode a rich Text (or any renderable Text-like object) with minimal SGR sequences.
+
+        Args:
+            text (`Text`): The text to encode, e.g. the result of `gradient()`.
+
+        Returns:
+            `bytes`: The UTF-8 encoded ANSI output.
+        """
+        if self._console is None:
+            from io import StringIO
+
+            from rich.console import Console
+
+            self._console = Console(file=StringIO(), force_terminal=True, color_system="truecolor")
+
+        output = []
+        append = output.append
+        fg = bg = None
+        attrs: frozenset = frozenset()
+        misses = self.cache_misses
+        lookups = 0
+        for segment in text.render(self._console, end=""):
+            if segment.control or not segment.text:
+                continue
+            if segment.style is None:
+                new_fg = new_bg = None
+                new_attrs: frozenset = frozenset()
+            else:
+                lookups += 1
+                new_fg, new_bg, new_attrs = self._state(segment.style)
+
+            if (new_fg, new_bg, new_attrs) != (fg, bg, attrs):
+                # Whitespace only shows its background and line attributes
+                if (
+                    segment.text.isspace()
+                    and new_bg == bg
+                    and new_attrs == attrs
+                    and not any(name in attrs for name in VISIBLE_ON_SPACE)
+                ):
+                    append(segment.text)
+                    continue
+                params = []
+                removed = attrs - new_attrs
+                if new_fg is None and new_bg is None and not new_attrs:
+                    params.append("0")
+                else:
+                    readd = set()
+                    for name, on, off in ATTRIBUTES:
+                        if name in removed:
+                            params.append(off)
+                            # `22` clears both bold and dim
+                            if off == "22":
+                                readd.update(n for n in ("bold", "dim") if n in new_attrs)
+                    for name, on, _ in ATTRIBUTES:
+                        if name in new_attrs and (name not in attrs or name in readd):
+                            params.append(on)
+                    if new_fg != fg:
+                        params.append(new_fg or "39")
+                    if new_bg != bg:
+                        params.append(new_bg or "49")
+                append(f"\x1b[{';'.join(params)}m")
+                fg, bg, attrs = new_fg, new_bg, new_attrs
+            append(segment.text)
+        if fg is not None or bg is not None or attrs:
+            append(RESET)
+        encoded = "".join(output).encode("utf-8")
+        if metrics.enabled:
+            self._count(len(encoded), lookups, self.cache_misses - misses)
+        return self._record(encoded)
+
+    def write(self, text, file: IO[bytes]) -> int:
+        """Encode a rich Text and write it to a binary file.
+
+        Returns:
+            `int`: The number of bytes written.
+        """
+        file.write(self.encode(text))
+        return self.bytes_emitted
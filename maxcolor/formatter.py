@@ -0,0 +1,199 @@
+"""Gradient log formatting for the standard library's `logging` and for loguru.
+
+Log records repeat the same few tokens (level names, logger names, fixed
+prefixes) over and over, so each token is rendered through a compiled
+`GradientSpec` once and then served from a cache. Nothing here builds rich
+objects or writes to a console.
+"""
+import logging
+import re
+from copy import copy
+from typing import Callable, Optional, Sequence
+
+from maxcolor import metrics
+from maxcolor.spec import GradientSpec
+
+DEFAULT_FIELDS = ("levelname", "name")
+DEFAULT_LOGURU_FORMAT = "{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}\n{exception}"
+DEFAULT_LOGURU_FIELDS = ("level", "name")
+CACHE_SIZE = 4096
+LOGURU_FIELD_REGEX = re.compile(r"\{(\w+)(?::([^{}]*))?\}")
+PERCENT_FIELD_REGEX = re.compile(r"%\((\w+)\)([-#0 +]*\d*(?:\.\d+)?)s")
+BRACE_FIELD_REGEX = re.compile(r"\{(\w+)(?::([^{}!]*))?\}")
+
+
+class TokenCache:
+    """Render short, frequently repeated tokens with a gradient, memoized."""
+
+    spec: GradientSpec
+    maxsize: int
+    hits: int
+    misses: int
+
+    def __init__(self, spec: Optional[GradientSpec] = None, maxsize: int = CACHE_SIZE):
+        """Create a token cache.
+
+        Args:
+            spec (`Optional[GradientSpec]`): The compiled gradient. Defaults to a rainbow `GradientSpec()`.
+            maxsize (`int`): The number of tokens kept before the cache is cleared. Defaults to 4096.
+        """
+        self.spec = spec or GradientSpec()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache: dict[str, str] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.spec!r}, size={len(self._cache)}, hits={self.hits}, misses={self.misses})"
+
+    def __call__(self, token: str) -> str:
+        """The token as an ANSI string, reset at the end.
+
+        Leading and trailing whitespace (e.g. alignment padding) is left uncolored.
+        """
+        colored = self._cache.get(token)
+        if metrics.enabled:
+            metrics.add("style_cache_misses" if colored is None else "style_cache_hits", "formatter")
+        if colored is None:
+            self.misses += 1
+            if len(self._cache) >= self.maxsize:
+                self._cache.clear()
+            core = token.strip()
+            colored = self.spec.render(core) if core == token else token.replace(core, self.spec.render(core), 1)
+            self._cache[token] = colored
+        else:
+            self.hits += 1
+        return colored
+
+
+# ============================================================================ #
+#     logging
+
+
+class GradientFormatter(logging.Formatter):
+    """A `logging.Formatter` that colors record fields with cached gradients.
+
+    Example:
+        >>> handler = logging.StreamHandler()
+        >>> handler.setFormatter(GradientFormatter("%(levelname)s %(name)s: %(message)s"))
+    """
+
+    def __init__(
+        self,
+        fmt: Optional[str] = None,
+        datefmt: Optional[str] = None,
+        style: str = "%",
+        validate: bool = True,
+        *,
+        spec: Optional[GradientSpec] = None,
+        fields: Sequence[str] = DEFAULT_FIELDS,
+        prefix: Optional[str | re.Pattern] = None,
+        tokens: Optional[TokenCache] = None,
+    ):
+        """Create a gradient formatter.
+
+        Args:
+            fmt (`Optional[str]`): The format string, as for `logging.Formatter`.
+            datefmt (`Optional[str]`): The date format string, as for `logging.Formatter`.
+            style (`str`): `%`, `{` or `$`, as for `logging.Formatter`. Defaults to `%`.
+            validate (`bool`): Whether to validate `fmt`, as for `logging.Formatter`. Defaults to True.
+            spec (`Optional[GradientSpec]`): The compiled gradient. Defaults to a rainbow `GradientSpec()`.
+            fields (`Sequence[str]`): The record attributes to color. Defaults to `levelname` and `name`.
+            prefix (`Optional[str|re.Pattern]`): A regular expression matching a fixed prefix of the message to color, e.g. `r"\\[\\w+\\]"`. Defaults to None.
+            tokens (`Optional[TokenCache]`): A token cache to share between formatters. Defaults to a new cache of `spec`.
+        """
+        self.fields = tuple(fields)
+        # Escape sequences would count towards a field width, so pad the plain values instead
+        self.widths: dict[str, str] = {}
+        if fmt and style in "%{":
+            regex = PERCENT_FIELD_REGEX if style == "%" else BRACE_FIELD_REGEX
+            fmt = regex.sub(self._strip_width, fmt)
+        super().__init__(fmt, datefmt, style, validate)
+        self.tokens = tokens or TokenCache(spec)
+        self.prefix = re.compile(prefix) if isinstance(prefix, str) else prefix
+
+    def _strip_width(self, match: re.Match) -> str:
+        name, width = match.groups()
+        if name not in self.fields or not width:
+            return match.group()
+        self.widths[name] = f"%{width}s" if match.group().startswith("%") else f"{{:{width}}}"
+        return f"%({name})s" if match.group().startswith("%") else f"{{{name}}}"
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        # Color a shallow copy, so other handlers still see the plain record
+        colored = copy(record)
+        tokens = self.tokens
+        for field in self.fields:
+            value = getattr(record, field, None)
+            if value is not None:
+                width = self.widths.get(field)
+                if width is None:
+                    value = str(value)
+                elif width[0] == "%":
+                    value = width % value
+                else:
+                    value = width.format(value)
+                setattr(colored, field, tokens(value))
+        if self.prefix is not None:
+            match = self.prefix.match(record.message)
+            if match and match.end():
+                colored.message = tokens(match.group()) + record.message[match.end() :]
+        return super().formatMessage(colored)
+
+
+# ============================================================================ #
+#     loguru
+
+
+def _escape(text: str) -> str:
+    """Escape a value for a loguru format string (both `str.format` braces and color tags)."""
+    return text.replace("{", "{{").replace("}", "}}").replace("<", r"\<")
+
+
+def loguru_format(
+    fmt: str = DEFAULT_LOGURU_FORMAT,
+    spec: Optional[GradientSpec] = None,
+    fields: Sequence[str] = DEFAULT_LOGURU_FIELDS,
+    tokens: Optional[TokenCache] = None,
+) -> Callable[[dict], str]:
+    """Build a loguru format function that colors record fields with cached gradients.
+
+    Example:
+        >>> logger.add(sys.stderr, format=loguru_format())
+
+    Args:
+        fmt (`str`): The loguru format string. Defaults to loguru's default format without color tags.
+        spec (`Optional[GradientSpec]`): The compiled gradient. Defaults to a rainbow `GradientSpec()`.
+        fields (`Sequence[str]`): The record keys to color. `level`, `name`, `function`, `module` and `file` are supported. Defaults to `level` and `name`.
+        tokens (`Optional[TokenCache]`): A token cache to share between format functions. Defaults to a new cache of `spec`.
+
+    Returns:
+        `Callable[[dict], str]`: The format function, for `logger.add(..., format=...)`.
+    """
+    tokens = tokens or TokenCache(spec)
+    fields = tuple(fields)
+    # Split the format into literal parts and the placeholders of colored fields
+    parts: list[str | tuple[str, str]] = []
+    position = 0
+    for match in LOGURU_FIELD_REGEX.finditer(fmt):
+        if match.group(1) in fields:
+            parts.append(fmt[position : match.start()])
+            parts.append((match.group(1), "{:" + match.group(2) + "}" if match.group(2) else "{}"))
+            position = match.end()
+    parts.append(fmt[position:])
+    formats: dict[tuple, str] = {}
+
+    def _format(record: dict) -> str:
+        values = tuple(str(getattr(record[field], "name", record[field])) for field in fields)
+        compiled = formats.get(values)
+        if compiled is None:
+            if len(formats) >= CACHE_SIZE:
+                formats.clear()
+            found = dict(zip(fields, values))
+            compiled = formats[values] = "".join(
+                part if isinstance(part, str) else _escape(tokens(part[1].format(found[part[0]])))
+                for part in parts
+            )
+        return compiled
+
+    return _format
@@ -22,6 +22,8 @@ from rich.table import Table
 from rich.text import Text, TextType
 from loguru import logger as log
 
+from maxcolor.palette import PaletteType, as_palette
+
 
 console = MaxConsole()
 
@@ -78,6 +80,7 @@ class ColorIndex:
     invert: bool
     num_of_index: int
     next_index: int | None
+    size: int
 
     def __init__(
         self,
@@ -86,6 +89,7 @@ class ColorIndex:
         invert: Optional[bool] = False,
         num_of_index: int = 3,
         title: Optional[str] = None,
+        palette: Optional[PaletteType] = None,
     ):
         """Generate a list of indexes from start to end.
 
@@ -94,7 +98,9 @@ class ColorIndex:
             end (`Optional[int]`): The integer to end the color index with. Defaults to None.
             invert (`Optional[bool]`): _description_. Defaults to False.
             num_of_index (`Optional[int]`): The number of index in the color indexes. * Note that this value is used if a `start` or `end` value are not provided *. Defaults to 3.
+            palette (`Optional[Palette]`): The palette the indexes refer to. Defaults to the spectrum.
         """
+        self.size = len(as_palette(palette))
         self.start = start
         self.end = end
         self.num_of_index = num_of_index
@@ -216,20 +222,11 @@ class ColorIndex:
         return table
 
     def __validate__end(self, __end: int) -> int:
-        if self.invert:
-            if __end < 0:
-                return __end + 9
-            else:
-                return __end
-        else:
-            if __end > 9:
-                return __end - 9
-            else:
-                return __end
+        return __end % self.size
 
     def _generate_start(self) -> int:
         """Generate a random starting index. Private function used when a start value is not provided."""
-        _start = random.randint(0, 9)
+        _start = random.randrange(self.size)
         self.start = _start
         log.debug(f"Generated start: {_start}")
         return _start
@@ -245,7 +242,7 @@ class ColorIndex:
         Returns:
             `int`: The final integer of a color index.
         """
-        if self.start not in list(range(0, 10)):
+        if self.start not in range(0, self.size):
             self.start = self._generate_start()
             log.debug(f"Generated start to generate `end`: {self.start}")
 
@@ -311,7 +308,7 @@ class ColorIndex:
                 return self.indexes
             else:
                 _index1 = list(range(self.start, -1, -1))
-                _index2 = list(range(9, self.end - 1, -1))
+                _index2 = list(range(self.size - 1, self.end - 1, -1))
                 self.indexes = _index1 + _index2
                 return self.indexes
 
@@ -321,7 +318,7 @@ class ColorIndex:
                 self.indexes = list(range(self.start, self.end + 1))
                 return self.indexes
             else:
-                _index1 = list(range(self.start, 10))
+                _index1 = list(range(self.start, self.size))
                 _index2 = list(range(0, self.end + 1))
                 self.indexes = _index1 + _index2
                 return self.indexes
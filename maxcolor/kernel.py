@@ -0,0 +1,189 @@
+"""Gradient kernel shared by `gradient()`, `gradient_panel()` and `rainbow()`.
+
+The kernel works on plain strings and rgb tuples only, so it can be imported
+without pulling in rich or maxconsole.
+"""
+import re
+from typing import Literal, Optional, Sequence, Tuple
+
+from maxcolor import metrics, named_colors
+
+RGB = Tuple[int, int, int]
+Granularity = Literal["char", "word", "line"] | int
+
+WORD_REGEX = re.compile(r"\S+")
+LINE_REGEX = re.compile(r"[^\n]+")
+HEX_REGEX = re.compile(r"^#?([0-9a-fA-F]{6})$")
+
+# The maxcolor spectrum, in ring order.
+SPECTRUM: dict[str, RGB] = {color.name: color.rgb for color in named_colors.COLORS}
+
+
+def parse_color(value: str | RGB) -> RGB:
+    """Parse a named spectrum color, a hex color, or an `r,g,b` string.
+
+    Args:
+        value (`str|tuple[int,int,int]`): The color, e.g. `magenta`, `#ff00ff`, `255,0,255`, or `(255, 0, 255)`.
+
+    Raises:
+        ValueError: If the value isn't a color, e.g. an rgb tuple without exactly three channels from 0 to 255.
+
+    Returns:
+        `tuple[int,int,int]`: The rgb color.
+    """
+    if isinstance(value, (tuple, list)):
+        if len(value) == 3 and all(type(channel) is int and 0 <= channel <= 255 for channel in value):
+            return tuple(value)  # type: ignore
+        raise ValueError(f"Unable to parse color: {value}")
+    if not isinstance(value, str):
+        raise ValueError(f"Unable to parse color: {value!r}")
+    if metrics.enabled:
+        metrics.add("color_parses", "parse_color")
+    name = value.strip().lower()
+    if name in SPECTRUM:
+        return SPECTRUM[name]
+    match = HEX_REGEX.match(name)
+    if match:
+        packed = int(match.group(1), 16)
+        return (packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF
+    parts = name.removeprefix("rgb(").removesuffix(")").replace(";", ",").split(",")
+    if len(parts) == 3 and all(part.strip().isdigit() and int(part) <= 255 for part in parts):
+        return tuple(int(part) for part in parts)  # type: ignore
+    raise ValueError(f"Unable to parse color: {value}")
+
+
+# ============================================================================ #
+#     Interpolation
+
+
+def interpolate(
+    stops: Sequence[RGB],
+    count: int,
+    start: int = 0,
+    stop: Optional[int] = None,
+    deltas: Optional[Sequence[tuple[int, int, int, int, int, int]]] = None,
+) -> list[RGB]:
+    """Blend `count` evenly spaced colors along the color stops.
+
+    Args:
+        stops (`Sequence[tuple[int,int,int]]`): The rgb color stops of the gradient.
+        count (`int`): The number of colors in the whole gradient.
+        start (`int`): The first position to generate. Defaults to 0.
+        stop (`Optional[int]`): The position to stop at. Defaults to `count`.
+        deltas (`Optional[Sequence[tuple]]`): The `(r, g, b, dr, dg, db)` of every segment, precomputed by `Palette.deltas()`. Defaults to None (computed from `stops`).
+
+    Returns:
+        `list[tuple[int,int,int]]`: The blended rgb colors from `start` to `stop`.
+    """
+    if not stops:
+        raise ValueError("Unable to interpolate a gradient without any color stops.")
+    stop = count if stop is None else min(stop, count)
+    if count <= 0 or start >= stop:
+        return []
+    segments = len(stops) - 1
+    if segments == 0 or count == 1:
+        return [tuple(stops[0])] * (stop - start)  # type: ignore
+
+    # Precompute the delta of every segment once
+    if deltas is None:
+        deltas = [
+            (r1, g1, b1, r2 - r1, g2 - g1, b2 - b1)
+            for (r1, g1, b1), (r2, g2, b2) in zip(stops, stops[1:])
+        ]
+    scale = segments / (count - 1)
+    colors = []
+    for position in range(start, stop):
+        offset = position * scale
+        segment = int(offset)
+        if segment >= segments:
+            segment = segments - 1
+        blend = offset - segment
+        r1, g1, b1, dr, dg, db = deltas[segment]
+        colors.append((int(r1 + dr * blend), int(g1 + dg * blend), int(b1 + db * blend)))
+    return colors
+
+
+# ============================================================================ #
+#     Quantization
+
+
+def quantize(
+    text: str,
+    granularity: Granularity = "char",
+    max_spans: Optional[int] = None,
+) -> list[tuple[int, int]]:
+    """Split a string into the bands that each receive a single color.
+
+    Args:
+        text (`str`): The plain text to be gradiented.
+        granularity (`str|int`): `char` for one color per character, an integer `N` for one color every `N` characters, `word` for one color per word, or `line` for one color per line. Defaults to `char`.
+        max_spans (`Optional[int]`): The maximum number of bands. Neighbouring bands are merged evenly to fit the budget. Defaults to None (unlimited).
+
+    Returns:
+        `list[tuple[int,int]]`: The `(start, end)` offsets of each band.
+    """
+    size = len(text)
+    if max_spans is not None and max_spans >= 1 and (granularity == "char" or type(granularity) is int):
+        # Fixed width bands can be merged arithmetically without building them first
+        width = 1 if granularity == "char" else granularity
+        count = -(-size // width) if width >= 1 else 0
+        if count > max_spans:
+            if metrics.enabled:
+                metrics.add("spans_coalesced", "kernel", count - max_spans)
+            return [
+                ((group * count // max_spans) * width, min(((group + 1) * count // max_spans) * width, size))
+                for group in range(max_spans)
+            ]
+
+    if granularity == "char":
+        bands = [(index, index + 1) for index in range(size)]
+    elif granularity == "word":
+        bands = [match.span() for match in WORD_REGEX.finditer(text)]
+    elif granularity == "line":
+        bands = [match.span() for match in LINE_REGEX.finditer(text)]
+    elif isinstance(granularity, int) and not isinstance(granularity, bool):
+        if granularity < 1:
+            raise ValueError(f"Invalid granularity: {granularity}. Must be at least one character.")
+        bands = [(index, min(index + granularity, size)) for index in range(0, size, granularity)]
+    else:
+        raise ValueError(
+            f"Invalid granularity: {granularity}. Valid values are 'char', 'word', 'line', or an integer."
+        )
+
+    if max_spans is not None:
+        if max_spans < 1:
+            raise ValueError(f"Invalid max_spans: {max_spans}. Must be at least one.")
+        count = len(bands)
+        if count > max_spans:
+            if metrics.enabled:
+                metrics.add("spans_coalesced", "kernel", count - max_spans)
+            bands = [
+                (bands[group * count // max_spans][0], bands[(group + 1) * count // max_spans - 1][1])
+                for group in range(max_spans)
+            ]
+    return bands
+
+
+def gradient_spans(
+    text: str,
+    stops: Sequence[RGB],
+    granularity: Granularity = "char",
+    max_spans: Optional[int] = None,
+) -> list[tuple[int, int, str]]:
+    """Generate the colored spans of a gradient.
+
+    Args:
+        text (`str`): The plain text to be gradiented.
+        stops (`Sequence[tuple[int,int,int]]`): The rgb color stops of the gradient.
+        granularity (`str|int`): See `quantize()`. Defaults to `char`.
+        max_spans (`Optional[int]`): See `quantize()`. Defaults to None.
+
+    Returns:
+        `list[tuple[int,int,str]]`: The `(start, end, hex_color)` of each span.
+    """
+    bands = quantize(text, granularity, max_spans)
+    colors = interpolate(stops, len(bands))
+    return [
+        (start, end, f"#{r:02x}{g:02x}{b:02x}")
+        for (start, end), (r, g, b) in zip(bands, colors)
+    ]
@@ -1,11 +1,13 @@
 import random
 import re
+import threading
+import zlib
 from enum import Enum
+from contextlib import contextmanager
 from functools import lru_cache, wraps
 from sys import stderr, stdout
 from typing import Optional, Tuple
 
-from loguru import logger
 from maxconsole import MaxConsole
 from rich import inspect
 from rich.align import AlignMethod
@@ -17,19 +19,82 @@ from rich.panel import Panel
 from rich.pretty import Pretty
 from rich.style import StyleType
 from rich.text import Text, TextType
-from rich.table import Table
 from rich.columns import Columns
 
 from inspect import getframeinfo, currentframe
 
-console = MaxConsole()
-logger.remove()
-# log = logger.add('stdout', level="INFO", format="<w>{time:hh:mm:ss:SSS A}</w> <lvl>|</lvl> <c>{file.name: ^13}</c> <lvl>|</lvl>  <g>Line {line: ^5}</g> <lvl>| {level: ^8}</lvl> <r>→</r> <lvl>{message}</lvl>")
-log = logger.add(
-    lambda msg: console.log(
-        f"{msg}", markup=True, highlight=True, log_locals=True, emoji=True
-    )
-)
+from maxcolor import metrics, named_colors, profiling, trace
+from maxcolor.kernel import Granularity, interpolate, quantize
+from maxcolor.palette import Palette, PaletteType, as_palette
+
+_local = threading.local()
+_console_lock = threading.Lock()
+_console: Optional[MaxConsole] = None
+
+
+def get_console() -> MaxConsole:
+    """The console used by the `test=True` traces and the demos, created on first use."""
+    global _console
+    if _console is None:
+        with _console_lock:
+            if _console is None:
+                _console = MaxConsole()
+    return _console
+
+
+@contextmanager
+def _traced(test: bool):
+    """Trace the block when `test` is set and print the events once it finishes.
+
+    Nested calls record into the trace of the outermost one, so it prints once.
+    """
+    if not test or trace.current() is not None:
+        yield
+        return
+    with trace.trace() as events:
+        yield
+    get_console().print(events, justify="center")
+
+
+def __getattr__(name: str):
+    # `console` used to be created at import time; keep it importable
+    if name == "console":
+        return get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_rng(rng: Optional[random.Random] = None, seed: Optional[int] = None) -> random.Random:
+    """The random number generator for a call.
+
+    Args:
+        rng (`Optional[random.Random]`): An explicit generator, returned as is.
+        seed (`Optional[int]`): A seed for a new generator, for reproducible colors.
+
+    Returns:
+        `random.Random`: `rng`, a new generator seeded with `seed`, or the calling thread's own generator.
+    """
+    if rng is not None:
+        return rng
+    if seed is not None:
+        return random.Random(seed)
+    thread_rng = getattr(_local, "rng", None)
+    if thread_rng is None:
+        thread_rng = _local.rng = random.Random()
+    return thread_rng
+
+
+def content_seed(message: RenderableType) -> int:
+    """A seed derived from the content of a message, stable across runs and processes.
+
+    Args:
+        message (`str|Text`): The message. Other renderables are hashed by their `str()`.
+
+    Returns:
+        `int`: The CRC-32 of the message's plain text.
+    """
+    plain = message.plain if isinstance(message, Text) else str(message)
+    return zlib.crc32(plain.encode("utf-8"))
+
 
 __version__ = "1.0.3"
 
@@ -552,128 +617,111 @@ def hex_to_rgb(hex: str) -> Tuple:
     Returns:
         rgb (tuple): The rgb color.
     """
-    if HEX_REGEX.match(hex):
-        rgb = []
-        for i in (0, 2, 4):
-            decimal = int(hex[i : i + 2], 16)
-            rgb.append(decimal)
-        return tuple(rgb)
+    if metrics.enabled:
+        metrics.add("color_parses", "hex_to_rgb")
+    match = HEX_REGEX.match(hex)
+    if match:
+        digits = match.group(1) or match.group(2)
+        return tuple(int(digits[i : i + 2], 16) for i in (0, 2, 4))
     else:
         raise InvalidHexColor(f"Invalid hex color: {hex}")
 
 
-def rgb_to_hex(rgb: Tuple[int, int, int]) -> str:
-    """Convert an rgb color to hex."""
-    r, g, b = rgb
-
-    return ("{:X}{:X}{:X}").format(r, g, b)
-
-
-def _all_colors() -> list[str]:
-    """Private function to generate a list of named colors."""
-    return [
-        "magenta",
-        "light_purple",
-        "purple",
-        "blue",
-        "light_blue",
-        "cyan",
-        "green",
-        "yellow",
-        "orange",
-        "red",
-    ]
-
-
-def _hex_colors() -> list[str]:
-    """Private function to generate a list of the HEX translations of the named colors."""
-    return [
-        "#ff00ff",
-        "#af00ff",
-        "#5f00ff",
-        "#0000ff",
-        "#249df1",
-        "#00ffff",
-        "#00ff00",
-        "#ffff00",
-        "#ff8800",
-        "#ff0000",
-    ]
-
-
-def _rgb_tuples() -> list[tuple]:
-    """Private function to generate a list of the RGB translations of the named colors."""
-    return [
-        (255, 0, 255),  # magenta
-        (175, 0, 255),  # light_purple
-        (95, 0, 255),  # purple
-        (0, 0, 255),  # blue
-        (36, 157, 241),  # light_blue
-        (0, 255, 0),  # cyan
-        (0, 255, 0),  # green
-        (255, 255, 0),  # yellow
-        (255, 128, 0),  # orange
-        (255, 0, 0),  # red
-    ]
-
-
-def random_color_index(color_stops: int = 3, random_invert: bool = False, invert: bool = False, test: bool = False) -> list[int]:
+def rgb_to_hex(rgb: Tuple[int, int, int] | int, green: Optional[int] = None, blue: Optional[int] = None) -> str:
+    """Convert an rgb color to hex.
+
+    Args:
+        rgb (`tuple[int,int,int]|int`): The rgb color, or its red channel when `green` and `blue` are given.
+        green (`Optional[int]`): The green channel. Defaults to None.
+        blue (`Optional[int]`): The blue channel. Defaults to None.
+
+    Returns:
+        `str`: The hex color, e.g. `#FF0000`.
+    """
+    r, g, b = (rgb, green, blue) if green is not None else rgb  # type: ignore
+
+    return "#{:02X}{:02X}{:02X}".format(r, g, b)
+
+
+def _all_colors() -> tuple[str, ...]:
+    """Private function to get the names of the named colors, in ring order."""
+    return named_colors.NAMES
+
+
+def _hex_colors() -> tuple[str, ...]:
+    """Private function to get the HEX translations of the named colors."""
+    return named_colors.HEX
+
+
+def _rgb_tuples() -> tuple[tuple, ...]:
+    """Private function to get the RGB translations of the named colors."""
+    return named_colors.RGB_TUPLES
+
+
+def random_color_index(
+    color_stops: int = 3,
+    random_invert: bool = False,
+    invert: bool = False,
+    test: bool = False,
+    rng: Optional[random.Random] = None,
+    seed: Optional[int] = None,
+    palette: Optional[PaletteType] = None,
+) -> list[int]:
     """Generate a random color range from the named colors.
 
     Args:
         color_stops (`int`): Then number of colors in the random gradient.
+        test (`bool`): Whether to trace the call and print its steps once it returns. Defaults to False.
+        rng (`Optional[random.Random]`): The random number generator. Defaults to the calling thread's own generator.
+        seed (`Optional[int]`): Seed a new generator instead, for reproducible colors. Defaults to None.
+        palette (`Optional[Palette]`): The palette to walk. Defaults to the spectrum.
 
     Returns:
-        `list[tuple]`: The list of rgb tuples from which to make the gradient.
+        `list[int]`: The palette indexes from which to make the gradient.
     """
-    # Initialize list of colors.
-    all_colors = _all_colors()
+    with _traced(test):
+        return _random_color_index(color_stops, random_invert, invert, rng, seed, as_palette(palette))
+
 
-    color_indexes = []
+def _random_color_index(
+    color_stops: int,
+    random_invert: bool,
+    invert: bool,
+    rng: Optional[random.Random],
+    seed: Optional[int],
+    palette: Palette,
+) -> list[int]:
+    rng = get_rng(rng, seed)
 
     # Randomly select starting color of the gradient
-    start = random.choice(all_colors) # color
-    start_index = all_colors.index(start) # color index
-    # yield start_index
-    indexes = [start_index]
+    start_index = rng.randrange(len(palette))
 
     # Whether to randomly invert gradient
     if random_invert:
-        invert = random.choice([True, False])
+        invert = rng.choice([True, False])
     else:
         invert = invert
-    if test:
-        table = Table(title="Index Start", show_lines=True, show_edge=True, border_style='bold #ff00ff', width=40)
-        table.add_column("[bold #00ffff]Key[/]", justify='left', ratio=1)
-        table.add_column("[bold #00ffff]Value[/]", justify='center', ratio=1)
-        table.add_row("Start", f"{start}")
-        table.add_row("Start_Index", f"{start_index}")
-        table.add_row("Invert Gradient", f"{invert}")
-
-        console.clear()
-        console.print('\n\n')
-        console.print(table, justify='center')
-        console.print('\n\n')
-    
-    for x in range(1,color_stops+1):
-        if invert:
-            _next_index = start_index - x
-            next_index = __validate_next_index(_next_index)
-            # yield next_index
-            indexes.append(next_index)
-        else:
-            _next_index = start_index + x
-            next_index = __validate_next_index(_next_index)
-            # yield next_index
-            indexes.append(next_index)
-        if test:
-            console.print(f"Color Range: {color_indexes}", justify='center')
+    indexes = palette.walk(start_index, color_stops + 1, invert)
+    if trace.active:
+        names = palette.names
+        trace.record("random_color_index", "inverted start" if invert else "start", start_index, names[start_index])
+        for next_index in indexes[1:]:
+            trace.record("random_color_index", "next", next_index, names[next_index])
 
     return indexes
 
 
 
-def random_color_range(range_type: str = 'rgb', color_stops: int = 3, random_invert: bool = True, invert: bool = False, test: bool = False) -> list[str|tuple]:
+def random_color_range(
+    range_type: str = 'rgb',
+    color_stops: int = 3,
+    random_invert: bool = True,
+    invert: bool = False,
+    test: bool = False,
+    rng: Optional[random.Random] = None,
+    seed: Optional[int] = None,
+    palette: Optional[PaletteType] = None,
+) -> list[str|tuple]:
     """Generate a random color range from named colors, hex colors, or rgb tuples.
 
     Args:
@@ -681,95 +729,77 @@ def random_color_range(range_type: str = 'rgb', color_stops: int = 3, random_inv
         color_stops (`int`): Then number of colors in the random gradient. Defaults to `3`.
         random_invert (`bool`): Whether or not the gradient is inverted randomly. Defaults to True.
         invert (`bool`): The direction the random gradient travels. `random_invert` must be `False` for this arg to have any function.
-        test(`bool`): Whether or not this function is being run as a test.
+        test (`bool`): Whether to trace the call and print its steps once it returns. Defaults to False.
+        rng (`Optional[random.Random]`): The random number generator. Defaults to the calling thread's own generator.
+        seed (`Optional[int]`): Seed a new generator instead, for reproducible colors. Defaults to None.
+        palette (`Optional[Palette]`): The palette to walk. Defaults to the spectrum.
 
     Returns:
         `list[str|tuple]`: The list of colors, hex colors, or rgb tuples from which to make the gradient.
     """
-    color_indexes = random_color_index(color_stops=color_stops, random_invert=random_invert, invert=invert, test=test)
-    if test:
-        console.print(f"Color Indexes: {color_indexes}")
-    
-    gradient_colors = []
-    # colors = []
-    match range_type:
-        case 'color':
-            colors = _all_colors()
-            for index in color_indexes:
-                gradient_colors.append(colors[index])
-
-            if test:
-                console.print(f"Color Range Type: {range_type}")
-                console.print(f"Colors: {', '.join(colors)}")
-    
-            return colors
+    palette = as_palette(palette)
+    with _traced(test):
+        color_indexes = random_color_index(
+            color_stops=color_stops, random_invert=random_invert, invert=invert, rng=rng, seed=seed, palette=palette
+        )
+        return _color_range(range_type, color_indexes, palette)
 
 
+def _palette_colors(palette: Palette, mode: str) -> tuple:
+    """The names, hex colors or rgb tuples of a palette."""
+    match mode:
+        case 'color':
+            return palette.names
         case 'hex':
-            colors = _hex_colors()
-            for index in color_indexes:
-                gradient_colors.append(colors[index])
-
-            if test:
-                console.print(f"Color Range Type: {range_type}")
-                console.print(f"Colors: {', '.join(colors)}")
-    
-            return colors
-
-
+            return palette.hex_colors
         case 'rgb':
-            colors = _rgb_tuples()
-            for index in color_indexes:
-                gradient_colors.append(colors[index])
+            return palette.rgb_tuples
+        case _:
+            return None
 
-            if test:
-                console.print(f"Color Range Type: {range_type}")
-                console.print(f"Colors: {', '.join(colors)}")
-    
-            return colors
-    
 
+def _color_range(range_type: str, color_indexes: list[int], palette: Palette) -> list[str|tuple]:
+    gradient_colors = []
+    colors = _palette_colors(palette, range_type)
+    if colors is None:
+        return None
+    for index in color_indexes:
+        gradient_colors.append(colors[index])
+        if trace.active:
+            trace.record("random_color_range", range_type, index, colors[index])
+    return gradient_colors
 
-def __validate_range_input(start: str, end: str, test: bool = False) -> str:
+
+def __validate_range_input(start: str, end: str, test: bool = False, palette: Optional[Palette] = None) -> str:
     """Validate the start and end color of the gradient.
 
     Args:
         start(`str`): The color with which to begin the gradient.
         end (`end`): The color with which to end the gradient.
+        palette (`Optional[Palette]`): The palette the colors must belong to. Defaults to the spectrum.
 
     Returns:
-        `bool`: Returns `True` if valid.
+        `str`: The mode of both colors: `color`, `hex` or `rgb`.
     """
-    all_colors = _all_colors()
-    hex_colors = _hex_colors()
-    rgb_tuples = _rgb_tuples()
+    palette = as_palette(palette)
 
     # Validate args
     mode1, mode2 = None, None
-    for x, _ in enumerate([start, end], start=1):
-        if x in all_colors:
-            if x == 1:
-                mode1 = "color"
-            else:
-                mode2 = "color"
-        elif x in hex_colors:
-            if x == 1:
-                mode1 = "hex"
-            else:
-                mode2 = "hex"
-        elif x in rgb_tuples:
+    for x, color in enumerate([start, end], start=1):
+        found = palette.find(color) if color is not None else None
+        if found is not None:
             if x == 1:
-                mode1 = "rgb"
+                mode1 = found[0]
             else:
-                mode2 = "rgb"
+                mode2 = found[0]
 
-        elif x == None:
+        elif color == None:
             raise ColorParseError(
                 f"Unable to make a gradient when not provided with a start and end color. \n\tStart: {start}\n\tEnd: {end}"
             )
         else:
             raise ColorParseError(
-                f"Unable to parse start color of gradient for color_range. Value: {x}"
+                f"Unable to parse start color of gradient for color_range. Value: {color}"
             )
 
     if mode1 != mode2:
@@ -777,98 +807,75 @@ def __validate_range_input(start: str, end: str, test: bool = False) -> str:
             f"Unable to correctly set mode. Mode1: {mode1}\tMode2: {mode2}\n\tStart: {start}\n\tEnd: {end}"
         )
     else:
-        if test:
-            console.print(f"Mode Determined: {mode1}")
-        
+        if trace.active:
+            trace.record("validate_range_input", "mode", None, mode1)
         return mode1
 
-def __validate_color_start_index(start_index: int, test: bool = False) -> int|None:
+def __validate_color_start_index(start_index: int, test: bool = False, size: Optional[int] = None) -> int|None:
     """Validate the index from which to start the color gradient.
 
     Args:
         start_index (`int``): The color index to validate.
-        test (`bool`, optional): Whether to display the validation. Defaults to False.
+        test (`bool`, optional): Unused; the validation is recorded whenever a trace is open. Defaults to False.
+        size (`Optional[int]`): The number of colors. Defaults to the size of the spectrum.
 
     Raises:
-        ColorParseError: `start_index` must be less than 10.
+        ColorParseError: `start_index` must be less than `size`.
         ColorParseError: `start_index` must be greater than or equal to zero.
 
     Returns:
         int|None: The validated start_index
     """
-    all_colors = _all_colors()
-    all_indexes = len(all_colors)
+    all_indexes = len(_all_colors()) if size is None else size
     if start_index > all_indexes:
         raise ColorParseError(f"Starting Index Invalid: {start_index}\n\n\tMust be less that {all_indexes}")
     elif start_index < 0:
         raise ColorParseError(f"Starting Index Invalid: {start_index}\n\n\tMust be grater than zero.")
     else:
-        if test:
-            console.print(
-                f"Validated `start_index`: {start_index}"
-            )
+        if trace.active:
+            trace.record("validate_color_start_index", "valid", start_index)
         return start_index
     
-def __validate_color_end_index(end_index: int, test: bool = False) -> int|None:
+def __validate_color_end_index(end_index: int, test: bool = False, size: Optional[int] = None) -> int|None:
     """Validate the index from which to end the color gradient.
 
     Args:
         end_index (`int``): The color index to validate.
-        test (`bool`, optional): Whether to display the validation. Defaults to False.
+        test (`bool`, optional): Unused; the validation is recorded whenever a trace is open. Defaults to False.
+        size (`Optional[int]`): The number of colors. Defaults to the size of the spectrum.
 
     Raises:
-        ColorParseError: `end_index` must be less than 10.
+        ColorParseError: `end_index` must be less than `size`.
         ColorParseError: `end_index` must be greater than or equal to zero.
 
     Returns:
         int|None: The validated end_index.
     """
-    all_indexes = len(_all_colors())
+    all_indexes = len(_all_colors()) if size is None else size
     if end_index > all_indexes:
         raise ColorParseError(f"Ending Index Invalid: {end_index}\n\n\tMust be less that {all_indexes}")
     elif end_index < 0:
         raise ColorParseError(f"Ending Index Invalid: {end_index}\n\n\tMust be grater than zero.")
     else:
-        if test:
-            console.print(
-                f"Validated `start_index`: {end_index}"
-            )
+        if trace.active:
+            trace.record("validate_color_end_index", "valid", end_index)
         return end_index
 
-def __validate_next_index(next_index: int, test:bool = False) -> int|None:
-    """Validate the next color index.
+def __validate_next_index(next_index: int, test:bool = False, size: Optional[int] = None) -> int|None:
+    """Wrap the next color index around the ring of colors.
 
     Args:
         next_index ('int'): The next color index for the color range.
-        test (`bool`, optional): Whether to print the validation to the console. Defaults to False.
+        test (`bool`, optional): Unused; the validation is recorded whenever a trace is open. Defaults to False.
+        size (`Optional[int]`): The number of colors. Defaults to the size of the spectrum.
 
     Returns:
         int|None: The valid next index.
-
-    Raises:
-        ValueError: If the next_index is greater than len(colors) or less than zero.
     """
-    all_indexes = len(_all_colors())
-    if next_index > all_indexes:
-        next_index = next_index - all_indexes
-        if test:
-            console.print(
-                f'Next Index: {next_index} Validated'
-            )
-    elif next_index < 0:
-        next_index = next_index + all_indexes
-        if test:
-            console.print(
-                f'Next Index: {next_index} Validated'
-            )
-    elif next_index in range(0,10):
-        if test:
-            console.print(
-                f'Next Index: {next_index} Validated'
-            )
-        return next_index
-    else:
-        raise ValueError(f"Invalid Next Index: {next_index}. Next Index must fall in between zero and nine.")
+    next_index %= len(_all_colors()) if size is None else size
+    if trace.active:
+        trace.record("validate_next_index", "valid", next_index)
+    return next_index
 
 
 def color_range_generator(colors: list[str|tuple], start_index: int, end_index: int, invert: bool = False, test: bool = False) -> list[int]:
@@ -879,15 +886,23 @@ def color_range_generator(colors: list[str|tuple], start_index: int, end_index:
         start_index (`int`): The index to begin the gradient with.
         end_index (`int`): Then index to end the gradient with.
         invert (`bool`): Which direction on the spectrum to travel in. Defaults to `False` (positively).
+        test (`bool`): Whether to trace the generator and print its steps once it is exhausted. Defaults to False.
 
     Returns:
         `list[int]`: The list of color indexes from which to generate a gradient.
     """
+    with _traced(test):
+        yield from _color_range_generator(colors, start_index, end_index, invert)
+
+
+def _color_range_generator(colors: list[str|tuple], start_index: int, end_index: int, invert: bool):
     # Validation
-    start_index = __validate_color_start_index(start_index, test)
-    end_index = __validate_color_end_index(end_index, test)
+    start_index = __validate_color_start_index(start_index, size=len(colors))
+    end_index = __validate_color_end_index(end_index, size=len(colors))
     
     # Start
+    if trace.active:
+        trace.record("color_range_generator", "start", start_index, colors[start_index])
     yield colors[start_index]
     
     # Determine Stop iteration conditions
@@ -910,111 +925,53 @@ def color_range_generator(colors: list[str|tuple], start_index: int, end_index:
         num_of_steps += 1 # Color Stop Count
         distance = num_of_steps * step # range inverted/not
         _next_index = start_index + distance # Possible next index
-        next_index = __validate_next_index(_next_index, test) # Validated next index
-        if test:
-            console.print(
-                Panel(
-                    f"Validated next_index: {next_index}\n\n\tNext color: {colors[next_index]}",
-                    title='[bold #00ffff]Color Range Generator[/]',
-                    title_align='left',
-                    subtitle=f"[italic #0000ff]maxcolor.py[/][bold #249df1] | [/][dim]Line 875",
-                    expand=False
-                ),
-                justify='center',
-            )
+        next_index = __validate_next_index(_next_index, size=len(colors)) # Validated next index
+        if trace.active:
+            trace.record("color_range_generator", "next", next_index, colors[next_index])
         yield colors[next_index]
-        
-
 
 
-
-def generate_color_range(start: str, end: str, invert: bool = False, test: bool = False) -> list[tuple]:
+def generate_color_range(
+    start: str, end: str, invert: bool = False, test: bool = False, palette: Optional[PaletteType] = None
+) -> list[tuple]:
     """Generate a dist of strings or tuples from the start color to the end color.
 
     Args:
         start(`str`): The color with which to start the color gradient.
         end(`str`): The color with which to end the color gradient.
+        test (`bool`): Whether to trace the call and print its steps once it returns. Defaults to False.
+        palette (`Optional[Palette]`): The palette `start` and `end` belong to. Defaults to the spectrum.
 
     Returns:
-        `dict[str:list[str|tuple]]`: A dict of the translations of the gradient to be made.
+        `list[str|tuple]`: The colors from `start` to `end`, in the same form (name, hex or rgb) as `start`.
     """
-    # Generate color lists
-    all_colors = _all_colors()
-    hex_colors = _hex_colors()
-    rgb_tuples = _rgb_tuples()
-
-    # Allocate and initialize ranges
-    color_range_indexes = []
-    color_range = []
-
-    # Mode
-    colors = []
-    mode = __validate_range_input(start,end,True)
-    match mode:
-        case "color":
-            colors = all_colors
-            if test:
-                console.print(f"Generating gradient from {mode} colors: {', '.join(colors)}")
-        case "hex":
-            colors = hex_colors
-            if test:
-                console.print(f"Generating gradient from {mode} colors: {', '.join(colors)}")
-        case "rgb":
-            colors = rgb_tuples
-            if test:
-                console.print(f"Generating gradient from {mode} colors: {', '.join(colors)}")
-        case _:
-            raise ColorParseError(
-                f"Unable to determine mode: {mode}\n\tStart: {start}\n\tEnd: {end}"
-            )
-
-    # start index
-    start_index = __validate_color_start_index(colors.index(start), True)
-    color_range_indexes.append(start_index)
-    color_range.append(colors[start_index])
+    palette = as_palette(palette)
+    with _traced(test):
+        mode, indexes = _color_range_indexes(start, end, invert, palette)
+        colors = _palette_colors(palette, mode)
+        return [colors[index] for index in indexes]
+
+
+def _color_range_indexes(start: str, end: str, invert: bool, palette: Palette) -> tuple[str, list[int]]:
+    """The mode of `start` and `end`, and the palette indexes from one to the other."""
+    mode = __validate_range_input(start, end, palette=palette)
+    colors = _palette_colors(palette, mode)
+    if colors is None:
+        raise ColorParseError(
+            f"Unable to determine mode: {mode}\n\tStart: {start}\n\tEnd: {end}"
+        )
 
-    # end index
-    end_index = colors.index(end)
+    start_index = __validate_color_start_index(palette.index(start), size=len(palette))
+    end_index = palette.index(end)
 
-    if invert:
-        end = end_index + 1
-        operator = '-'
-        condition = "x < 0"
+    # Walk the ring from the start index to the end index
+    indexes = palette.path(start_index, end_index, invert)
+    if trace.active:
+        trace.record("generate_color_range", "start", start_index, colors[start_index])
+        for next_index in indexes[1:]:
+            trace.record("generate_color_range", "next", next_index, colors[next_index])
+    return mode, indexes
 
-    # range inverted
-    if invert:
-        z = 0
-        while x != end_index + 1:  # type: ignore
-            z += 1
-            next_index = start_index - z
-            if x < 0:  # type: ignore
-                next_index += 10
-            color_range_indexes.append(next_index)
-            color_range.append(colors[next_index])
-            if test:
-                console.print(
-                    f"\n\n{z} random index: {', '.join(color_range_indexes)}\n{z} inverted colors: {', '.join(color_range)}"
-                )
-
-    # range
-    else:
-        z = 0
-        while x != end_index - 1:  # type: ignore
-            z += 1
-            next_index = start_index + z
-            if x > len(colors):  # type: ignore
-                next_index -= len(colors)
-            color_range_indexes.append(next_index)
-            color_range.append(colors[next_index])
-            if test:
-                console.print(
-                    f"\n\n{z} index: {', '.join(color_range_indexes)}\n{z} colors: {', '.join(color_range)}"
-                )
-    if test:
-        console.print(f"Finished Generating Color Range!\n\n\tInvert: {invert}\n\tColor Range: {', '.join(color_range)}"
-    )
-    
-    return color_range
 
 def _pretty_rgb(rgb: Tuple[int,int,int])-> Text:
     """Generate a colored, formatted rich.Text object from a tuple of integers.
@@ -1047,7 +1004,13 @@ def gradient(
     start: Optional[str | tuple] = None,
     end: Optional[str | tuple] = None,
     invert: bool = False,
-    test: bool = False) -> Text:
+    test: bool = False,
+    granularity: Granularity = "char",
+    max_spans: Optional[int] = None,
+    rng: Optional[random.Random] = None,
+    seed: Optional[int] = None,
+    stable: bool = False,
+    palette: Optional[PaletteType] = None) -> Text:
     """Generate a gradient text.
 
     Args:
@@ -1058,158 +1021,83 @@ def gradient(
         start (`Optional[str|tuple]`): If arg named_gradient is set to `True` start becomes a required value to start the gradient off. Valid values are {', '.join(_all_colors)}, {', '.join(_hex_colors)}, {', '.join(_rgb_tuples)}
         end (`Optional[str|tuple]`): If arg named_gradient is set to `True` end becomes a required value to end the gradient with. Valid values are {', '.join(_all_colors)}, {', '.join(_hex_colors)}, {', '.join(_rgb_tuples)}
         invert (`Optional[bool]`): Which direction to traverse the spectrum. Default to False.
-        test (`test`): Whether the function is being run to test it or not. Defaults to `False`.
+        test (`bool`): Whether to trace the color range and print its steps. Defaults to `False`.
+        granularity (`str|int`): How finely the gradient is colored: `char`, `word`, `line`, or an integer number of characters per color. Defaults to `char`.
+        max_spans (`Optional[int]`): The maximum number of colored spans. Defaults to None (unlimited).
+        rng (`Optional[random.Random]`): The random number generator. Defaults to the calling thread's own generator.
+        seed (`Optional[int]`): Seed a new generator instead, for reproducible colors. Defaults to None.
+        stable (`bool`): Seed the colors from the message itself, so the same text always gets the same gradient. Defaults to False.
+        palette (`Optional[Palette]`): The palette to take the colors from, e.g. a `Palette` or a list of colors. Defaults to the spectrum.
 
     Returns:
         Text: The gradiented text.
     """
-    all_colors = _all_colors()
-    rgb_tuples = _rgb_tuples()
+    return _gradient(
+        message, random, color_stops, justify_text, start, end, invert, test,
+        granularity, max_spans, rng, seed, stable, palette, "gradient"
+    )
 
-    # Message metadata
-    size = len(message)
-    gradient_size = size // (len(all_colors) - 1)
-    if test:
-        table = Table(show_lines=True, show_edge=True,header_style='bold italic #00ffff')
-        table.add_column("Key", justify='left')
-        table.add_column("Value", justify= 'center')
-        table.add_row()
-    gradient_text = Text()
-    text = Text(message, justify=justify_text)
 
-    # Generate Color Range
-    if not random:
-        if test:
-            console.print(f"Generating Gradient...")
-        
-        color_dict = generate_color_range(start, end, invert)
-        console.print(
-            Panel(
-                Pretty(
-                    color_dict
-                ),
-                title=GRADIENT,
-                title_align='left',
-                subtitle='Named Gradient',
-                subtitle_align='right',
-                width=80
-            ),
-            justify='center'
-        )
-        color_range = list(color_dict["rgb"])
-        color_range_indexes = color_dict["indexes"]
+def _gradient(
+    message: str | Text,
+    random_colors: bool,
+    color_stops: int,
+    justify_text: JustifyMethod,
+    start: Optional[str | tuple],
+    end: Optional[str | tuple],
+    invert: bool,
+    test: bool,
+    granularity: Granularity,
+    max_spans: Optional[int],
+    rng: Optional[random.Random],
+    seed: Optional[int],
+    stable: bool,
+    palette: Optional[PaletteType],
+    source: Optional[str]) -> Text:
+    """Generate a gradient text, counting and timing it as a call of `source` (`gradient` or `rainbow`).
+
+    With `source` None nothing is counted or timed, for a caller that counts the text as part of its own call.
+    """
+    stages = profiling.timer(source) if source and profiling.active else None
+    palette = as_palette(palette)
+    if isinstance(message, Text):
+        text = message.copy()
+        text.justify = justify_text
     else:
-        console.print(f"Generating Random Gradient")
-        color_dict = random_color_range(color_stops)
-        rgb_strings = Text()
-        for rgb in color_dict['rgb']:
-            rgb_text = _pretty_rgb(tuple(rgb))
-            rgb_strings.assemble(rgb_strings, rgb_text)
-        indexes = Text()
-        for index in color_dict['indexes']:
-            sub_string = f"{index:^3}"
-            indexes = Text.assemble(indexes, sub_string)
-        # log_group = Columns(
-        #     Panel(
-        #         ",\n".join(color_dict["colors"]),
-        #         title=f"[bold][#ff0000]C[/][#ff9100]o[/][#fffb00]l[/][#00ff00]o[/][#00ffff]r[/][#0000ff]s[/][/bold]",
-        #         expand=False,
-        #         subtitle=f"[italic][#ff0000]L[/][#ff9100]in[/][#fffb00]e[/][#00ff00] 8[/][#00ffff]#5[/][#0000ff]45[/][/italic]",
-        #         border_style="bold bright_white"
-        #     ),
-        #     Panel(
-        #         rgb_strings,
-        #         title=f"[bold][#ff0000]R[/][#ff9100]G[/][#fffb00]B[/][#00ff00] Co[/][#00ffff]lo[/][#0000ff]rs[/][/bold]",
-        #         expand=False,
-        #         subtitle=f"[italic][#ff0000]L[/][#ff9100]in[/][#fffb00]e[/][#00ff00] 8[/][#00ffff]5[/][#0000ff]1[/][/italic]"
-        #     ),
-        #     Panel(
-        #         indexes,
-        #         title=f"[bold][#ff0000]I[/][#ff9100]n[/][#fffb00]d[/][#00ff00]e[/][#00ffff]x[/][#0000ff]es[/][/bold]",
-        #         expand=False,
-        #         subtitle=f"[bold][#ff0000]L[/][#ff9100]in[/][#fffb00]e[/][#00ff00] 8[/][#00ffff]5[/][#0000ff]7[/][/bold]"
-        #     )
-        # )
-        # console.print(
-        #     Panel(
-        #         log_group,
-        #         title=GRADIENT,
-        #         title_align='left',
-        #         subtitle='Random Gradient',
-        #         subtitle_align='right',
-        #         width=80
-        #     ),
-        #     justify='center'
-        # )
-        color_range = list(color_dict["rgb"])
-        color_range_indexes = color_dict["indexes"]
-
-    # Generate substrings
-    for index, rgb in enumerate(color_range):
-
-        # Get substring
-        begin = index * gradient_size
-        finish = begin + gradient_size
-        sub_string = text[begin:finish]
-
-        if index < len(color_range):
-            # Color1
-            color1_range_index = color_range.index(
-                rgb
-            )  # determines the position in the color_range
-            color1 = tuple(rgb)  # Retrieves that color from the color_range
-            if color1 != None:  # Ensures retrieved color is not `None`
-                (
-                    r1,
-                    b1,
-                    g1,
-                ) = color1  # Parses the red, blue, and green components from the rgb tuple
-            else:
-                raise ColorParseError(
-                    f"Unable to parse color1: {color1}\n\tcolor_range_idex: {index}\n\tColor Range: {', '.join(color_range)}"
-                )
-
-            # Color2
-            try:
-                color2_range_index = (color1_range_index + 1)  # Determines the next color's index in the color_range
-                color2 = tuple(color_range[color2_range_index])
-            except IndexError as ie:
-                rgb_range_index = rgb_tuples.index(color1)
-                if invert:
-                    color2 = tuple(rgb_tuples[rgb_range_index-1])
-                else:
-                    color2 = tuple(rgb_tuples[rgb_range_index+1])
-                    
-            if color2 != None:  # Ensures retrieved color is not `None`
-                (
-                    r2,
-                    b2,
-                    g2,
-                ) = color2  # Parses the red, blue, and green components from the next rgb tuple
-            else:
-                raise ColorParseError(
-                    f"Unable to parse color2: {color2}\n\tcolor_range_idex: {index}\n\tColor Range: {', '.join(color_range)}"
-                )
+        text = Text(message, justify=justify_text)
 
-            # Color Delta
-            dr = r2 - r1
-            dg = g2 - g1
-            db = b2 - b1
+    if stable and rng is None and seed is None:
+        seed = content_seed(text)
 
-        # Blend Color1 & Color2 and apple style to substring
-        for index in range(gradient_size):
-            blend = index / gradient_size
-            color = f"#{int(r1 + dr * blend):02X}{int(g1 + dg * blend):02X}{int(b1 + db * blend):02X}"  # type: ignore
-            sub_string.stylize(color, index, index + 1)
-
-        # Concatenate the styled substring
-        gradient_text = Text.assemble(gradient_text, sub_string, justify=justify_text)
-
-    return gradient_text
+    # Generate Color Range
+    with _traced(test):
+        if not random_colors:
+            indexes = _color_range_indexes(start, end, invert, palette)[1]
+        else:
+            indexes = random_color_index(color_stops, random_invert=True, rng=rng, seed=seed, palette=palette)
+    if stages:
+        stages.lap("stops")
+
+    # Blend one color per quantized band
+    bands = quantize(text.plain, granularity, max_spans)
+    colors = interpolate(palette.stops(indexes), len(bands), deltas=palette.deltas(indexes))
+    if stages:
+        stages.lap("interpolation")
+    styles = [f"#{r:02x}{g:02x}{b:02x}" for r, g, b in colors]
+    if stages:
+        stages.lap("styles")
+    for (begin, finish), style in zip(bands, styles):
+        text.stylize(style, begin, finish)
+    if stages:
+        stages.lap("text")
+
+    if source and metrics.enabled:
+        metrics.record(source, chars=len(text.plain), spans_created=len(bands))
+    return text
 
 
 if __name__ == "__main__":
-    console.print(
+    get_console().print(
         gradient(
             "Ad tempor dolore laborum aute. Excepteur do aliquip ex qui sit qui. Incididunt ea sit id excepteur duis dolore. Ipsum velit occaecat ut sint commodo ea ex. Culpa duis officia tempor ipsum reprehenderit veniam duis ullamco est non adipisicing mollit consequat excepteur. Anim cillum deserunt aliquip eiusmod tempor dolore voluptate aute in aliqua nisi proident. Sit culpa id ea in. Ad tempor dolore laborum aute. Excepteur do aliquip ex qui sit qui. Incididunt ea sit id excepteur duis dolore. Ipsum velit occaecat ut sint commodo ea ex. Culpa duis officia tempor ipsum reprehenderit veniam duis ullamco est non adipisicing mollit consequat excepteur. Anim cillum deserunt aliquip eiusmod tempor dolore voluptate aute in aliqua nisi proident. Sit culpa id ea in. Ad tempor dolore laborum aute. Excepteur do aliquip ex qui sit qui. Incididunt ea sit id excepteur duis dolore. Ipsum velit occaecat ut sint commodo ea ex. Culpa duis officia tempor ipsum reprehenderit veniam duis ullamco est non adipisicing mollit consequat excepteur. Anim cillum deserunt aliquip eiusmod tempor dolore voluptate aute in aliqua nisi proident. Sit culpa id ea in.\nn\Ad sint sit laborum laborum ipsum dolor mollit occaecat elit sit id nostrud nostrud. Esse sit incididunt officia amet. Veniam adipisicing ipsum laboris nisi laborum amet. Eiusmod elit enim qui in ea aute commodo officia ea id duis do. Culpa laborum do sint ut occaecat esse voluptate. Id elit proident consequat magna et. Velit nisi commodo non ut dolor dolore aliqua. Ipsum voluptate aliquip ipsum."
         )
@@ -1265,30 +1153,27 @@ def not_gradient(
     message: str | Text,
     num_of_gradients: int = 3,
     justify: Optional[JustifyMethod] = "left",
+    rng: Optional[random.Random] = None,
+    seed: Optional[int] = None,
+    stable: bool = False,
+    palette: Optional[PaletteType] = None,
 ) -> Text:
     """Generate a gradient text.
     Args:
         message (str): The message to be gradiented.
         num_of_gradients (int, optional): The number of gradients to use. Defaults to 3.
         justify (Optional[JustifyMethod], optional): The justification of the text. Defaults to "left".
+        rng (Optional[random.Random], optional): The random number generator. Defaults to the calling thread's own generator.
+        seed (Optional[int], optional): Seed a new generator instead, for reproducible colors. Defaults to None.
+        stable (bool, optional): Seed the colors from the message itself, so the same text always gets the same gradient. Defaults to False.
+        palette (Optional[Palette], optional): The palette to take the colors from. Defaults to the spectrum.
     Returns:
         Text: The gradiented text.
     """
-    all_colors = [
-        "#ff00ff",
-        "#af00ff",
-        "#5f00ff",
-        "#0000ff",
-        "#249df1",
-        "#00ffff",
-        "#00ff00",
-        "#ffff00",
-        "#ff8800",
-        "#ff0000",
-    ]
-    if num_of_gradients > len(all_colors):
+    palette = as_palette(palette)
+    if num_of_gradients > len(palette):
         raise ValueError(
-            f"Number of gradients must be less than or equal to {len(all_colors)}."
+            f"Number of gradients must be less than or equal to {len(palette)}."
         )
     # Set Justification Method for Tet
     text = Text(message, justify=justify)  # type: ignore
@@ -1296,24 +1181,12 @@ def not_gradient(
     size = len(message)
 
     # , Select starting color
-    color = random.choice(all_colors)
-    chosen_index = all_colors.index(color)  # Get index of chosen color
-    color_indexes = [chosen_index]  # Add chosen index to list of indexes
-    # console.log(f"Chosen Index: {chosen_index}")  # Log chosen index
-
-    # , Get the indexes of the other colors
-    for i in range(1, num_of_gradients + 1):
-        next_index = chosen_index + i
-        if next_index > len(all_colors):
-            next_index = next_index - len(all_colors)
-        color_indexes.append(next_index)  # type: ignore
-    # console.log(f"Color Indexes: {color_indexes}")
-
-    # , Get the colors for the gradient
-    color_range = []  # type: ignore
-    for x, i in enumerate(color_indexes):
-        next_color = all_colors[i - 1]
-        color_range.append(next_color)
+    if stable and rng is None and seed is None:
+        seed = content_seed(message)
+    chosen_index = get_rng(rng, seed).randrange(len(palette))
+
+    # , Get the colors for the gradient, starting from the color before the chosen one
+    color_range = [palette.hex_colors[index] for index in palette.walk(chosen_index - 1, num_of_gradients + 1)]
 
     # Determine the size of the gradient
     gradient_size = size // (num_of_gradients - 1)
@@ -1348,18 +1221,52 @@ def not_gradient(
 
         gradient_text = Text.assemble(gradient_text, sub_string, justify=justify)
 
+    if metrics.enabled:
+        metrics.record("not_gradient", chars=size, spans_created=len(gradient_text.spans))
     return gradient_text
 
 
-def rainbow(message: str, justify: JustifyMethod = "left") -> Text:
+def rainbow(
+    message: str,
+    justify: JustifyMethod = "left",
+    granularity: Granularity = "char",
+    max_spans: Optional[int] = None,
+    rng: Optional[random.Random] = None,
+    seed: Optional[int] = None,
+    stable: bool = False,
+    palette: Optional[PaletteType] = None,
+) -> Text:
     """Generate a rainbow text.
     Args:
         message (str): The message to be rainbowed.
         justify (JustifyMethod, optional): The justification method. Defaults to "left".
+        granularity (Granularity, optional): `char`, `word`, `line`, or an integer number of characters per color. Defaults to "char".
+        max_spans (Optional[int], optional): The maximum number of colored spans. Defaults to None.
+        rng (Optional[random.Random], optional): The random number generator. Defaults to the calling thread's own generator.
+        seed (Optional[int], optional): Seed a new generator instead, for reproducible colors. Defaults to None.
+        stable (bool, optional): Seed the colors from the message itself, so the same text always gets the same rainbow. Defaults to False.
+        palette (Optional[Palette], optional): The palette to take the colors from. Defaults to the spectrum.
     Returns:
         Text: The rainbowed text.
     """
-    return gradient(message, num_of_gradients=10, justify=justify)
+    palette = as_palette(palette)
+    return _gradient(
+        message,
+        random_colors=True,
+        color_stops=len(palette) - 1,
+        justify_text=justify,
+        start=None,
+        end=None,
+        invert=False,
+        test=False,
+        granularity=granularity,
+        max_spans=max_spans,
+        rng=rng,
+        seed=seed,
+        stable=stable,
+        palette=palette,
+        source="rainbow",
+    )
 
 
 def gradient_panel(
@@ -1377,6 +1284,12 @@ def gradient_panel(
     padding: PaddingDimensions = (0, 1),
     num_of_gradients: int = 3,
     justify_text: JustifyMethod = "left",
+    granularity: Granularity = "char",
+    max_spans: Optional[int] = None,
+    rng: Optional[random.Random] = None,
+    seed: Optional[int] = None,
+    stable: bool = False,
+    palette: Optional[PaletteType] = None,
 ) -> Panel:
     """
     Generate a gradient panel.
@@ -1394,85 +1307,62 @@ def gradient_panel(
         padding (PaddingDimensions, optional): The padding of the panel. Defaults to (0, 1).
         num_of_gradients (int, optional): The number of gradients to use. Defaults to 3.
         justify_text (JustifyMethod, optional): The justification method. Defaults to "left".
+        granularity (Granularity, optional): `char`, `word`, `line`, or an integer number of characters per color. Defaults to "char".
+        max_spans (Optional[int], optional): The maximum number of colored spans. Defaults to None.
+        rng (Optional[random.Random], optional): The random number generator. Defaults to the calling thread's own generator.
+        seed (Optional[int], optional): Seed a new generator instead, for reproducible colors. The title and the text draw from the same generator. Defaults to None.
+        stable (bool, optional): Seed the colors from the message and title, so the same panel always gets the same gradient. Defaults to False.
+        palette (Optional[Palette], optional): The palette to take the colors of the text and title from. Defaults to the spectrum.
     Returns:
         Panel: The gradiented panel.
     """
-    all_colors = [
-        "#ff00ff",
-        "#af00ff",
-        "#5f00ff",
-        "#0000ff",
-        "#249df1",
-        "#00ffff",
-        "#00ff00",
-        "#ffff00",
-        "#ff8800",
-        "#ff0000",
-    ]
-    if num_of_gradients > len(all_colors):
+    stages = profiling.timer("gradient_panel") if profiling.active else None
+    palette = as_palette(palette)
+    if num_of_gradients > len(palette):
         raise ValueError(
-            f"Number of gradients must be less than or equal to {len(all_colors)}."
+            f"Number of gradients must be less than or equal to {len(palette)}."
         )
     # Set Justification Method for Tet
     text = Text(message, justify=justify_text)  # type: ignore
-    # Get the length of the message
-    size = len(text)
 
     # , Select starting color
-    color = random.choice(all_colors)
-    chosen_index = all_colors.index(color)  # Get index of chosen color
-    color_indexes = [chosen_index]  # Add chosen index to list of indexes
-    # console.log(f"Chosen Index: {chosen_index}")  # Log chosen index
-
-    # , Get the indexes of the other colors
-    for i in range(1, num_of_gradients + 1):
-        next_index = chosen_index + i
-        if next_index > len(all_colors):
-            next_index = next_index - len(all_colors)
-        color_indexes.append(next_index)  # type: ignore
-    # console.log(f"Color Indexes: {color_indexes}")
-
-    # , Get the colors for the gradient
-    color_range = []  # type: ignore
-    for x, i in enumerate(color_indexes):
-        next_color = all_colors[i - 1]
-        color_range.append(next_color)
-
-    # Determine the size of the gradient
-    gradient_size = size // (num_of_gradients - 1)
-    gradient_text = Text()
-
-    # , Determine the substring for each gradient
-    for index in range(0, num_of_gradients):
-        begin = index * gradient_size
-        end = begin + gradient_size
-        sub_string = text[begin:end]
-
-        if index < num_of_gradients:
-            color1 = Color.parse(color_range[index])
-            color1_triplet = color1.triplet
-            r1 = color1_triplet[0]  # type: ignore
-            g1 = color1_triplet[1]  # type: ignore
-            b1 = color1_triplet[2]  # type: ignore
-            color2 = Color.parse(color_range[index + 1])
-            color2_triplet = color2.triplet
-            r2 = color2_triplet[0]  # type: ignore
-            g2 = color2_triplet[1]  # type: ignore
-            b2 = color2_triplet[2]  # type: ignore
-            dr = r2 - r1
-            dg = g2 - g1
-            db = b2 - b1
-
-        # Apply the gradient to each character
-        for index in range(gradient_size):
-            blend = index / gradient_size
-            color = f"#{int(r1 + dr * blend):02X}{int(g1 + dg * blend):02X}{int(b1 + db * blend):02X}"  # type: ignore
-            sub_string.stylize(color, index, index + 1)
-
-        gradient_text = Text.assemble(gradient_text, sub_string, tab_size=4, justify=justify_text)  # type: ignore
+    if stable and rng is None and seed is None:
+        seed = content_seed(f"{title}\n{text.plain}")
+    rng = get_rng(rng, seed)
+    chosen_index = rng.randrange(len(palette))
+
+    # , Get the stops for the gradient, starting from the color before the chosen one
+    indexes = palette.walk(chosen_index - 1, num_of_gradients + 1)
+    if stages:
+        stages.lap("stops")
+
+    # , Blend one color per quantized band
+    bands = quantize(text.plain, granularity, max_spans)
+    colors = interpolate(palette.stops(indexes), len(bands), deltas=palette.deltas(indexes))
+    if stages:
+        stages.lap("interpolation")
+    styles = [f"#{r:02x}{g:02x}{b:02x}" for r, g, b in colors]
+    if stages:
+        stages.lap("styles")
+    gradient_text = text
+    for (begin, finish), style in zip(bands, styles):
+        gradient_text.stylize(style, begin, finish)
+    if stages:
+        stages.lap("text")
 
     if gradient_title:
-        panel_title = gradient(f"{title}")
+        # Counted and timed as part of the panel, not as a gradient() call of its own
+        panel_title = _gradient(
+            f"{title}", True, 3, "left", None, None, False, False, "char", None, rng, None, False, palette, None
+        )
+        if metrics.enabled:
+            metrics.record(
+                "gradient_panel",
+                chars=len(text.plain) + len(panel_title.plain),
+                spans_created=len(bands) + len(panel_title.spans),
+            )
+        if stages:
+            stages.lap("title")
 
         gradient_panel = Panel(
             gradient_text,
@@ -1487,8 +1377,12 @@ def gradient_panel(
             height=height,
             padding=padding,
         )
+        if stages:
+            stages.lap("panel")
         return gradient_panel
     else:
+        if metrics.enabled:
+            metrics.record("gradient_panel", chars=len(text.plain), spans_created=len(bands))
         gradient_panel = Panel(
             gradient_text,
             box=box,
@@ -1502,12 +1396,14 @@ def gradient_panel(
             height=height,
             padding=padding,
         )
+        if stages:
+            stages.lap("panel")
         return gradient_panel
 
 
 def gradient_panel_demo():
     text = "\tEnim tempor veniam proident. Reprehenderit deserunt do duis laboris laborum consectetur fugiat deserunt officia officia eu consequat. Aute sint occaecat adipisicing eu aute. Eu est laborum enim deserunt fugiat nostrud officia do ad cupidatat enim amet cillum amet. Consectetur occaecat ex quis irure cupidatat amet occaecat ad sit adipisicing pariatur est velit mollit voluptate. Eiusmod deserunt nisi voluptate irure. Sunt irure consectetur veniam dolore elit officia et in labore esse esse cupidatat labore. Fugiat enim irure ipsum eiusmod consequat irure commodo cillum.\n\n\tReprehenderit ea quis aliqua qui labore enim consequat ea nostrud voluptate amet reprehenderit consequat sunt. Ad est occaecat mollit qui sit enim do esse aute sint nulla sint laborum. Voluptate veniam ut Lorem eiusmod id veniam amet ipsum labore incididunt. Ex in consequat voluptate mollit nisi incididunt pariatur ipsum ut eiusmod ut cupidatat elit. Eu irure est ad nulla exercitation. Esse elit tempor reprehenderit ipsum eu officia sint.\n\n\tCupidatat officia incididunt cupidatat minim fugiat sit exercitation ullamco occaecat est officia ut occaecat labore. Id consectetur cupidatat amet aute. Pariatur nostrud enim reprehenderit aliqua. Elit deserunt excepteur aute aliquip."
-    console.print("\n\n")
+    get_console().print("\n\n")
     wide_panel = gradient_panel(
         text,
         title="Hello World",
@@ -1525,8 +1421,8 @@ def gradient_panel_demo():
         subtitle="[white]Optional Subtitle (one the left)[/]",
         subtitle_align="left",
     )
-    console.print("\n\n")
-    console.print(left_panel, justify="left")
+    get_console().print("\n\n")
+    get_console().print(left_panel, justify="left")
     right_panel = gradient_panel(
         text,
         title="Wide Right Adjusted Title",
@@ -1536,8 +1432,8 @@ def gradient_panel_demo():
         expand=True,
         justify_text="right",
     )
-    console.print("\n\n")
-    console.print(right_panel, justify="right")
+    get_console().print("\n\n")
+    get_console().print(right_panel, justify="right")
     center_panel = gradient_panel(
         text,
         title="[bold bright_white]Thin Centered Adjusted Title[/]",
@@ -1548,8 +1444,8 @@ def gradient_panel_demo():
         subtitle="[italic bright_white]The cake is a lie.[/]",
         subtitle_align="right",
     )
-    console.print("\n\n")
-    console.print(center_panel, justify="center")
+    get_console().print("\n\n")
+    get_console().print(center_panel, justify="center")
 
     # text1 = "While the text is definitely gradient, the title doesn't have to be "
     # gradient_word = gradient("Gradient")
@@ -1563,18 +1459,18 @@ def gradient_panel_demo():
 
 
 def demo():
-    console.print("\n\n")
-    console.print(gradient("Hello World", 4, "center"), justify="center")
+    get_console().print("\n\n")
+    get_console().print(gradient("Hello World", 4, "center"), justify="center")
 
-    console.print("\n\n")
+    get_console().print("\n\n")
 
-    console.print(
+    get_console().print(
         gradient(
             "Sunt sit est labore elit ut laboris est. Aute cupidatat sit officia deserunt sint adipisicing et minim aliqua enim. Tempor eiusmod dolore excepteur dolore id aliquip enim incididunt ex. Non ipsum eu cillum proident ex. Officia deserunt consequat adipisicing est eiusmod nisi tempor aliquip proident ut in sunt nisi ullamco.\n\n"
         )
     )
 
-    console.print(
+    get_console().print(
         rainbow(
             "Sunt sit est labore elit ut laboris est. Aute cupidatat sit officia deserunt sint adipisicing et minim aliqua enim. Tempor eiusmod dolore excepteur dolore id aliquip enim incididunt ex. Non ipsum eu cillum proident ex. Officia deserunt consequat adipisicing est eiusmod nisi tempor aliquip proident ut in sunt nisi ullamco.\n\n"
         ),
@@ -0,0 +1,155 @@
+"""Runtime counters for the gradient pipeline.
+
+Metrics are off by default. Instrumented code checks the module level
+`enabled` flag before touching a counter, so when they are off the cost is one
+attribute lookup per call:
+
+    >>> from maxcolor import metrics
+    >>> metrics.enable()
+    >>> gradient("Hello")
+    >>> metrics.snapshot()["spans_created"]
+    {'gradient': 5}
+    >>> print(metrics.prometheus())
+
+Each thread counts into its own dict, so recording takes no lock. A snapshot
+adds up the dicts of every thread, including threads that have finished.
+"""
+import threading
+from typing import Optional
+
+# Counter name and help text, in export order
+COUNTERS = {
+    "calls": "Calls of each entry point.",
+    "chars": "Characters of text colored.",
+    "spans_created": "Colored spans created.",
+    "spans_coalesced": "Spans merged into their neighbours to fit a span budget.",
+    "style_cache_hits": "Style and color lookups answered from a cache.",
+    "style_cache_misses": "Style and color lookups that had to be computed.",
+    "output_bytes": "Bytes of ANSI output encoded.",
+    "color_parses": "Colors parsed from names, hex or rgb strings.",
+}
+
+enabled = False
+
+_local = threading.local()
+_lock = threading.Lock()
+# (thread, counters) of every thread that has recorded, and the totals of finished threads
+_threads: list[tuple[threading.Thread, dict]] = []
+_finished: dict[tuple[str, str], int] = {}
+
+
+def enable() -> None:
+    """Start counting."""
+    global enabled
+    enabled = True
+
+
+def disable() -> None:
+    """Stop counting. The counts so far are kept."""
+    global enabled
+    enabled = False
+
+
+def _counters() -> dict:
+    try:
+        return _local.counters
+    except AttributeError:
+        counters = _local.counters = {}
+        with _lock:
+            _threads.append((threading.current_thread(), counters))
+        return counters
+
+
+def add(counter: str, source: str, amount: int = 1) -> None:
+    """Add to a counter of the calling thread.
+
+    Args:
+        counter (`str`): One of `COUNTERS`.
+        source (`str`): The code path counting, e.g. `gradient` or `encoder`. Exported as the `source` label.
+        amount (`int`): The amount to add. Defaults to 1.
+    """
+    if not enabled:
+        return
+    counters = _counters()
+    key = (counter, source)
+    counters[key] = counters.get(key, 0) + amount
+
+
+def record(source: str, **amounts: int) -> None:
+    """Count one call of an entry point, and add to other counters.
+
+    Example:
+        >>> if metrics.enabled:
+        ...     metrics.record("gradient", chars=len(plain), spans_created=len(spans))
+    """
+    if not enabled:
+        return
+    counters = _counters()
+    key = ("calls", source)
+    counters[key] = counters.get(key, 0) + 1
+    for counter, amount in amounts.items():
+        key = (counter, source)
+        counters[key] = counters.get(key, 0) + amount
+
+
+def _totals() -> dict[tuple[str, str], int]:
+    with _lock:
+        totals = dict(_finished)
+        alive = []
+        for thread, counters in _threads:
+            # Copying a dict is atomic under the GIL, so the owner can keep counting
+            for key, value in dict(counters).items():
+                totals[key] = totals.get(key, 0) + value
+            if thread.is_alive():
+                alive.append((thread, counters))
+            else:
+                for key, value in counters.items():
+                    _finished[key] = _finished.get(key, 0) + value
+        _threads[:] = alive
+    return totals
+
+
+def snapshot() -> dict[str, dict[str, int]]:
+    """The counts of all threads so far.
+
+    Returns:
+        `dict[str, dict[str, int]]`: The count of each source, by counter.
+    """
+    result: dict[str, dict[str, int]] = {}
+    for (counter, source), value in sorted(_totals().items()):
+        result.setdefault(counter, {})[source] = value
+    return result
+
+
+def reset() -> None:
+    """Set every counter of every thread back to zero."""
+    with _lock:
+        _finished.clear()
+        for _, counters in _threads:
+            counters.clear()
+
+
+def prometheus(prefix: str = "maxcolor") -> str:
+    """The counts in the Prometheus text exposition format.
+
+    Args:
+        prefix (`str`): The prefix of every metric name. Defaults to `maxcolor`.
+
+    Returns:
+        `str`: One `counter` metric per counter, e.g. `maxcolor_calls_total{source="gradient"} 3`.
+    """
+    counts = snapshot()
+    lines = []
+    for counter, description in COUNTERS.items():
+        name = f"{prefix}_{counter}_total"
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} counter")
+        for source, value in counts.get(counter, {}).items():
+            lines.append(f'{name}{{source="{source}"}} {value}')
+    return "\n".join(lines) + "\n"
+
+
+def get(counter: str, source: Optional[str] = None) -> int:
+    """The count of one counter, for one source or summed over all of them."""
+    counts = snapshot().get(counter, {})
+    return counts.get(source, 0) if source is not None else sum(counts.values())
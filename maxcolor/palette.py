@@ -0,0 +1,316 @@
+"""Palettes: rings of color stops that gradients walk around.
+
+The spectrum is the default palette. A `Palette` holds any number of colors
+as packed `0xRRGGBB` integers in a private `array('I')`, exposed as a
+read-only `memoryview`, and every walk around the ring is modular arithmetic
+over precomputed tables, so each lookup is O(1) whatever the palette's size:
+
+    >>> from maxcolor.palette import Palette
+    >>> brand = Palette(["#0b1f3a", "#1565c0", "#00b8d4", "#ffd600"], name="brand")
+    >>> brand.path(3, 1)           # forwards around the ring
+    [3, 0, 1]
+    >>> brand.hex(brand.next(3))
+    '#0b1f3a'
+    >>> gradient("Hello", palette=brand)
+
+A palette is also a sequence of rgb tuples, so it can be passed anywhere that
+takes color `stops`, e.g. `GradientSpec`, `Colormap` or `StreamColorizer`.
+"""
+from array import array
+from typing import Iterable, Iterator, Optional, Sequence
+
+from maxcolor import named_colors
+from maxcolor.kernel import RGB, parse_color
+
+# (r, g, b, dr, dg, db): a stop and the change to the next stop of a walk, as used by `interpolate()`
+Delta = tuple[int, int, int, int, int, int]
+
+
+class Palette:
+    """An immutable ring of colors."""
+
+    __slots__ = (
+        "name",
+        "names",
+        "hex_colors",
+        "rgb_tuples",
+        "_colors",
+        "_hash",
+        "_indexes",
+        "_forward",
+        "_backward",
+        "_deltas",
+    )
+
+    name: str
+    names: tuple[str, ...]
+    hex_colors: tuple[str, ...]
+    rgb_tuples: tuple[RGB, ...]
+    _deltas: tuple[tuple[Delta, ...], tuple[Delta, ...]]
+
+    def __init__(
+        self,
+        colors: Iterable[RGB | str | int],
+        names: Optional[Sequence[str]] = None,
+        name: str = "custom",
+    ):
+        """Build a palette and its lookup tables.
+
+        Args:
+            colors (`Iterable[tuple[int,int,int]|str|int]`): The colors in ring order: rgb tuples, spectrum names, `#rrggbb` or `r,g,b` strings, or packed `0xRRGGBB` integers.
+            names (`Optional[Sequence[str]]`): A name for each color. Defaults to None (colors are named by their hex).
+            name (`str`): The name of the palette. Defaults to `custom`.
+        """
+        packed = array("I")
+        for color in colors:
+            if isinstance(color, int):
+                if not 0 <= color <= 0xFFFFFF:
+                    raise ValueError(f"Invalid packed color: {color:#x}. Must be between 0x000000 and 0xffffff.")
+                packed.append(color)
+            else:
+                red, green, blue = parse_color(color)
+                packed.append((red << 16) | (green << 8) | blue)
+        self._setup(packed, names, name)
+
+    @classmethod
+    def from_tables(
+        cls,
+        colors: array,
+        names: Optional[Sequence[str]],
+        name: str,
+        forward: array,
+        backward: array,
+        deltas: array,
+    ) -> "Palette":
+        """Rebuild a palette from its packed colors and the tables of `tables()`, without parsing or recomputing them.
+
+        The palette keeps the arrays given, so they mustn't be changed afterwards.
+        """
+        palette = cls.__new__(cls)
+        if not isinstance(colors, array):
+            colors = array("I", colors)
+        size = len(colors)
+        if (
+            len(forward) != 2 * size
+            or len(backward) != 2 * size
+            or len(deltas) != 12 * size
+            or max(forward, default=0) >= size
+            or max(backward, default=0) >= size
+        ):
+            raise ValueError(f"Invalid palette tables for {size} colors.")
+        rows = tuple(zip(*[iter(deltas.tolist())] * 6))
+        palette._setup(colors, names, name, forward, backward, (rows[:size], rows[size:]))
+        return palette
+
+    def _setup(
+        self,
+        packed: array,
+        names: Optional[Sequence[str]],
+        name: str,
+        forward: Optional[array] = None,
+        backward: Optional[array] = None,
+        deltas: Optional[tuple] = None,
+    ) -> None:
+        size = len(packed)
+        if size < 2:
+            raise ValueError(f"Invalid palette: {size} colors. A palette needs at least two colors.")
+        if names is not None and len(names) != size:
+            raise ValueError(f"Invalid names: {len(names)} names for {size} colors.")
+        set_field = object.__setattr__
+        set_field(self, "name", name)
+        set_field(self, "_colors", packed)
+        set_field(self, "rgb_tuples", tuple(((color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF) for color in packed))
+        set_field(self, "hex_colors", tuple(f"#{color:06x}" for color in packed))
+        set_field(self, "names", self.hex_colors if names is None else tuple(names))
+        set_field(self, "_hash", hash((packed.tobytes(), self.names)))
+
+        # Built by the first lookup, as loading a palette shouldn't pay for a dict it may never use
+        set_field(self, "_indexes", None)
+
+        # Path tables: two laps of the ring in each direction, so a walk of up to `size` stops is one slice
+        if forward is None:
+            forward = array("H", [*range(size), *range(size)])
+        if backward is None:
+            backward = array("H", [*range(size - 1, -1, -1), *range(size - 1, -1, -1)])
+        set_field(self, "_forward", forward)
+        set_field(self, "_backward", backward)
+
+        # The delta from each stop to its next and to its previous stop
+        if deltas is None:
+            rgb = self.rgb_tuples
+            deltas = tuple(
+                tuple(
+                    (r1, g1, b1, r2 - r1, g2 - g1, b2 - b1)
+                    for (r1, g1, b1), (r2, g2, b2) in zip(rgb, rgb[step:] + rgb[:step])
+                )
+                for step in (1, -1)
+            )
+        set_field(self, "_deltas", deltas)
+
+    @property
+    def colors(self) -> memoryview:
+        """The packed `0xRRGGBB` colors, read-only."""
+        return memoryview(self._colors).toreadonly()
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable.")
+
+    def __reduce__(self):
+        return self.__class__, (self._colors, None if self.names is self.hex_colors else self.names, self.name)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.name!r}, {len(self._colors)} colors)"
+
+    def __len__(self) -> int:
+        return len(self._colors)
+
+    def __getitem__(self, index: int) -> RGB:
+        return self.rgb_tuples[index]
+
+    def __iter__(self) -> Iterator[RGB]:
+        return iter(self.rgb_tuples)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Palette) and self._colors == other._colors and self.names == other.names
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def tables(self) -> tuple[array, array, array]:
+        """The forward and backward path tables (`array('H')`) and the deltas of both directions (`array('h')`)."""
+        forward, backward = self._deltas
+        return self._forward, self._backward, array("h", [value for row in (*forward, *backward) for value in row])
+
+    # ============================================================================ #
+    #     Lookups
+
+    def find(self, color: RGB | str) -> Optional[tuple[str, int]]:
+        """The kind of a color (`color` for a name, `hex` or `rgb`) and its index, or None if it isn't in the palette."""
+        indexes = self._indexes
+        if indexes is None:
+            indexes = self._build_indexes()
+        if isinstance(color, list):
+            color = tuple(color)
+        found = indexes.get(color)
+        if found is None and isinstance(color, str):
+            key = color.strip().lower()
+            found = indexes.get(key) or indexes.get(f"#{key.lstrip('#')}")
+        return found
+
+    def _build_indexes(self) -> dict:
+        """Name, hex or rgb -> (kind, index); the first of any repeated color wins."""
+        indexes: dict = {}
+        for index in range(len(self._colors)):
+            indexes.setdefault(self.rgb_tuples[index], ("rgb", index))
+            indexes.setdefault(self.hex_colors[index], ("hex", index))
+            indexes.setdefault(self.names[index], ("color", index))
+        object.__setattr__(self, "_indexes", indexes)
+        return indexes
+
+    def index(self, color: RGB | str) -> int:
+        """The index of a color given by name, hex or rgb.
+
+        Raises:
+            ValueError: If the color isn't in the palette.
+        """
+        found = self.find(color)
+        if found is None:
+            raise ValueError(f"{color!r} is not a color of the {self.name} palette.")
+        return found[1]
+
+    def packed(self, index: int) -> int:
+        """The packed `0xRRGGBB` color at an index, wrapping around the ring."""
+        return self._colors[index % len(self._colors)]
+
+    def hex(self, index: int) -> str:
+        """The `#rrggbb` color at an index, wrapping around the ring."""
+        return self.hex_colors[index % len(self._colors)]
+
+    def rgb(self, index: int) -> RGB:
+        """The rgb color at an index, wrapping around the ring."""
+        return self.rgb_tuples[index % len(self._colors)]
+
+    def next(self, index: int, steps: int = 1) -> int:
+        """The index `steps` stops after `index` around the ring."""
+        return (index + steps) % len(self._colors)
+
+    def prev(self, index: int, steps: int = 1) -> int:
+        """The index `steps` stops before `index` around the ring."""
+        return (index - steps) % len(self._colors)
+
+    # ============================================================================ #
+    #     Walks
+
+    def walk(self, start: int, count: int, invert: bool = False) -> list[int]:
+        """The indexes of `count` consecutive stops from `start`.
+
+        Args:
+            start (`int`): The first index. Wraps around the ring.
+            count (`int`): The number of stops. May go around the ring more than once.
+            invert (`bool`): Whether to walk backwards around the ring. Defaults to False.
+
+        Returns:
+            `list[int]`: The indexes.
+        """
+        size = len(self._colors)
+        start %= size
+        if count <= size:
+            if invert:
+                offset = size - 1 - start
+                return self._backward[offset : offset + count].tolist()
+            return self._forward[start : start + count].tolist()
+        step = -1 if invert else 1
+        return [(start + step * stop) % size for stop in range(count)]
+
+    def path(self, start: int, end: int, invert: bool = False) -> list[int]:
+        """The indexes from `start` to `end` inclusive, walking around the ring.
+
+        Args:
+            start (`int`): The first index.
+            end (`int`): The last index.
+            invert (`bool`): Whether to walk backwards around the ring. Defaults to False.
+
+        Returns:
+            `list[int]`: The indexes.
+        """
+        size = len(self._colors)
+        distance = (start - end) % size if invert else (end - start) % size
+        return self.walk(start, distance + 1, invert)
+
+    def stops(self, indexes: Iterable[int]) -> list[RGB]:
+        """The rgb colors of a list of indexes, e.g. a walk, to pass to `interpolate()`."""
+        rgb = self.rgb_tuples
+        return [rgb[index] for index in indexes]
+
+    def deltas(self, indexes: Sequence[int]) -> list[Delta]:
+        """The precomputed segment deltas of a walk, to pass to `interpolate()` with its stops.
+
+        Args:
+            indexes (`Sequence[int]`): The indexes of a walk from `walk()` or `path()`.
+
+        Returns:
+            `list[tuple[int,int,int,int,int,int]]`: The `(r, g, b, dr, dg, db)` of each segment.
+        """
+        if len(indexes) < 2:
+            return []
+        forward, backward = self._deltas
+        table = backward if indexes[1] == (indexes[0] - 1) % len(self._colors) and indexes[1] != indexes[0] + 1 else forward
+        return [table[index] for index in indexes[:-1]]
+
+
+# A palette, or the colors of one
+PaletteType = Palette | Sequence[RGB | str | int]
+
+SPECTRUM = Palette(named_colors.RGB_TUPLES, names=named_colors.NAMES, name="spectrum")
+
+
+def as_palette(palette: Optional[PaletteType] = None) -> Palette:
+    """The palette of a call: `palette` itself, a new palette of a list of colors, or the spectrum if None."""
+    if palette is None:
+        return SPECTRUM
+    if isinstance(palette, Palette):
+        return palette
+    return Palette(palette)
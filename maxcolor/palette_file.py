@@ -0,0 +1,268 @@
+"""Load palettes from JSON or TOML files, through a compiled binary sidecar.
+
+A palette file names its colors in ring order, either as a list or as a table
+of names to colors:
+
+    # brand.toml
+    name = "brand"
+    [colors]
+    navy = "#0b1f3a"
+    blue = "#1565c0"
+    teal = "#00b8d4"
+    gold = "#ffd600"
+
+    {"name": "brand", "colors": ["#0b1f3a", "#1565c0", "#00b8d4", "#ffd600"]}
+
+`load_palette()` parses and validates the file once, then writes a sidecar
+next to it (`brand.toml.mxpal`) holding the packed colors and the palette's
+precomputed tables:
+
+    header  magic `MXP1`, color count (u32), source size (u64), source mtime (u64 ns),
+            names length (u32), name length (u32)
+    colors  packed 0xRRGGBB (u32 each)
+    paths   forward and backward path tables (u16, two laps each)
+    deltas  forward then backward segment deltas (6 x i16 per color)
+    names   the color names joined by NUL, then the palette name (UTF-8)
+
+While the sidecar is newer than the file and records the file's size and
+mtime, later loads memory-map it and skip parsing entirely. A stale, corrupt or
+unwritable sidecar just means the file is parsed again.
+"""
+import json
+import mmap
+import os
+import stat
+import struct
+import sys
+import tempfile
+from array import array
+from pathlib import Path
+from typing import Any, Optional
+
+from maxcolor.kernel import HEX_REGEX
+from maxcolor.palette import Palette
+
+MAGIC = b"MXP1"
+HEADER = struct.Struct("<4sIQQII")
+SIDECAR_SUFFIX = ".mxpal"
+FORMATS = (".json", ".toml")
+
+
+def sidecar_path(path: str | Path) -> Path:
+    """The sidecar of a palette file, e.g. `brand.toml.mxpal`."""
+    path = Path(path)
+    return path.with_name(path.name + SIDECAR_SUFFIX)
+
+
+# ============================================================================ #
+#     Parsing
+
+
+def _load_toml(file) -> dict:
+    try:
+        import tomllib
+    except ModuleNotFoundError:  # Python 3.10
+        try:
+            import tomli as tomllib  # type: ignore
+        except ModuleNotFoundError:
+            raise ModuleNotFoundError("Reading TOML palettes on Python 3.10 requires tomli: pip install tomli") from None
+    return tomllib.load(file)
+
+
+def _validate_color(path: Path, key: Any, color: Any) -> Any:
+    """A hex string, or an `[r, g, b]` list as a tuple."""
+    if isinstance(color, str):
+        if not HEX_REGEX.match(color.strip()):
+            raise ValueError(f"{path}: invalid color {key}: {color!r}. Expected #rrggbb.")
+        return color
+    if (
+        isinstance(color, (list, tuple))
+        and len(color) == 3
+        and all(type(channel) is int and 0 <= channel <= 255 for channel in color)
+    ):
+        return tuple(color)
+    raise ValueError(f"{path}: invalid color {key}: {color!r}. Expected #rrggbb or [r, g, b].")
+
+
+def _validate_names(path: Path, names: Any) -> None:
+    """A list of strings, without the NUL that separates names in the sidecar."""
+    if not isinstance(names, list):
+        raise ValueError(f"{path}: `names` must be a list of strings, not {type(names).__name__}.")
+    for index, name in enumerate(names):
+        if not isinstance(name, str) or "\0" in name:
+            raise ValueError(f"{path}: invalid name {index}: {name!r}. Expected a string without NUL.")
+
+
+def read_palette_file(path: str | Path) -> Palette:
+    """Parse and validate a JSON or TOML palette file, ignoring any sidecar.
+
+    Args:
+        path (`str|Path`): The palette file.
+
+    Raises:
+        ValueError: If the file isn't a valid palette.
+
+    Returns:
+        `Palette`: The palette, named after the file unless it sets `name`.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix not in FORMATS:
+        raise ValueError(f"{path}: unsupported palette format {suffix!r}. Valid formats are {', '.join(FORMATS)}.")
+    with open(path, "rb") as file:
+        try:
+            data = json.load(file) if suffix == ".json" else _load_toml(file)
+        except ValueError as error:  # JSONDecodeError and TOMLDecodeError
+            raise ValueError(f"{path}: {error}") from error
+    if not isinstance(data, dict) or "colors" not in data:
+        raise ValueError(f"{path}: a palette file needs a `colors` list or table.")
+
+    colors = data["colors"]
+    names = data.get("names")
+    if isinstance(colors, dict):
+        names = [str(key) for key in colors]
+        colors = [_validate_color(path, key, color) for key, color in colors.items()]
+    elif isinstance(colors, list):
+        colors = [_validate_color(path, index, color) for index, color in enumerate(colors)]
+    else:
+        raise ValueError(f"{path}: `colors` must be a list or a table, not {type(colors).__name__}.")
+    if names is not None:
+        _validate_names(path, names)
+    try:
+        return Palette(colors, names=names, name=str(data.get("name", path.stem)))
+    except ValueError as error:
+        raise ValueError(f"{path}: {error}") from error
+
+
+# ============================================================================ #
+#     Sidecar
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder == "little":
+        return values.tobytes()
+    swapped = array(values.typecode, values)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+def _from_little_endian(typecode: str, data: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+
+def write_sidecar(palette: Palette, path: str | Path, source: Optional[os.stat_result] = None) -> Path:
+    """Compile a palette into the sidecar of its source file.
+
+    Args:
+        palette (`Palette`): The palette parsed from `path`.
+        path (`str|Path`): The palette file.
+        source (`Optional[os.stat_result]`): The stat of the file when it was parsed. Defaults to its current stat.
+
+    Returns:
+        `Path`: The sidecar written.
+    """
+    path = Path(path)
+    source = source or os.stat(path)
+    target = sidecar_path(path)
+    names = b"" if palette.names == palette.hex_colors else "\0".join(palette.names).encode("utf-8")
+    name = palette.name.encode("utf-8")
+    forward, backward, deltas = palette.tables()
+    parts = [
+        HEADER.pack(MAGIC, len(palette), source.st_size, source.st_mtime_ns, len(names), len(name)),
+        _little_endian(array("I", palette.colors)),
+        _little_endian(forward),
+        _little_endian(backward),
+        _little_endian(deltas),
+        names,
+        name,
+    ]
+    descriptor, temporary = tempfile.mkstemp(prefix=f".{path.name}-", dir=target.parent)
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            file.writelines(parts)
+        # Readable by whoever can read the palette file, not just us as mkstemp creates it
+        os.chmod(temporary, stat.S_IMODE(source.st_mode))
+        os.replace(temporary, target)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+    return target
+
+
+def read_sidecar(path: str | Path, source: Optional[os.stat_result] = None) -> Optional[Palette]:
+    """Memory-map the sidecar of a palette file, if it is newer than the file and was compiled from it.
+
+    Args:
+        path (`str|Path`): The palette file.
+        source (`Optional[os.stat_result]`): The stat of the file. Defaults to its current stat.
+
+    Returns:
+        `Optional[Palette]`: The palette, or None if the sidecar is missing, stale or corrupt.
+    """
+    path = Path(path)
+    source = source or os.stat(path)
+    target = sidecar_path(path)
+    try:
+        if os.stat(target).st_mtime_ns < source.st_mtime_ns:
+            return None
+        with open(target, "rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):  # Missing, unreadable, or empty
+        return None
+    with mapped:
+        if len(mapped) < HEADER.size:
+            return None
+        magic, count, size, mtime_ns, names_length, name_length = HEADER.unpack_from(mapped)
+        if magic != MAGIC or size != source.st_size or mtime_ns != source.st_mtime_ns:
+            return None
+        colors_end = HEADER.size + count * 4
+        forward_end = colors_end + count * 4
+        backward_end = forward_end + count * 4
+        deltas_end = backward_end + count * 24
+        names_end = deltas_end + names_length
+        if names_end + name_length != len(mapped):
+            return None
+        try:
+            names = mapped[deltas_end:names_end].decode("utf-8").split("\0") if names_length else None
+            return Palette.from_tables(
+                _from_little_endian("I", mapped[HEADER.size : colors_end]),
+                names,
+                mapped[names_end : names_end + name_length].decode("utf-8"),
+                _from_little_endian("H", mapped[colors_end:forward_end]),
+                _from_little_endian("H", mapped[forward_end:backward_end]),
+                _from_little_endian("h", mapped[backward_end:deltas_end]),
+            )
+        except ValueError:  # Undecodable names, or tables that don't fit
+            return None
+
+
+def load_palette(path: str | Path, sidecar: bool = True) -> Palette:
+    """Load a JSON or TOML palette file, from its compiled sidecar when it is up to date.
+
+    Args:
+        path (`str|Path`): The palette file.
+        sidecar (`bool`): Whether to read and write the sidecar. Defaults to True.
+
+    Raises:
+        ValueError: If the file isn't a valid palette.
+
+    Returns:
+        `Palette`: The palette.
+    """
+    path = Path(path)
+    source = os.stat(path)
+    if sidecar:
+        palette = read_sidecar(path, source)
+        if palette is not None:
+            return palette
+    palette = read_palette_file(path)
+    if sidecar:
+        try:
+            write_sidecar(palette, path, source)
+        except OSError:
+            pass  # A read-only directory just means parsing again next time
+    return palette
@@ -0,0 +1,189 @@
+"""Stage timing for the gradient pipeline.
+
+    >>> import maxcolor
+    >>> with maxcolor.profile() as profile:
+    ...     text = maxcolor.gradient(message)
+    ...     with profile.stage("render"):
+    ...         console.print(text)
+    >>> console.print(profile)
+
+`gradient()`, `rainbow()` and `gradient_panel()` time each of their stages with
+`perf_counter_ns`: stop selection, interpolation, style building, Text
+assembly, and for panels the title and the Panel itself. Timing only happens
+while a profile is open or a hook is installed; otherwise each call checks the
+module level `active` flag once.
+
+Hooks receive every stage as `hook(source, stage, nanoseconds)`, to forward
+timings to an external tracer.
+"""
+import threading
+from contextlib import contextmanager
+from time import perf_counter_ns
+from typing import Callable, Iterator, Optional
+
+Hook = Callable[[str, str, int], None]
+
+active = False
+
+_local = threading.local()
+_lock = threading.Lock()
+_open_profiles = 0
+_hooks: list[Hook] = []
+
+
+def _update_active() -> None:
+    global active
+    active = bool(_open_profiles or _hooks)
+
+
+def add_hook(hook: Hook) -> None:
+    """Call `hook(source, stage, nanoseconds)` for every timed stage, in every thread."""
+    with _lock:
+        _hooks.append(hook)
+        _update_active()
+
+
+def remove_hook(hook: Hook) -> None:
+    """Stop calling a hook added with `add_hook()`."""
+    with _lock:
+        _hooks.remove(hook)
+        _update_active()
+
+
+def _profiles() -> list:
+    try:
+        return _local.profiles
+    except AttributeError:
+        profiles = _local.profiles = []
+        return profiles
+
+
+def _emit(source: str, stage: str, nanoseconds: int) -> None:
+    for profile in _profiles():
+        profile.record(source, stage, nanoseconds)
+    for hook in _hooks:
+        hook(source, stage, nanoseconds)
+
+
+class Timer:
+    """Times consecutive stages of one call. Create with `timer()`."""
+
+    __slots__ = ("source", "last")
+
+    def __init__(self, source: str):
+        self.source = source
+        self.last = perf_counter_ns()
+
+    def lap(self, stage: str) -> None:
+        """Record the time since the previous lap (or the start) as a stage."""
+        _emit(self.source, stage, perf_counter_ns() - self.last)
+        # Restart after recording, so the profiler's own time isn't charged to the next stage
+        self.last = perf_counter_ns()
+
+
+def timer(source: str) -> Timer:
+    """Start timing the stages of a call. Check `active` first:
+
+        >>> stages = profiling.timer("gradient") if profiling.active else None
+        >>> ...
+        >>> if stages:
+        ...     stages.lap("interpolation")
+    """
+    return Timer(source)
+
+
+class Profile:
+    """The stage timings recorded while a `profile()` block was open."""
+
+    hook: Optional[Hook]
+
+    def __init__(self, hook: Optional[Hook] = None):
+        self.hook = hook
+        # (source, stage) -> [count, total ns, max ns]
+        self.timings: dict[tuple[str, str], list[int]] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self.timings)} stages, {self.total_ns / 1e6:.3f} ms)"
+
+    def record(self, source: str, stage: str, nanoseconds: int) -> None:
+        """Add one timing of a stage."""
+        timing = self.timings.get((source, stage))
+        if timing is None:
+            self.timings[(source, stage)] = [1, nanoseconds, nanoseconds]
+        else:
+            timing[0] += 1
+            timing[1] += nanoseconds
+            if nanoseconds > timing[2]:
+                timing[2] = nanoseconds
+        if self.hook is not None:
+            self.hook(source, stage, nanoseconds)
+
+    @contextmanager
+    def stage(self, stage: str, source: str = "user") -> Iterator[None]:
+        """Time a block of your own code, e.g. rendering to the console, as a stage."""
+        started = perf_counter_ns()
+        try:
+            yield
+        finally:
+            _emit(source, stage, perf_counter_ns() - started)
+
+    @property
+    def total_ns(self) -> int:
+        """The total of all stages, in nanoseconds. Stages timed inside a `stage()` block are counted in both."""
+        return sum(timing[1] for timing in self.timings.values())
+
+    def totals(self) -> dict[str, dict[str, int]]:
+        """The total nanoseconds of each stage, by source."""
+        result: dict[str, dict[str, int]] = {}
+        for (source, stage), (_, total, _) in self.timings.items():
+            result.setdefault(source, {})[stage] = total
+        return result
+
+    def __rich__(self):
+        from rich.table import Table
+
+        table = Table(title="maxcolor profile")
+        table.add_column("Source")
+        table.add_column("Stage")
+        for column in ("Calls", "Total ms", "Mean µs", "Max µs", "Share"):
+            table.add_column(column, justify="right")
+        per_source: dict[str, int] = {}
+        for (source, _), (_, total, _) in self.timings.items():
+            per_source[source] = per_source.get(source, 0) + total
+        for (source, stage), (count, total, longest) in self.timings.items():
+            table.add_row(
+                source,
+                stage,
+                f"{count:,}",
+                f"{total / 1e6:.3f}",
+                f"{total / count / 1e3:.1f}",
+                f"{longest / 1e3:.1f}",
+                f"{total / per_source[source]:.0%}" if per_source[source] else "",
+            )
+        return table
+
+
+@contextmanager
+def profile(hook: Optional[Hook] = None) -> Iterator[Profile]:
+    """Record the stage timings of gradients made in this thread while the block is open.
+
+    Args:
+        hook (`Optional[Callable[[str,str,int],None]]`): Also call `hook(source, stage, nanoseconds)` for each stage. Defaults to None.
+
+    Yields:
+        `Profile`: The recorded timings.
+    """
+    global _open_profiles
+    recorded = Profile(hook)
+    profiles = _profiles()
+    profiles.append(recorded)
+    with _lock:
+        _open_profiles += 1
+        _update_active()
+    try:
+        yield recorded
+    finally:
+        profiles.remove(recorded)
+        with _lock:
+            _open_profiles -= 1
+            _update_active()
@@ -0,0 +1,317 @@
+"""Run a command under a pseudo-terminal and color its output live.
+
+    maxcolor run -- make test
+    maxcolor run --lines --stops magenta,cyan -- pytest -q
+
+The child sees a real terminal, so it keeps its own colors, progress bars and
+line buffering. Its output is read in non-blocking chunks; plain text is
+colored with a streaming gradient, while the child's own escape sequences are
+passed through untouched, including string sequences like sixel images, kitty
+graphics and tmux passthrough. Text the child colors itself is left as it is.
+"""
+import errno
+import os
+import re
+import select
+import signal
+import sys
+from typing import Optional, Sequence
+
+from maxcolor.encoder import RESET
+from maxcolor.stream import StreamColorizer
+
+READ_SIZE = 1 << 16
+MAX_PENDING_ESCAPE = 4096
+MAX_PENDING_STRING = 16 << 20
+
+# CSI, OSC (ended by BEL or ST), DCS, SOS, PM and APC string sequences (ended by ST), character set selection,
+# and other two byte escapes. A string sequence may carry escapes doubled, as tmux passthrough does, so only an
+# undoubled ST ends it.
+ESCAPE_REGEX = re.compile(
+    rb"\x1b\[[0-?]*[ -/]*[@-~]"
+    rb"|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)"
+    rb"|\x1b[PX^_][^\x1b]*(?:\x1b\x1b[^\x1b]*)*\x1b\\"
+    rb"|\x1b[()*+][ -~]"
+    rb"|\x1b[0-OQ-WYZ\\`-~]"
+)
+STRING_START_REGEX = re.compile(rb"\x1b[PX^_]")
+# The rest of a string sequence, up to and including its ST
+STRING_END_REGEX = re.compile(rb"[^\x1b]*(?:\x1b\x1b[^\x1b]*)*\x1b\\")
+# Extended color parameters (foreground, background, underline) and how many arguments follow `5` or `2`
+EXTENDED_COLORS = (38, 48, 58)
+EXTENDED_ARGUMENTS = {5: 1, 2: 3}
+
+
+def _child_colored(params: bytes, colored: bool) -> bool:
+    """Whether the child has set its own foreground color after an SGR sequence.
+
+    The parameters are applied in order: 30-37, 38 and 90-97 set a foreground
+    color, while 0 (or no parameters) and 39 hand it back. The arguments of
+    38, 48 and 58 (`5;n` or `2;r;g;b`) are skipped, so a background color like
+    `48;2;30;60;90` isn't mistaken for a foreground.
+
+    Args:
+        params (`bytes`): The parameters of the sequence, between `ESC [` and `m`.
+        colored (`bool`): Whether the child's color was in effect before the sequence.
+
+    Returns:
+        `bool`: Whether it is in effect after it.
+    """
+    values = params.split(b";")
+    index = 0
+    while index < len(values):
+        value = values[index]
+        index += 1
+        try:
+            # `38:2::r:g:b` carries its arguments as sub-parameters
+            code = int(value.split(b":", 1)[0] or 0)
+        except ValueError:
+            continue
+        if code in EXTENDED_COLORS:
+            if b":" not in value and index < len(values):
+                try:
+                    index += 1 + EXTENDED_ARGUMENTS.get(int(values[index] or 0), 0)
+                except ValueError:
+                    index += 1
+            if code == 38:
+                colored = True
+        elif 30 <= code <= 37 or 90 <= code <= 97:
+            colored = True
+        elif code in (0, 39):
+            colored = False
+    return colored
+
+
+def _complete(data: bytes, start: int = 0) -> int:
+    """The length of the prefix of `data` that doesn't end inside an escape or UTF-8 character.
+
+    A string sequence holds back everything from its start until its ST
+    arrives, as its payload (a sixel image, say) may span many chunks.
+    """
+    search = start
+    while True:
+        string = STRING_START_REGEX.search(data, search)
+        if string is None:
+            break
+        match = ESCAPE_REGEX.match(data, string.start())
+        if match is None:
+            return string.start()
+        search = match.end()
+    escape = data.rfind(b"\x1b", max(start, len(data) - MAX_PENDING_ESCAPE))
+    if escape != -1 and not ESCAPE_REGEX.match(data, escape):
+        return escape
+    # A UTF-8 lead byte in the last three bytes may still be waiting for its continuation bytes
+    for back in range(1, min(4, len(data) + 1)):
+        byte = data[-back]
+        if byte < 0x80:
+            break
+        if byte >= 0xC0:
+            needed = 2 if byte < 0xE0 else 3 if byte < 0xF0 else 4
+            return len(data) - back if needed > back else len(data)
+    return len(data)
+
+
+class PassthroughColorizer:
+    """Color the plain text of a terminal byte stream, passing escape sequences through."""
+
+    colorizer: StreamColorizer
+    offset: int
+    line: int
+    child_colored: bool
+
+    def __init__(self, colorizer: Optional[StreamColorizer] = None):
+        """Wrap a streaming colorizer.
+
+        Args:
+            colorizer (`Optional[StreamColorizer]`): The colorizer of the plain text. Defaults to `StreamColorizer()`.
+        """
+        self.colorizer = colorizer or StreamColorizer()
+        self.offset = 0
+        self.line = 0
+        self.child_colored = False
+        self._pending = b""
+        self._in_string = False
+        self._colored = False
+        self._current: Optional[bytes] = None
+
+    def _text(self, text: bytes) -> bytes:
+        colorizer = self.colorizer
+        if self.child_colored:
+            colored = text
+        else:
+            colored = colorizer.colorize_bytes(text, self.offset, self.line)
+            self._colored = True
+            if colorizer.mode == "period":
+                # Drop the leading escape when the color is still in effect from the last chunk
+                head = colorizer.color(self.offset).encode("ascii")
+                if head == self._current and colored.startswith(head):
+                    colored = colored[len(head) :]
+                self._current = colorizer.color(self.offset + len(text) - 1).encode("ascii") if text.isascii() else None
+        self.offset += len(text) if text.isascii() else len(text.decode("utf-8", errors="replace"))
+        self.line += text.count(b"\n")
+        return colored
+
+    def feed(self, data: bytes) -> bytes:
+        """Color the next chunk of output.
+
+        A partial escape sequence or UTF-8 character at the end of the chunk is
+        held back until the next chunk completes it. A string sequence longer
+        than `MAX_PENDING_STRING` is passed through as it arrives instead.
+        """
+        if self._pending:
+            data = self._pending + data
+        output = []
+        position = 0
+        if self._in_string:
+            end = STRING_END_REGEX.match(data)
+            if end is None:
+                # Hold back a trailing ESC, which may be the start of the ST
+                cut = len(data) - 1 if data.endswith(b"\x1b") else len(data)
+                self._pending = data[cut:]
+                return data[:cut]
+            self._in_string = False
+            position = end.end()
+            output.append(data[:position])
+        cut = _complete(data, position)
+        self._pending = data[cut:]
+        for match in ESCAPE_REGEX.finditer(data, position, cut):
+            start = match.start()
+            if start > position:
+                output.append(self._text(data[position:start]))
+            escape = match.group()
+            output.append(escape)
+            if escape[-1:] == b"m" and escape[1:2] == b"[":
+                params = escape[2:-1]
+                self._current = None
+                self.child_colored = _child_colored(params, self.child_colored)
+            position = match.end()
+        if position < cut:
+            output.append(self._text(data[position:cut]))
+        if len(self._pending) > MAX_PENDING_STRING:
+            output.append(self._pending)
+            self._pending = b""
+            self._in_string = True
+        return b"".join(output)
+
+    def finish(self) -> bytes:
+        """The held back bytes, followed by a reset if any text was colored."""
+        output = self._pending + (RESET.encode("ascii") if self._colored else b"")
+        self._pending = b""
+        self._in_string = False
+        return output
+
+
+# ============================================================================ #
+#     Pseudo-terminal
+
+
+def _copy_window_size(source: int, target: int) -> None:
+    import fcntl
+    import termios
+
+    try:
+        size = fcntl.ioctl(source, termios.TIOCGWINSZ, b"\0" * 8)
+        fcntl.ioctl(target, termios.TIOCSWINSZ, size)
+    except OSError:
+        pass
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        try:
+            written = os.write(fd, view)
+        except BlockingIOError:
+            select.select([], [fd], [])
+            continue
+        view = view[written:]
+
+
+def run(command: Sequence[str], colorizer: Optional[StreamColorizer] = None) -> int:
+    """Run a command under a pseudo-terminal, coloring its output to stdout.
+
+    Args:
+        command (`Sequence[str]`): The command and its arguments.
+        colorizer (`Optional[StreamColorizer]`): The colorizer of the plain output. Defaults to `StreamColorizer()`.
+
+    Returns:
+        `int`: The exit status of the command, or 128 plus the signal that ended it.
+    """
+    import pty
+    import termios
+    import tty
+
+    if not command:
+        raise ValueError("No command to run.")
+    stdin, stdout = sys.stdin.fileno(), sys.stdout.fileno()
+    sys.stdout.flush()
+    pid, master = pty.fork()
+    if pid == 0:
+        try:
+            os.execvp(command[0], list(command))
+        except OSError as error:
+            os.write(2, f"maxcolor: {command[0]}: {error.strerror}\n".encode())
+        os._exit(127)
+
+    passthrough = PassthroughColorizer(colorizer)
+    interactive = os.isatty(stdin)
+    saved = termios.tcgetattr(stdin) if interactive else None
+    previous_winch = None
+    if os.isatty(stdout):
+        _copy_window_size(stdout, master)
+        previous_winch = signal.signal(signal.SIGWINCH, lambda *_: _copy_window_size(stdout, master))
+    os.set_blocking(master, False)
+    sources = [master]
+    if interactive:
+        tty.setraw(stdin)
+        sources.append(stdin)
+    elif not sys.stdin.closed:
+        sources.append(stdin)
+
+    try:
+        while master in sources:
+            try:
+                readable, _, _ = select.select(sources, [], [])
+            except InterruptedError:
+                continue
+            if stdin in readable:
+                data = os.read(stdin, READ_SIZE)
+                if data:
+                    _write_all(master, data)
+                else:
+                    sources.remove(stdin)
+                    if not interactive:
+                        _write_all(master, b"\x04")  # End of file for the child's terminal
+            if master in readable:
+                # Drain everything that is ready, so heavy output is colored in large chunks
+                chunks = []
+                while True:
+                    try:
+                        data = os.read(master, READ_SIZE)
+                    except BlockingIOError:
+                        break
+                    except OSError as error:
+                        # Linux reports EIO once the child has closed the terminal
+                        if error.errno != errno.EIO:
+                            raise
+                        data = b""
+                    if not data:
+                        sources.remove(master)
+                        break
+                    chunks.append(data)
+                    if len(data) < READ_SIZE:
+                        break
+                if chunks:
+                    _write_all(stdout, passthrough.feed(b"".join(chunks)))
+    finally:
+        _write_all(stdout, passthrough.finish())
+        if saved is not None:
+            termios.tcsetattr(stdin, termios.TCSAFLUSH, saved)
+        if previous_winch is not None:
+            signal.signal(signal.SIGWINCH, previous_winch)
+        os.close(master)
+
+    _, status = os.waitpid(pid, 0)
+    if os.WIFSIGNALED(status):
+        return 128 + os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
@@ -0,0 +1,140 @@
+"""Gradient sparklines and heat bars for numeric series.
+
+Both keep a rolling window of the last `width` values and the rendered cell of
+each one. Pushing a value shifts the window and renders only the new cell; the
+older cells are re-rendered only when the scale of the window changes (a new
+minimum or maximum when `vmin`/`vmax` aren't fixed).
+"""
+from collections import deque
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional, Sequence
+
+from maxcolor.colormap import Colormap
+from maxcolor.kernel import RGB, parse_color
+
+
+@lru_cache(maxsize=64)
+def _colormap(stops: Optional[tuple]) -> Colormap:
+    # Charts with the same stops share one colormap, and with it one set of styles
+    return Colormap(stops, vmin=0.0, vmax=1.0)
+
+
+class Sparkline:
+    """A one line chart of a series, drawn with block characters colored by value."""
+
+    CHARACTERS = "▁▂▃▄▅▆▇█"
+    BACKGROUND = False
+
+    width: int
+    vmin: Optional[float]
+    vmax: Optional[float]
+    colormap: Colormap
+    values: deque
+    cells: deque
+
+    def __init__(
+        self,
+        values: Iterable[float] = (),
+        width: int = 40,
+        stops: Optional[Sequence[RGB | str]] = None,
+        vmin: Optional[float] = None,
+        vmax: Optional[float] = None,
+    ):
+        """Create a chart.
+
+        Args:
+            values (`Iterable[float]`): The initial values. Defaults to none.
+            width (`int`): The number of values (and cells) shown. Defaults to 40.
+            stops (`Optional[Sequence[tuple[int,int,int]|str]]`): The color stops, from the lowest value to the highest. Defaults to the full spectrum.
+            vmin (`Optional[float]`): The bottom of the scale. Defaults to None (the minimum of the window).
+            vmax (`Optional[float]`): The top of the scale. Defaults to None (the maximum of the window).
+        """
+        if width < 1:
+            raise ValueError(f"Invalid width: {width}. Must be at least one cell.")
+        self.width = width
+        self.vmin = vmin
+        self.vmax = vmax
+        self.colormap = _colormap(tuple(parse_color(stop) for stop in stops) if stops else None)
+        self.values = deque(maxlen=width)
+        self.cells = deque(maxlen=width)
+        self._scale: Optional[tuple[float, float]] = None
+        self.extend(values)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self.values)}/{self.width} values, scale={self._scale})"
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def _window_scale(self) -> tuple[float, float]:
+        vmin, vmax = self.vmin, self.vmax
+        if vmin is None or vmax is None:
+            finite = [value for value in self.values if value == value]
+            if vmin is None:
+                vmin = min(finite, default=0.0)
+            if vmax is None:
+                vmax = max(finite, default=0.0)
+        return vmin, vmax
+
+    def _cells(self, values: Sequence[float]) -> list:
+        from rich.segment import Segment
+
+        low, high = self._scale  # type: ignore
+        span = high - low
+        # Values outside a fixed scale are clipped; NaN becomes a blank cell
+        fractions = [
+            (1.0 if value >= high else (value - low) / span if span else 1.0) if value > low else 0.0
+            for value in values
+        ]
+        styles = self.colormap.styles(fractions, self.BACKGROUND)
+        return [
+            Segment(self._character(fraction), style) if value == value else Segment(" ")
+            for value, fraction, style in zip(values, fractions, styles)
+        ]
+
+    def _character(self, fraction: float) -> str:
+        return self.CHARACTERS[min(len(self.CHARACTERS) - 1, int(fraction * len(self.CHARACTERS)))]
+
+    def push(self, value: float) -> None:
+        """Add the newest value, dropping the oldest once the window is full."""
+        self.extend((value,))
+
+    def extend(self, values: Iterable[float]) -> None:
+        """Add several values, dropping the oldest once the window is full."""
+        values = list(values)[-self.width :]
+        if not values:
+            return
+        self.values.extend(values)
+        scale = self._window_scale()
+        if scale != self._scale:
+            # The scale moved, so every visible cell changes
+            self._scale = scale
+            self.cells.clear()
+            self.cells.extend(self._cells(self.values))
+        else:
+            self.cells.extend(self._cells(values))
+
+    @property
+    def plain(self) -> str:
+        """The characters of the chart without colors."""
+        return "".join(segment.text for segment in self.cells)
+
+    def __rich_console__(self, console, options) -> Iterator:
+        from rich.segment import Segment
+
+        # Pad on the left, so the newest value is always the right-most cell
+        if len(self.cells) < self.width:
+            yield Segment(" " * (self.width - len(self.cells)))
+        yield from self.cells
+
+    def __rich_measure__(self, console, options):
+        from rich.measure import Measurement
+
+        return Measurement(self.width, self.width)
+
+
+class HeatBar(Sparkline):
+    """A one line heat map of a series, one background colored cell per value."""
+
+    CHARACTERS = " "
+    BACKGROUND = True
@@ -0,0 +1,114 @@
+"""Precompiled gradient specifications.
+
+A `GradientSpec` fixes everything about a gradient except the text: the color
+stops, the granularity and the output encoding. It renders straight to ANSI
+without building rich objects, and can render in pieces so callers (asyncio,
+servers) can yield between them.
+"""
+from typing import Iterator, Optional, Sequence
+
+from maxcolor.encoder import ColorSystemName, SGREncoder
+from maxcolor.kernel import RGB, SPECTRUM, Granularity, interpolate, parse_color, quantize
+
+
+class GradientSpec:
+    """A compiled gradient that renders text to ANSI strings."""
+
+    stops: tuple[RGB, ...]
+    granularity: Granularity
+    max_spans: Optional[int]
+    color_system: ColorSystemName
+    precision: int
+
+    def __init__(
+        self,
+        stops: Optional[Sequence[RGB | str]] = None,
+        granularity: Granularity = "char",
+        max_spans: Optional[int] = None,
+        color_system: ColorSystemName = "truecolor",
+        precision: int = 8,
+    ):
+        """Compile a gradient.
+
+        Args:
+            stops (`Optional[Sequence[tuple[int,int,int]|str]]`): The color stops. Defaults to the full spectrum.
+            granularity (`str|int`): `char`, `word`, `line`, or an integer number of characters per color. Defaults to `char`.
+            max_spans (`Optional[int]`): The maximum number of colored spans. Defaults to None (unlimited).
+            color_system (`str`): `truecolor`, `256`, or `standard`. Defaults to `truecolor`.
+            precision (`int`): Bits per color channel (1-8). Defaults to 8.
+        """
+        self.stops = tuple(parse_color(stop) for stop in stops) if stops else tuple(SPECTRUM.values())
+        self.granularity = granularity
+        self.max_spans = max_spans
+        self.color_system = color_system
+        self.precision = precision
+        self.encoder = SGREncoder(color_system, precision)
+        quantize("", granularity, max_spans)  # Validate the granularity once
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(stops={len(self.stops)}, granularity={self.granularity!r}, "
+            f"max_spans={self.max_spans}, color_system={self.color_system!r})"
+        )
+
+    @property
+    def key(self) -> tuple:
+        """A hashable key that identifies the rendered output of this spec."""
+        return (self.stops, self.granularity, self.max_spans, self.color_system, self.precision)
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, GradientSpec) and self.key == other.key
+
+    def spans(self, text: str) -> list[tuple[int, int, RGB]]:
+        """The `(start, end, rgb)` of every colored band of a text."""
+        bands = quantize(text, self.granularity, self.max_spans)
+        colors = interpolate(self.stops, len(bands))
+        return [(start, end, rgb) for (start, end), rgb in zip(bands, colors)]
+
+    def iter_render(self, text: str, chunk: int = 4096) -> Iterator[str]:
+        """Render text to ANSI in pieces of at most `chunk` colored spans.
+
+        Args:
+            text (`str`): The text to color.
+            chunk (`int`): The number of spans per piece. Defaults to 4096.
+
+        Yields:
+            `str`: Consecutive pieces of the ANSI output. Each piece resets at its end.
+        """
+        size = len(text)
+        granularity = self.granularity
+        render_spans = self.encoder.render_spans
+
+        # Fixed width bands are generated lazily, one piece at a time
+        if self.max_spans is None and (granularity == "char" or type(granularity) is int):
+            width = 1 if granularity == "char" else granularity
+            count = -(-size // width)
+            for first in range(0, count, chunk):
+                last = min(first + chunk, count)
+                colors = interpolate(self.stops, count, first, last)
+                spans = [
+                    (band * width, min(band * width + width, size), rgb)
+                    for band, rgb in zip(range(first, last), colors)
+                ]
+                yield render_spans(text, spans, first * width, min(last * width, size))
+            return
+
+        bands = quantize(text, granularity, self.max_spans)
+        count = len(bands)
+        if not count:
+            yield text
+            return
+        for first in range(0, count, chunk):
+            last = min(first + chunk, count)
+            colors = interpolate(self.stops, count, first, last)
+            spans = [(start, end, rgb) for (start, end), rgb in zip(bands[first:last], colors)]
+            start = 0 if first == 0 else bands[first][0]
+            end = size if last == count else bands[last][0]
+            yield render_spans(text, spans, start, end)
+
+    def render(self, text: str) -> str:
+        """Render text to an ANSI string."""
+        return "".join(self.iter_render(text, chunk=max(1, len(text))))
@@ -0,0 +1,274 @@
+"""Streaming gradient colorizer with bounded memory.
+
+A `StreamColorizer` colors text chunk by chunk. Colors are looked up from a
+precomputed escape table by absolute position (or line number), so no chunk
+ever has to wait for the rest of the stream and any chunk can be colored on
+its own once its offset is known.
+"""
+from codecs import getincrementaldecoder
+from itertools import count, cycle, islice
+from typing import BinaryIO, Literal, Optional, Sequence
+
+from maxcolor.encoder import RESET, ColorSystemName, cap_precision, color_params
+from maxcolor.kernel import RGB, SPECTRUM, interpolate
+
+StreamMode = Literal["period", "line"]
+StreamEncoder = Literal["minimal", "rich"]
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+BLOCK_BYTES = 1 << 16
+
+
+class StreamColorizer:
+    """Color an unbounded stream of text with a repeating gradient."""
+
+    stops: tuple[RGB, ...]
+    mode: StreamMode
+    period: int
+    band: int
+    color_system: ColorSystemName
+    precision: int
+    encoder: StreamEncoder
+    offset: int
+    line: int
+    escapes: list[str]
+
+    def __init__(
+        self,
+        stops: Optional[Sequence[RGB]] = None,
+        mode: StreamMode = "period",
+        period: int = 240,
+        band: int = 16,
+        color_system: ColorSystemName = "truecolor",
+        precision: int = 8,
+        encoder: StreamEncoder = "minimal",
+    ):
+        """Compile the escape table of a repeating gradient.
+
+        Args:
+            stops (`Optional[Sequence[tuple[int,int,int]]]`): The color stops. Defaults to the full spectrum (a rainbow).
+            mode (`str`): `period` colors by character offset, `line` colors each line by its line number. Defaults to `period`.
+            period (`int`): The number of characters (`period`) or lines (`line`) in one full cycle of the gradient. Defaults to 240.
+            band (`int`): The number of characters that share a color in `period` mode. Defaults to 16.
+            color_system (`str`): `truecolor`, `256`, or `standard`. Defaults to `truecolor`.
+            precision (`int`): Bits per color channel (1-8). Defaults to 8.
+            encoder (`str`): `minimal` emits only color changes, `rich` resets before every color like rich does. Defaults to `minimal`.
+        """
+        if mode not in ("period", "line"):
+            raise ValueError(f"Invalid mode: {mode}. Valid values are 'period' and 'line'.")
+        if encoder not in ("minimal", "rich"):
+            raise ValueError(f"Invalid encoder: {encoder}. Valid values are 'minimal' and 'rich'.")
+        if period < 1 or band < 1:
+            raise ValueError(f"Invalid period or band: {period}, {band}. Both must be at least one.")
+        if not 1 <= precision <= 8:
+            raise ValueError(f"Invalid precision: {precision}. Must be between 1 and 8 bits.")
+        self.stops = tuple(stops) if stops else tuple(SPECTRUM.values())
+        self.mode = mode
+        self.period = period
+        self.band = band
+        self.color_system = color_system
+        self.precision = precision
+        self.encoder = encoder
+        self.offset = 0
+        self.line = 0
+
+        # One cycle returns to the first stop, so the table wraps seamlessly
+        steps = period if mode == "line" else max(1, period // band)
+        ring = list(self.stops) + [self.stops[0]]
+        colors = interpolate(ring, steps + 1)[:steps]
+        prefix = RESET if encoder == "rich" else ""
+        self.escapes = [
+            f"{prefix}\x1b[{color_params(cap_precision(rgb, precision), color_system)}m"
+            for rgb in colors
+        ]
+
+        # ASCII fast path: one cycle of output is a fixed record of escapes and
+        # text bytes, so whole cycles are built by tiling the escapes and copying
+        # the text into them with strided slice assignments.
+        self._escape_bytes = [escape.encode("ascii") for escape in self.escapes]
+        self._cycle_chars = len(self.escapes) * band
+        template = bytearray()
+        self._text_slots = []
+        for escape in self._escape_bytes:
+            template += escape
+            self._text_slots.append(len(template))
+            template += bytes(band)
+        self._template = bytes(template)
+        self._decoder = getincrementaldecoder("utf-8")(errors="replace")
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(mode={self.mode!r}, period={self.period}, "
+            f"band={self.band}, color_system={self.color_system!r})"
+        )
+
+    def color(self, offset: int, line: int = 0) -> str:
+        """The escape sequence for an absolute character offset (or line number in `line` mode)."""
+        if self.mode == "line":
+            return self.escapes[line % len(self.escapes)]
+        return self.escapes[(offset // self.band) % len(self.escapes)]
+
+    def colorize(self, chunk: str, offset: int = 0, line: int = 0) -> str:
+        """Color a chunk that starts at an absolute offset, without touching the stream state.
+
+        The chunk always starts with its own escape sequence, so it can be written
+        after any other chunk (or on its own).
+
+        Args:
+            chunk (`str`): The text to color.
+            offset (`int`): The absolute character offset of the chunk. Defaults to 0.
+            line (`int`): The absolute line number of the chunk. Defaults to 0.
+
+        Returns:
+            `str`: The colored chunk. The color is not reset at the end.
+        """
+        if not chunk:
+            return ""
+        escapes = self.escapes
+        steps = len(escapes)
+        if self.mode == "line":
+            return "\n".join(
+                [
+                    escapes[number % steps] + part if part else part
+                    for number, part in zip(count(line), chunk.split("\n"))
+                ]
+            )
+
+        band = self.band
+        first_band = offset // band
+        cut = (first_band + 1) * band - offset
+        head = escapes[first_band % steps] + chunk[:cut]
+        if cut >= len(chunk):
+            return head
+        return head + "".join(
+            [
+                escapes[number % steps] + chunk[index : index + band]
+                for number, index in zip(count(first_band + 1), range(cut, len(chunk), band))
+            ]
+        )
+
+    def _colorize_ascii(self, data: bytes, offset: int) -> bytes:
+        """`colorize()` for ASCII bytes in `period` mode, at C speed for whole cycles."""
+        cycle_chars = self._cycle_chars
+        head = -offset % cycle_chars
+        if len(data) - head < cycle_chars:
+            return self.colorize(data.decode("ascii"), offset).encode("ascii")
+
+        cycles = (len(data) - head) // cycle_chars
+        body_end = head + cycles * cycle_chars
+        record = len(self._template)
+        band = self.band
+        output = []
+        if head:
+            output.append(self.colorize(data[:head].decode("ascii"), offset).encode("ascii"))
+
+        # Work in blocks that stay in cache; strided copies over large buffers are much slower
+        block_cycles = max(1, BLOCK_BYTES // cycle_chars)
+        for block_start in range(head, body_end, block_cycles * cycle_chars):
+            block_end = min(block_start + block_cycles * cycle_chars, body_end)
+            body = bytearray(self._template * ((block_end - block_start) // cycle_chars))
+            for number, slot in enumerate(self._text_slots):
+                source = block_start + number * band
+                for column in range(band):
+                    body[slot + column :: record] = data[source + column : block_end : cycle_chars]
+            output.append(body)
+        if body_end < len(data):
+            tail = data[body_end:].decode("ascii")
+            output.append(self.colorize(tail, offset + body_end).encode("ascii"))
+        return b"".join(output)
+
+    def _colorize_ascii_lines(self, data: bytes, line: int) -> bytes:
+        """`colorize()` for ASCII bytes in `line` mode. Empty lines get no escape, as in `colorize()`."""
+        escapes = self._escape_bytes
+        return b"\n".join(
+            [
+                escape + part if part else part
+                for escape, part in zip(islice(cycle(escapes), line % len(escapes), None), data.split(b"\n"))
+            ]
+        )
+
+    def colorize_bytes(self, data: bytes, offset: int = 0, line: int = 0) -> bytes:
+        """`colorize()` for a complete UTF-8 chunk, using the ASCII fast path when possible.
+
+        Args:
+            data (`bytes`): The UTF-8 text to color. Must not end inside a multibyte character.
+            offset (`int`): The absolute character offset of the chunk. Defaults to 0.
+            line (`int`): The absolute line number of the chunk. Defaults to 0.
+
+        Returns:
+            `bytes`: The colored, UTF-8 encoded chunk.
+        """
+        if not data:
+            return b""
+        if not data.isascii():
+            return self.colorize(data.decode("utf-8", errors="replace"), offset, line).encode("utf-8")
+        if self.mode == "line":
+            return self._colorize_ascii_lines(data, line)
+        return self._colorize_ascii(data, offset)
+
+    def feed_bytes(self, data: bytes, final: bool = False) -> bytes:
+        """Color the next chunk of a UTF-8 byte stream and advance the stream position.
+
+        Plain ASCII chunks skip decoding entirely.
+
+        Args:
+            data (`bytes`): The next UTF-8 encoded chunk.
+            final (`bool`): Whether this is the last chunk of the stream. Defaults to False.
+
+        Returns:
+            `bytes`: The colored, UTF-8 encoded chunk.
+        """
+        if data and data.isascii() and not self._decoder.getstate()[0]:
+            colored = self.colorize_bytes(data, self.offset, self.line)
+            self.offset += len(data)
+            self.line += data.count(b"\n")
+            return colored
+        return self.feed(self._decoder.decode(data, final=final)).encode("utf-8")
+
+    def feed(self, chunk: str) -> str:
+        """Color the next chunk of the stream and advance the stream position."""
+        colored = self.colorize(chunk, self.offset, self.line)
+        self.offset += len(chunk)
+        if self.mode == "line":
+            self.line += chunk.count("\n")
+        return colored
+
+    def finish(self) -> str:
+        """The sequence that resets the terminal at the end of the stream."""
+        return RESET if self.offset else ""
+
+    def pipe(
+        self,
+        source: BinaryIO,
+        target: BinaryIO,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        flush: bool = False,
+    ) -> int:
+        """Color a binary stream into another with bounded memory.
+
+        Args:
+            source (`BinaryIO`): The UTF-8 input, e.g. `sys.stdin.buffer`.
+            target (`BinaryIO`): The binary output, e.g. `sys.stdout.buffer`.
+            chunk_size (`int`): The maximum number of bytes read at once. Defaults to 64 KiB.
+            flush (`bool`): Whether to flush after every chunk (for interactive output). Defaults to False.
+
+        Returns:
+            `int`: The number of bytes written.
+        """
+        read = getattr(source, "read1", source.read)
+        write = target.write
+        written = 0
+        while True:
+            data = read(chunk_size)
+            if not data:
+                break
+            output = self.feed_bytes(data)
+            written += len(output)
+            write(output)
+            if flush:
+                target.flush()
+        output = self.feed_bytes(b"", final=True) + self.finish().encode("utf-8")
+        written += len(output)
+        write(output)
+        target.flush()
+        return written
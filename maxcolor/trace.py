@@ -0,0 +1,156 @@
+"""Structured tracing of the color range helpers.
+
+    >>> from maxcolor import trace
+    >>> with trace.trace() as events:
+    ...     generate_color_range("red", "blue")
+    >>> console.print(events)
+    >>> events.export()
+    [{'function': 'generate_color_range', 'step': 'mode', 'index': None, 'color': 'color'}, ...]
+
+`random_color_index`, `random_color_range`, `color_range_generator`,
+`generate_color_range` and their validators record each step as a
+`(function, step, index, color)` tuple. Recording appends to a fixed size ring
+buffer, so a long run keeps only its most recent events and nothing is printed
+until it has finished. Passing `test=True` to one of those functions traces the
+call and prints the events once it returns.
+
+Tracing only happens while a trace is open; otherwise each step checks the
+module level `active` flag once.
+"""
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Iterator, NamedTuple, Optional
+
+SIZE = 4096
+
+active = False
+
+_local = threading.local()
+_lock = threading.Lock()
+_open_traces = 0
+
+
+def _update_active() -> None:
+    global active
+    active = bool(_open_traces)
+
+
+class Event(NamedTuple):
+    """One recorded step. `color` holds the step's value when it isn't a color, e.g. the mode."""
+
+    function: str
+    step: str
+    index: Optional[int]
+    color: Any
+
+
+def _traces() -> list:
+    try:
+        return _local.traces
+    except AttributeError:
+        traces = _local.traces = []
+        return traces
+
+
+def record(function: str, step: str, index: Optional[int] = None, color: Any = None) -> None:
+    """Record a step in the traces open in this thread. Check `active` first:
+
+        >>> if trace.active:
+        ...     trace.record("generate_color_range", "next", next_index, colors[next_index])
+    """
+    for recorded in getattr(_local, "traces", ()):
+        recorded.events.append((function, step, index, color))
+        recorded.recorded += 1
+
+
+def current() -> Optional["Trace"]:
+    """The innermost trace open in this thread, if any."""
+    traces = _traces()
+    return traces[-1] if traces else None
+
+
+class Trace:
+    """The most recent events recorded while a `trace()` block was open."""
+
+    __slots__ = ("events", "recorded")
+
+    def __init__(self, size: int = SIZE):
+        if size < 1:
+            raise ValueError(f"Invalid trace size: {size}. Must be at least 1.")
+        # (function, step, index, color) tuples, oldest first. Full deques drop from the left.
+        self.events: deque[tuple] = deque(maxlen=size)
+        self.recorded = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self.events)} events, {self.dropped} dropped)"
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def __iter__(self) -> Iterator[Event]:
+        return (Event(*event) for event in self.events)
+
+    @property
+    def size(self) -> int:
+        """The number of events kept."""
+        return self.events.maxlen
+
+    @property
+    def dropped(self) -> int:
+        """The number of older events overwritten once the buffer was full."""
+        return self.recorded - len(self.events)
+
+    def clear(self) -> None:
+        self.events.clear()
+        self.recorded = 0
+
+    def export(self) -> list[dict]:
+        """The events as dicts, oldest first."""
+        return [event._asdict() for event in self]
+
+    def to_json(self, **kwargs) -> str:
+        """The events as a JSON array. Keyword arguments are passed to `json.dumps`."""
+        import json
+
+        return json.dumps(self.export(), **kwargs)
+
+    def __rich__(self):
+        from rich.table import Table
+
+        caption = f"{self.dropped:,} older events dropped" if self.dropped else None
+        table = Table(title="maxcolor trace", caption=caption, border_style="bold #ff00ff")
+        table.add_column("#", justify="right")
+        for column in ("Function", "Step", "Index", "Color"):
+            table.add_column(f"[bold #00ffff]{column}[/]")
+        for number, (function, step, index, color) in enumerate(self.events, start=self.dropped + 1):
+            table.add_row(
+                f"{number:,}", function, step, "" if index is None else str(index), "" if color is None else str(color)
+            )
+        return table
+
+
+@contextmanager
+def trace(size: int = SIZE) -> Iterator[Trace]:
+    """Record the steps of the color range helpers called in this thread while the block is open.
+
+    Args:
+        size (`int`): The number of most recent events to keep. Defaults to 4096.
+
+    Yields:
+        `Trace`: The recorded events.
+    """
+    global _open_traces
+    recorded = Trace(size)
+    traces = _traces()
+    traces.append(recorded)
+    with _lock:
+        _open_traces += 1
+        _update_active()
+    try:
+        yield recorded
+    finally:
+        traces.remove(recorded)
+        with _lock:
+            _open_traces -= 1
+            _update_active()
@@ -0,0 +1,18 @@
+import pytest
+
+from maxcolor.animate import AnimatedGradient
+
+
+@pytest.mark.parametrize("precision", [0, 9])
+def test_precision_out_of_range(precision):
+    with pytest.raises(ValueError, match="Invalid precision"):
+        AnimatedGradient("hello", precision=precision)
+
+
+def test_empty_stops():
+    with pytest.raises(ValueError, match="Invalid stops"):
+        AnimatedGradient("hello", stops=[])
+
+
+def test_default_stops_are_the_spectrum():
+    assert len(AnimatedGradient("hello").stops) == 10
@@ -0,0 +1,113 @@
+import multiprocessing
+import re
+
+import pytest
+
+from maxcolor.cache import KEY_SIZE, DiskCache, banner, cache_key
+from maxcolor.spec import GradientSpec
+
+ANSI_REGEX = re.compile(r"\x1b\[[0-9;]*m")
+WRITERS = 4
+PUTS = 25
+
+
+def _write(path, writer):
+    cache = DiskCache(path)
+    for number in range(PUTS):
+        cache.put(bytes([writer, number]) * 8, f"{writer}-{number}".encode())
+
+
+def test_concurrent_writers_keep_every_entry(tmp_path):
+    path = tmp_path / "render-cache.bin"
+    processes = [multiprocessing.Process(target=_write, args=(path, writer)) for writer in range(WRITERS)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    cache = DiskCache(path)
+    assert len(cache) == WRITERS * PUTS
+    assert cache.get(bytes([2, 7]) * 8) == b"2-7"
+
+
+def test_round_trip_across_instances(tmp_path):
+    path = tmp_path / "render-cache.bin"
+    items = {cache_key(f"text {number}", ("spec",)): f"output {number}".encode() for number in range(200)}
+    DiskCache(path).put_many(items)
+    cache = DiskCache(path)
+    assert len(cache) == 200
+    assert all(cache.get(key) == value for key, value in items.items())
+    assert cache.get(cache_key("missing", ("spec",))) is None
+    assert (cache.hits, cache.misses) == (200, 1)
+
+
+def test_an_open_cache_sees_later_writes(tmp_path):
+    path = tmp_path / "render-cache.bin"
+    reader = DiskCache(path)
+    assert reader.get(b"k" * 16) is None
+    DiskCache(path).put(b"k" * 16, b"value")
+    assert reader.get(b"k" * 16) == b"value"
+
+
+def test_oldest_entries_are_evicted(tmp_path):
+    cache = DiskCache(tmp_path / "render-cache.bin", max_bytes=30)
+    for number in range(5):
+        cache.put(bytes([number]) * 16, bytes([65 + number]) * 10)
+    assert len(cache) == 3
+    assert [cache.get(bytes([number]) * 16) for number in range(5)] == [None, None, b"C" * 10, b"D" * 10, b"E" * 10]
+
+
+@pytest.mark.parametrize("data", [b"", b"MXC", b"XXXX\x01\x00\x00\x00", b"MXC1\xff\x00\x00\x00"])
+def test_a_corrupt_file_reads_as_empty(tmp_path, data):
+    path = tmp_path / "render-cache.bin"
+    path.write_bytes(data)
+    cache = DiskCache(path)
+    assert len(cache) == 0 and cache.get(b"k" * 16) is None
+    cache.put(b"k" * 16, b"value")
+    assert DiskCache(path).get(b"k" * 16) == b"value"
+
+
+def test_render_stores_the_output_once(tmp_path):
+    cache = DiskCache(tmp_path / "render-cache.bin")
+    calls = []
+
+    def render():
+        calls.append(1)
+        return "\x1b[31mhé\x1b[0m"
+
+    key = cache_key("hé", ("spec",))
+    assert cache.render(key, render) == cache.render(key, render) == "\x1b[31mhé\x1b[0m"
+    assert len(calls) == 1
+
+
+def test_render_works_without_a_writable_cache(tmp_path):
+    directory = tmp_path / "file"
+    directory.write_text("not a directory")
+    cache = DiskCache(directory / "render-cache.bin")
+    assert cache.render(b"k" * 16, lambda: "output") == "output"
+
+
+def test_keys_cover_everything_that_decides_the_output():
+    keys = {
+        cache_key("text", ("spec",)),
+        cache_key("text", ("other spec",)),
+        cache_key("other text", ("spec",)),
+        cache_key("text", ("spec",), width=80),
+        cache_key("text", ("spec",), color_system="256"),
+    }
+    assert len(keys) == 5
+    assert all(len(key) == KEY_SIZE for key in keys)
+    assert cache_key("text", ("spec",), 80, "256") == cache_key("text", ("spec",), 80, "256")
+
+
+def test_banner_is_served_from_the_cache(tmp_path, monkeypatch):
+    spec = GradientSpec(["red", "blue"])
+    cache = DiskCache(tmp_path / "render-cache.bin")
+    text = "maxcolor\nv1"
+    output = banner(text, spec, width=20, cache=cache)
+    assert output == banner(text, spec, width=20, cache=False)
+    assert ANSI_REGEX.sub("", output) == "      maxcolor\n         v1"
+    # The padding is outside the gradient
+    assert output.startswith("      \x1b[")
+
+    monkeypatch.setattr(GradientSpec, "render", lambda self, text: pytest.fail("The banner was rendered again"))
+    assert banner(text, spec, width=20, cache=DiskCache(cache.path)) == output
@@ -0,0 +1,38 @@
+import pytest
+
+from maxcolor.categorical import CategoricalColors, _golden_step
+
+
+@pytest.mark.parametrize("size", [None, 7, 32, 256])
+def test_first_labels_cover_the_palette(size):
+    colors = CategoricalColors(size=size)
+    labels = [f"host-{number}" for number in range(len(colors))]
+    assert sorted(colors.index(label) for label in labels) == list(range(len(colors)))
+
+
+def test_labels_are_stable_across_mappers():
+    first, second = CategoricalColors(size=32), CategoricalColors(size=32)
+    labels = [f"service-{number}" for number in range(100)]
+    assert [first.index(label) for label in labels] == [second.index(label) for label in labels]
+    assert CategoricalColors().hex("checkout") == CategoricalColors().hex("checkout")
+
+
+def test_labels_share_colors_once_every_color_is_used():
+    colors = CategoricalColors()
+    indexes = [colors.index(f"request-{number}") for number in range(100)]
+    assert len(set(indexes)) == len(colors)
+    assert [colors.index(f"request-{number}") for number in range(100)] == indexes
+
+
+@pytest.mark.parametrize("size", range(1, 40))
+def test_golden_step_visits_every_color(size):
+    step = _golden_step(size)
+    assert len({number * step % size for number in range(size)}) == size
+
+
+def test_forgetting_labels_keeps_styles_and_colors_together():
+    colors = CategoricalColors(maxsize=4)
+    for number in range(10):
+        label = f"worker-{number}"
+        style = colors.style(label)
+        assert style.color.triplet.hex == colors.hex(label)
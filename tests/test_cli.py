@@ -0,0 +1,17 @@
+import pytest
+
+from maxcolor.cli import main
+from maxcolor.stream import StreamColorizer
+
+
+@pytest.mark.parametrize("precision", ["0", "-1", "9"])
+def test_precision_out_of_range_is_a_usage_error(precision, capsys):
+    with pytest.raises(SystemExit) as exited:
+        main(["--precision", precision])
+    assert exited.value.code == 2
+    assert f"Invalid precision: {precision}" in capsys.readouterr().err
+
+
+def test_stream_colorizer_rejects_precision_zero():
+    with pytest.raises(ValueError, match="Invalid precision"):
+        StreamColorizer(precision=0)
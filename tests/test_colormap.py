@@ -0,0 +1,51 @@
+import pytest
+
+from maxcolor.colormap import Colormap
+
+
+@pytest.mark.parametrize("precision", [0, -1, 9])
+def test_precision_out_of_range(precision):
+    with pytest.raises(ValueError, match="Invalid precision"):
+        Colormap(["blue", "red"], precision=precision)
+
+
+def test_low_precision_builds_the_lut():
+    assert len(Colormap(["blue", "red"], precision=1)) == 256
+
+
+def _both(values):
+    """The indices of the list path and of the NumPy path, as lists."""
+    numpy = pytest.importorskip("numpy")
+    colormap = Colormap(["blue", "red"])
+    return colormap.indices(values).tolist(), colormap.indices(numpy.array(values, dtype=float)).tolist()
+
+
+@pytest.mark.parametrize(
+    "values, expected",
+    [
+        ([0.0, 5.0, 10.0], [0, 127, 255]),
+        ([0.0, 5.0, 10.0, float("inf")], [0, 127, 255, 255]),
+        ([float("-inf"), 0.0, 5.0, 10.0], [0, 0, 127, 255]),
+        ([float("nan"), 0.0, 10.0], [0, 0, 255]),
+        ([3.0, 3.0], [0, 0]),
+        ([float("inf"), float("nan")], [255, 0]),
+    ],
+)
+def test_auto_range_uses_finite_values_on_both_paths(values, expected):
+    assert _both(values) == (expected, expected)
+
+
+@pytest.mark.parametrize("values, expected", [([4.0, 5.0, 6.0, float("nan")], [0, 0, 255, 0])])
+def test_equal_bounds_clamp_the_same_on_both_paths(values, expected):
+    numpy = pytest.importorskip("numpy")
+    colormap = Colormap(["blue", "red"], vmin=5.0, vmax=5.0)
+    assert colormap.indices(values).tolist() == expected
+    assert colormap.indices(numpy.array(values)).tolist() == expected
+
+
+def test_clip_disabled_rejects_out_of_range_values_on_both_paths():
+    numpy = pytest.importorskip("numpy")
+    colormap = Colormap(["blue", "red"], vmin=5.0, vmax=5.0, clip=False)
+    for values in ([5.0, 6.0], numpy.array([5.0, 6.0])):
+        with pytest.raises(ValueError, match="clip disabled"):
+            colormap.indices(values)
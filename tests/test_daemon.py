@@ -0,0 +1,64 @@
+import os
+import stat
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from maxcolor.daemon import ColorServer, DaemonClient, DaemonError, colorize
+
+
+@pytest.fixture
+def server(tmp_path):
+    """A daemon serving on a thread."""
+    with ColorServer(tmp_path / "maxcolor.sock") as server:
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+        thread.join(10)
+
+
+def test_socket_is_private_before_it_listens(tmp_path):
+    path = tmp_path / "maxcolor.sock"
+    daemon = subprocess.Popen([sys.executable, "-m", "maxcolor", "--daemon", "--socket", str(path)])
+    try:
+        deadline = time.monotonic() + 10
+        while True:
+            try:
+                output = colorize("hello", path=path, fallback=False)
+                break
+            except OSError:
+                assert time.monotonic() < deadline and daemon.poll() is None, "The daemon didn't start"
+                time.sleep(0.01)
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+        assert "\x1b[" in output
+    finally:
+        daemon.terminate()
+        daemon.wait(10)
+
+
+def test_binding_leaves_the_process_umask_alone(tmp_path, monkeypatch):
+    def umask(mask):
+        raise AssertionError("The umask is shared by every thread of the process")
+
+    monkeypatch.setattr(os, "umask", umask)
+    with ColorServer(tmp_path / "maxcolor.sock") as server:
+        assert stat.S_IMODE(os.stat(server.server_address).st_mode) == 0o600
+
+
+def test_any_error_is_answered_with_an_error_frame(server, monkeypatch):
+    def broken(self, settings):
+        raise RuntimeError("spec exploded")
+
+    with DaemonClient(server.server_address) as client:
+        with monkeypatch.context() as patch:
+            patch.setattr(ColorServer, "spec", broken)
+            with pytest.raises(DaemonError, match="spec exploded"):
+                client.colorize("hello")
+        with pytest.raises(DaemonError, match="Unable to parse color"):
+            client.colorize("hello", stops=[5, "red"])
+        # The connection survives both errors
+        assert "\x1b[" in client.colorize("hello")
@@ -0,0 +1,145 @@
+import re
+from io import StringIO
+
+import pytest
+from rich.console import Console
+from rich.text import Text
+
+from maxcolor.encoder import RESET, SGREncoder, color_params, rgb_to_eight_bit, rgb_to_standard
+
+SGR_REGEX = re.compile(r"\x1b\[([0-9;]*)m")
+ATTRIBUTE_CODES = {"1": "bold", "2": "dim", "3": "italic", "4": "underline", "5": "blink", "7": "reverse", "8": "conceal", "9": "strike"}
+OFF_CODES = {"22": ("bold", "dim"), "23": ("italic",), "24": ("underline",), "25": ("blink",), "27": ("reverse",), "28": ("conceal",), "29": ("strike",)}
+
+
+def _screen(ansi: str) -> list[tuple]:
+    """What a terminal shows: the (character, foreground, background, attributes) of every character."""
+    fg = bg = None
+    attrs: frozenset = frozenset()
+    cells = []
+    position = 0
+    for match in [*SGR_REGEX.finditer(ansi), None]:
+        end = match.start() if match else len(ansi)
+        for character in ansi[position:end]:
+            visible = attrs & {"underline", "reverse", "strike"}
+            # Whitespace shows no foreground color
+            cells.append((character, None if character.isspace() and not visible else fg, bg, attrs))
+        if match is None:
+            break
+        position = match.end()
+        params = (match.group(1) or "0").split(";")
+        while params:
+            param = params.pop(0)
+            if param == "0":
+                fg = bg = None
+                attrs = frozenset()
+            elif param in ATTRIBUTE_CODES:
+                attrs |= {ATTRIBUTE_CODES[param]}
+            elif param in OFF_CODES:
+                attrs -= set(OFF_CODES[param])
+            elif param in ("38", "48"):
+                count = 4 if params[0] == "2" else 2
+                color = ";".join(params[:count])
+                del params[:count]
+                if param == "38":
+                    fg = color
+                else:
+                    bg = color
+            elif param == "39":
+                fg = None
+            elif param == "49":
+                bg = None
+            elif 30 <= int(param) <= 37 or 90 <= int(param) <= 97:
+                fg = param
+            else:
+                bg = param
+    return cells
+
+
+def _rich(text: Text) -> str:
+    console = Console(file=StringIO(), force_terminal=True, color_system="truecolor", width=1000)
+    console.print(text, end="")
+    return console.file.getvalue()
+
+
+def _styled() -> Text:
+    text = Text("gradient text with  style changes\nand a second line ")
+    for index in range(len(text)):
+        text.stylize(f"#{index * 7 % 256:02x}40{255 - index * 5 % 256:02x}", index, index + 1)
+    text.stylize("bold", 0, 12)
+    text.stylize("dim", 5, 20)
+    text.stylize("underline on #202020", 15, 25)
+    text.stylize("italic red", 26, 30)
+    text.stylize("reverse color(200)", 40, 44)
+    text.stylize("strike", 44, 47)
+    return text
+
+
+def test_encode_shows_what_rich_shows():
+    text = _styled()
+    encoded = SGREncoder().encode(text).decode("utf-8")
+    assert _screen(encoded) == _screen(_rich(text))
+    assert encoded.endswith(RESET)
+    assert len(encoded) < len(_rich(text))
+
+
+def test_encode_only_emits_changes():
+    text = Text("aaaabbbb")
+    text.stylize("#ff0000", 0, 4)
+    text.stylize("#ff0000", 4, 8)
+    assert SGREncoder().encode(text) == b"\x1b[38;2;255;0;0maaaabbbb\x1b[0m"
+
+
+def test_render_spans_accepts_every_color_form():
+    plain = "abc def"
+    expected = SGREncoder().render_spans(plain, [(0, 1, 0xFF0000), (1, 2, (0, 255, 0)), (2, 3, "#0000ff")])
+    for spans in (
+        [(0, 1, (255, 0, 0)), (1, 2, "#00ff00"), (2, 3, 0x0000FF)],
+        [(0, 1, "#ff0000"), (1, 2, 0x00FF00), (2, 3, (0, 0, 255))],
+    ):
+        assert SGREncoder().render_spans(plain, spans) == expected
+    assert _screen(expected) == _screen("\x1b[38;2;255;0;0ma\x1b[38;2;0;255;0mb\x1b[38;2;0;0;255mc\x1b[0m def")
+
+
+def test_render_spans_keeps_the_color_over_whitespace():
+    spans = [(0, 1, "#ff0000"), (1, 2, "#00ff00"), (2, 3, "#0000ff")]
+    output = SGREncoder().render_spans("a b", spans)
+    assert output == "\x1b[38;2;255;0;0ma \x1b[38;2;0;0;255mb\x1b[0m"
+
+
+def test_render_spans_window():
+    plain = "0123456789"
+    spans = [(index, index + 1, (index * 20, 0, 0)) for index in range(3, 6)]
+    output = SGREncoder().render_spans(plain, spans, start=2, end=8)
+    assert "".join(cell[0] for cell in _screen(output)) == "234567"
+
+
+def test_precision_merges_neighbouring_colors():
+    spans = [(index, index + 1, (index, 0, 0)) for index in range(8)]
+    assert SGREncoder(precision=8).render_spans("abcdefgh", spans).count("\x1b[38") == 8
+    assert SGREncoder(precision=4).render_spans("abcdefgh", spans).count("\x1b[38") == 1
+
+
+def test_color_systems():
+    assert color_params((255, 0, 0)) == "38;2;255;0;0"
+    assert color_params((255, 0, 0), "256") == "38;5;196"
+    assert color_params((128, 128, 128), "256", background=True) == "48;5;244"
+    assert color_params((255, 0, 0), "standard") == "91"
+    assert color_params((0, 0, 128), "standard", background=True) == "44"
+    assert rgb_to_eight_bit(0, 0, 0) == 16
+    assert rgb_to_standard(192, 192, 192) == 7
+
+
+def test_counters():
+    encoder = SGREncoder()
+    first = encoder.encode_spans("ab", [(0, 1, "#ff0000"), (1, 2, "#ff0000")])
+    encoder.encode_spans("ab", [(0, 1, "#ff0000"), (1, 2, "#00ff00")])
+    assert encoder.renders == 2
+    assert encoder.total_bytes == len(first) + encoder.bytes_emitted
+    assert encoder.cache_misses == 2
+
+
+@pytest.mark.parametrize("settings, match", [({"color_system": "windows"}, "color system"), ({"precision": 0}, "precision")])
+def test_invalid_settings(settings, match):
+    with pytest.raises(ValueError, match=match):
+        SGREncoder(**settings)
@@ -0,0 +1,85 @@
+import logging
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from maxcolor.formatter import GradientFormatter, TokenCache, loguru_format
+from maxcolor.spec import GradientSpec
+
+ANSI_REGEX = re.compile(r"\x1b\[[0-9;]*m")
+
+
+def _record(message="[db] connection lost", level=logging.WARNING, name="app.db"):
+    return logging.LogRecord(name, level, __file__, 1, message, None, None)
+
+
+@pytest.mark.parametrize(
+    "fmt, style",
+    [
+        ("%(levelname)s %(name)s: %(message)s", "%"),
+        ("%(levelname)-8s|%(name)10s|%(message)s", "%"),
+        ("{levelname:<8}|{name:>10}|{message}", "{"),
+        ("$levelname $name $message", "$"),
+    ],
+)
+def test_plain_text_matches_logging(fmt, style):
+    record = _record()
+    colored = GradientFormatter(fmt, style=style).format(record)
+    assert colored != ANSI_REGEX.sub("", colored)
+    assert ANSI_REGEX.sub("", colored) == logging.Formatter(fmt, style=style).format(_record())
+
+
+def test_padding_is_not_colored():
+    colored = GradientFormatter("%(levelname)-8s|").format(_record(level=logging.INFO))
+    assert colored.endswith("    |")
+    assert not colored.startswith(" ")
+
+
+def test_other_handlers_see_the_plain_record():
+    record = _record()
+    GradientFormatter("%(levelname)s %(name)s %(message)s", prefix=r"\[\w+\]").format(record)
+    assert record.levelname == "WARNING" and record.name == "app.db"
+    assert logging.Formatter("%(levelname)s %(message)s").format(record) == "WARNING [db] connection lost"
+
+
+def test_prefix_is_colored():
+    formatter = GradientFormatter("%(message)s", fields=(), prefix=r"\[\w+\]")
+    colored = formatter.format(_record())
+    assert colored.startswith("\x1b[") and colored.endswith("\x1b[0m connection lost")
+    assert formatter.format(_record("no prefix")) == "no prefix"
+
+
+def test_tokens_are_cached():
+    tokens = TokenCache(GradientSpec(["red", "blue"]), maxsize=2)
+    first = tokens("INFO")
+    assert tokens("INFO") is first
+    assert (tokens.hits, tokens.misses) == (1, 1)
+    tokens(" ERROR ")
+    assert tokens(" ERROR ").startswith(" \x1b[") and tokens(" ERROR ").endswith("\x1b[0m ")
+    tokens("DEBUG")  # The cache is full, so it starts over
+    tokens("INFO")
+    assert tokens.misses == 4
+
+
+def test_loguru_format_colors_fields_and_escapes_them():
+    format_record = loguru_format("{level: <8} | {name} | {function} - {message}\n", fields=("level", "name"))
+    record = {"level": SimpleNamespace(name="INFO"), "name": "app.{db}<x>", "function": "main"}
+    compiled = format_record(record)
+    assert format_record(dict(record)) is compiled
+    # Loguru formats the result again, so braces and tags of the values are escaped
+    plain = ANSI_REGEX.sub("", compiled)
+    assert plain == "INFO     | app.{{db}}\\<x> | {function} - {message}\n"
+    assert compiled.startswith("\x1b[")
+
+
+def test_loguru_round_trip(capsys):
+    loguru = pytest.importorskip("loguru")
+    logger = loguru.logger.bind()
+    handler = logger.add(lambda message: print(message, end=""), format=loguru_format("{level: <8} | {message}\n"))
+    try:
+        logger.info("hello {}", "world")
+    finally:
+        logger.remove(handler)
+    output = capsys.readouterr().out
+    assert ANSI_REGEX.sub("", output) == "INFO     | hello world\n"
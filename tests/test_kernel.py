@@ -0,0 +1,92 @@
+import pytest
+
+from maxcolor.kernel import gradient_spans, interpolate, parse_color, quantize
+
+
+@pytest.mark.parametrize(
+    "value, rgb",
+    [
+        ("magenta", (255, 0, 255)),
+        (" #FF00ff ", (255, 0, 255)),
+        ("255,0,255", (255, 0, 255)),
+        ("rgb(1;2;3)", (1, 2, 3)),
+        ((1, 2, 3), (1, 2, 3)),
+        ([0, 128, 255], (0, 128, 255)),
+    ],
+)
+def test_parse_color(value, rgb):
+    assert parse_color(value) == rgb
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["mauve", "#12345", "256,0,0", (300, 0, 0), (-1, 0, 0), (0, 0), (0, 0, 0, 0), (0.5, 0, 0), (True, 0, 0), 5, None],
+)
+def test_parse_color_rejects_invalid_colors(value):
+    with pytest.raises(ValueError, match="Unable to parse color"):
+        parse_color(value)
+
+
+def test_interpolate_reaches_every_stop():
+    stops = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+    colors = interpolate(stops, 5)
+    assert colors == [(255, 0, 0), (127, 127, 0), (0, 255, 0), (0, 127, 127), (0, 0, 255)]
+
+
+def test_interpolate_window_matches_the_whole_gradient():
+    stops = [(10, 20, 30), (250, 0, 120), (0, 200, 0)]
+    whole = interpolate(stops, 97)
+    deltas = [(r1, g1, b1, r2 - r1, g2 - g1, b2 - b1) for (r1, g1, b1), (r2, g2, b2) in zip(stops, stops[1:])]
+    assert interpolate(stops, 97, 13, 60) == whole[13:60]
+    assert interpolate(stops, 97, 90, 200) == whole[90:]
+    assert interpolate(stops, 97, deltas=deltas) == whole
+
+
+@pytest.mark.parametrize("count, start, stop, expected", [(0, 0, None, []), (3, 3, None, []), (1, 0, None, [(1, 2, 3)])])
+def test_interpolate_edges(count, start, stop, expected):
+    assert interpolate([(1, 2, 3), (4, 5, 6)], count, start, stop) == expected
+
+
+def test_interpolate_needs_stops():
+    with pytest.raises(ValueError, match="without any color stops"):
+        interpolate([], 3)
+
+
+@pytest.mark.parametrize(
+    "granularity, expected",
+    [
+        ("char", [(0, 1), (1, 2), (2, 3), (3, 4), (4, 5), (5, 6), (6, 7), (7, 8), (8, 9)]),
+        (4, [(0, 4), (4, 8), (8, 9)]),
+        ("word", [(0, 2), (3, 5), (7, 9)]),
+        ("line", [(0, 2), (3, 9)]),
+    ],
+)
+def test_quantize(granularity, expected):
+    assert quantize("ab\ncd  ef", granularity) == expected
+
+
+@pytest.mark.parametrize("granularity", ["char", 1, 3, "word", "line"])
+@pytest.mark.parametrize("max_spans", [1, 2, 5, 7, 1000])
+def test_quantize_budget_merges_whole_bands_evenly(granularity, max_spans):
+    text = "lorem ipsum\ndolor sit amet,\n consectetur adipiscing elit"
+    bands = quantize(text, granularity)
+    merged = quantize(text, granularity, max_spans)
+    assert len(merged) == min(len(bands), max_spans)
+    # Every merged band starts and ends on a band boundary, in order and without gaps between bands
+    assert {start for start, _ in merged} <= {start for start, _ in bands}
+    assert {end for _, end in merged} <= {end for _, end in bands}
+    assert merged[0][0] == bands[0][0] and merged[-1][1] == bands[-1][1]
+    assert all(end <= start for (_, end), (start, _) in zip(merged, merged[1:]))
+    sizes = [sum(1 for band in bands if start <= band[0] and band[1] <= end) for start, end in merged]
+    assert max(sizes) - min(sizes) <= 1
+
+
+@pytest.mark.parametrize("granularity, max_spans", [(0, None), ("block", None), (True, None), ("word", 0)])
+def test_quantize_rejects_invalid_settings(granularity, max_spans):
+    with pytest.raises(ValueError, match="Invalid"):
+        quantize("some text", granularity, max_spans)
+
+
+def test_gradient_spans():
+    spans = gradient_spans("abcd", [(0, 0, 0), (255, 255, 255)], 2)
+    assert spans == [(0, 2, "#000000"), (2, 4, "#ffffff")]
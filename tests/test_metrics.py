@@ -0,0 +1,42 @@
+from maxcolor import metrics
+from maxcolor.maxcolor import gradient, gradient_panel, rainbow
+from maxcolor.profiling import profile
+
+
+def test_rainbow_counts_once_under_rainbow():
+    metrics.reset()
+    metrics.enable()
+    try:
+        rainbow("Hello, world", seed=1)
+        counts = metrics.snapshot()
+    finally:
+        metrics.disable()
+        metrics.reset()
+    assert counts["calls"] == {"rainbow": 1}
+    assert counts["chars"] == {"rainbow": 12}
+    assert counts["spans_created"] == {"rainbow": 12}
+
+
+def test_rainbow_matches_a_full_spectrum_gradient():
+    assert rainbow("Hello, world", seed=3) == gradient("Hello, world", color_stops=9, seed=3)
+
+
+def test_gradient_panel_counts_its_title_once():
+    metrics.reset()
+    metrics.enable()
+    try:
+        gradient_panel("Hello, world", title="Title", seed=1)
+        counts = metrics.snapshot()
+    finally:
+        metrics.disable()
+        metrics.reset()
+    assert counts["calls"] == {"gradient_panel": 1}
+    assert counts["chars"] == {"gradient_panel": 17}
+    assert counts["spans_created"] == {"gradient_panel": 17}
+
+
+def test_gradient_panel_profiles_only_its_own_stages():
+    with profile() as timings:
+        gradient_panel("Hello, world", title="Title", seed=1)
+    assert list(timings.totals()) == ["gradient_panel"]
+    assert "title" in timings.totals()["gradient_panel"]
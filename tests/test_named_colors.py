@@ -0,0 +1,55 @@
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+from maxcolor.kernel import SPECTRUM
+from maxcolor.named_colors import COLORS, HEX, NAMES, RGB_TUPLES, HexColor, NamedColor, RgbTuple, get, lookup
+from maxcolor.palette import SPECTRUM as SPECTRUM_PALETTE
+
+
+@pytest.mark.parametrize("value", ["cyan", " Cyan ", "#00FFFF", "#00ffff", "00ffff", (0, 255, 255), 5, -5])
+def test_every_form_finds_the_same_object(value):
+    assert lookup(value) is COLORS[5]
+
+
+@pytest.mark.parametrize("value", ["mauve", "#123456", (1, 2, 3), [0, 255, 255], 10, -11, None, 1.5])
+def test_unknown_colors(value):
+    assert get(value) is None
+    with pytest.raises(ValueError, match="Not a named color"):
+        lookup(value)
+
+
+def test_the_ring_wraps():
+    assert [color.name for color in COLORS] == list(NAMES)
+    assert lookup("red").next is lookup("magenta")
+    assert lookup("magenta").prev is lookup("red")
+    assert all(color.next.prev is color and color.next_index == (color.index + 1) % len(COLORS) for color in COLORS)
+    assert all(color.prev_index == (color.index - 1) % len(COLORS) for color in COLORS)
+
+
+def test_colors_are_immutable_singletons():
+    color = lookup("blue")
+    with pytest.raises(AttributeError, match="immutable"):
+        color.name = "azure"
+    with pytest.raises(AttributeError, match="immutable"):
+        del color.hex
+    assert pickle.loads(pickle.dumps(color)) is color
+    assert (repr(color), str(color)) == ("NamedColor('blue', '#0000ff', index=3)", "blue")
+    assert color.rgb == (0, 0, 255) and color.packed == 0x0000FF
+
+
+def test_views_agree():
+    assert HEX == tuple(color.hex for color in COLORS)
+    assert RGB_TUPLES == tuple(SPECTRUM.values())
+    assert NAMES == tuple(SPECTRUM) == SPECTRUM_PALETTE.names
+    assert [member.value for member in HexColor] == list(HEX)
+    assert [member.value for member in RgbTuple] == list(RGB_TUPLES)
+    assert all(isinstance(color, NamedColor) for color in COLORS)
+
+
+def test_importing_does_not_import_rich():
+    code = "import sys, maxcolor.named_colors\nassert 'rich' not in sys.modules, sorted(sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,53 @@
+import copy
+import pickle
+
+import pytest
+
+from maxcolor.palette import SPECTRUM, Palette
+
+
+@pytest.mark.parametrize("field", ["name", "colors", "names", "_indexes"])
+def test_palette_is_immutable(field):
+    palette = Palette(["#0b1f3a", "#1565c0", "#00b8d4"], names=["navy", "blue", "teal"], name="brand")
+    with pytest.raises(AttributeError, match="immutable"):
+        setattr(palette, field, None)
+    with pytest.raises(AttributeError, match="immutable"):
+        delattr(palette, field)
+
+
+def test_lazy_lookups_still_work():
+    assert SPECTRUM.index("cyan") == 5
+    assert SPECTRUM.find("#00FFFF") == ("hex", 5)
+
+
+@pytest.mark.parametrize("names", [None, ["navy", "blue", "teal"]])
+def test_pickle_and_copy(names):
+    palette = Palette(["#0b1f3a", "#1565c0", "#00b8d4"], names=names, name="brand")
+    for restored in (pickle.loads(pickle.dumps(palette)), copy.deepcopy(palette)):
+        assert restored == palette
+        assert restored.name == "brand"
+        assert restored.tables()[2] == palette.tables()[2]
+
+
+def test_from_tables_round_trip():
+    restored = Palette.from_tables(SPECTRUM.colors, SPECTRUM.names, SPECTRUM.name, *SPECTRUM.tables())
+    assert restored == SPECTRUM
+    assert restored.deltas([3, 2, 1]) == SPECTRUM.deltas([3, 2, 1])
+
+
+@pytest.mark.parametrize("color", [(300, 0, 0), (0, 0), "#12345"])
+def test_invalid_colors_are_rejected(color):
+    with pytest.raises(ValueError, match="Unable to parse color"):
+        Palette([color, (0, 0, 0)])
+
+
+def test_colors_are_read_only():
+    palette = Palette(["#0b1f3a", "#1565c0", "#00b8d4"])
+    before = hash(palette)
+    with pytest.raises(TypeError):
+        palette.colors[0] = 0xFFFFFF
+    assert palette.packed(0) == 0x0B1F3A
+    assert palette.hex(0) == "#0b1f3a"
+    assert palette.rgb(0) == (11, 31, 58)
+    assert hash(palette) == before
+    assert palette.colors.tolist() == [0x0B1F3A, 0x1565C0, 0x00B8D4]
@@ -0,0 +1,120 @@
+import json
+import os
+
+import pytest
+
+from maxcolor import palette_file
+from maxcolor.palette import Palette
+from maxcolor.palette_file import load_palette, read_palette_file, read_sidecar, sidecar_path
+
+BRAND = {"name": "brand", "colors": ["#0b1f3a", "#1565c0", "#00b8d4", "#ffd600"], "names": ["navy", "blue", "teal", "gold"]}
+
+
+def _write(path, data, mtime_ns=None):
+    path.write_text(json.dumps(data), encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def brand(tmp_path):
+    path = tmp_path / "brand.json"
+    _write(path, BRAND, 1_000_000_000_000_000_000)
+    return path
+
+
+def _no_parsing(monkeypatch):
+    def parse(path):
+        raise AssertionError("The palette file was parsed again")
+
+    monkeypatch.setattr(palette_file, "read_palette_file", parse)
+
+
+def test_sidecar_round_trip(brand, monkeypatch):
+    palette = load_palette(brand)
+    assert sidecar_path(brand).exists()
+    _no_parsing(monkeypatch)
+    loaded = load_palette(brand)
+    assert loaded == palette
+    assert loaded.name == "brand"
+    assert loaded.names == ("navy", "blue", "teal", "gold")
+    assert loaded.tables()[2] == palette.tables()[2]
+    assert loaded.index("teal") == 2
+
+
+def test_toml_table(tmp_path):
+    path = tmp_path / "brand.toml"
+    path.write_text('name = "brand"\n[colors]\nnavy = "#0b1f3a"\nblue = [21, 101, 192]\n', encoding="utf-8")
+    palette = load_palette(path)
+    assert palette.names == ("navy", "blue")
+    assert palette.rgb(1) == (21, 101, 192)
+    assert read_sidecar(path) == palette
+
+
+def test_stale_sidecar_is_recompiled(brand):
+    load_palette(brand)
+    _write(brand, {**BRAND, "colors": ["#000000", "#111111", "#222222", "#333333"]}, 1_500_000_000_000_000_000)
+    assert read_sidecar(brand) is None
+    assert load_palette(brand).hex(3) == "#333333"
+    assert read_sidecar(brand).hex(3) == "#333333"
+
+
+def test_sidecar_of_another_file_version_is_ignored(brand):
+    load_palette(brand)
+    # Same size and an older mtime than the sidecar, but not the mtime the sidecar was compiled from
+    _write(brand, {**BRAND, "colors": ["#000000", "#111111", "#222222", "#333333"]}, 999_999_999_000_000_000)
+    assert read_sidecar(brand) is None
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        lambda data: b"",
+        lambda data: data[:10],
+        lambda data: b"XXXX" + data[4:],
+        lambda data: data[:-1],
+        lambda data: data + b"\0",
+    ],
+)
+def test_corrupt_sidecar_is_reparsed(brand, corrupt):
+    palette = load_palette(brand)
+    sidecar = sidecar_path(brand)
+    sidecar.write_bytes(corrupt(sidecar.read_bytes()))
+    assert read_sidecar(brand) is None
+    assert load_palette(brand) == palette
+    assert read_sidecar(brand) == palette
+
+
+def test_sidecar_with_bad_tables_is_reparsed(brand):
+    palette = load_palette(brand)
+    sidecar = sidecar_path(brand)
+    data = bytearray(sidecar.read_bytes())
+    # The first forward path entry points past the end of the ring
+    start = palette_file.HEADER.size + len(palette) * 4
+    data[start : start + 2] = (len(palette)).to_bytes(2, "little")
+    sidecar.write_bytes(bytes(data))
+    assert read_sidecar(brand) is None
+
+
+@pytest.mark.parametrize("names", ["navyblue", ["navy", "blue", "teal", 4], ["navy", "bl\0ue", "teal", "gold"], {"a": 1}])
+def test_invalid_names(tmp_path, names):
+    path = tmp_path / "brand.json"
+    _write(path, {**BRAND, "names": names})
+    with pytest.raises(ValueError, match="names|invalid name"):
+        read_palette_file(path)
+
+
+def test_invalid_colors(tmp_path):
+    path = tmp_path / "brand.json"
+    _write(path, {"colors": ["#0b1f3a", [300, 0, 0]]})
+    with pytest.raises(ValueError, match="invalid color 1"):
+        read_palette_file(path)
+
+
+def test_read_only_directory_still_loads(brand, monkeypatch):
+    def unwritable(palette, path, source=None):
+        raise PermissionError("read-only")
+
+    monkeypatch.setattr(palette_file, "write_sidecar", unwritable)
+    assert isinstance(load_palette(brand), Palette)
+    assert not sidecar_path(brand).exists()
@@ -0,0 +1,52 @@
+import io
+import os
+import re
+
+import pytest
+
+from maxcolor import parallel
+from maxcolor.cli import main
+from maxcolor.stream import StreamColorizer
+
+
+def _colored_chars(output: bytes) -> list[tuple[str, str]]:
+    """Each character with the escape in effect for it, whatever chunk it came in."""
+    colored, escape = [], ""
+    for part in re.split(r"(\x1b\[[0-9;]*m)", output.decode("utf-8")):
+        if part.startswith("\x1b["):
+            escape = part
+        else:
+            colored.extend((escape, char) for char in part)
+    return colored
+
+
+def test_colorize_file_continues_the_gradient_across_chunks(tmp_path):
+    path = tmp_path / "log.txt"
+    text = "".join(f"line {number}: ünïcode and ascii\n" for number in range(2000))
+    path.write_text(text, encoding="utf-8")
+    output = io.BytesIO()
+    parallel.colorize_file(path, output, workers=2, chunk_bytes=4096)
+    colorizer = StreamColorizer()
+    expected = (colorizer.feed(text) + colorizer.finish()).encode("utf-8")
+    assert _colored_chars(output.getvalue()) == _colored_chars(expected)
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="Needs /proc to count open files")
+def test_chunks_leave_no_mapping_open(tmp_path):
+    path = tmp_path / "log.txt"
+    path.write_bytes(b"first\n")
+    before = len(os.listdir("/proc/self/fd"))
+    parallel._colorize(str(path), 0, 6, 0, 0, ())
+    assert len(os.listdir("/proc/self/fd")) == before
+
+    # A file that changed since is read afresh
+    path.write_bytes(b"other\n")
+    assert parallel._count(str(path), 0, 6) == (6, 1)
+    assert b"other" in parallel._colorize(str(path), 0, 6, 0, 0, ())
+
+
+def test_missing_file_is_a_usage_error(tmp_path, capsys):
+    with pytest.raises(SystemExit) as exited:
+        main(["--file", str(tmp_path / "missing.log")])
+    assert exited.value.code == 2
+    assert "missing.log: No such file or directory" in capsys.readouterr().err
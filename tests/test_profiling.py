@@ -0,0 +1,90 @@
+import threading
+from io import StringIO
+
+from rich.console import Console
+
+from maxcolor import profiling
+from maxcolor.maxcolor import gradient, gradient_panel
+from maxcolor.profiling import add_hook, profile, remove_hook
+
+GRADIENT_STAGES = ["stops", "interpolation", "styles", "text"]
+
+
+def test_gradient_stages_are_timed():
+    with profile() as timings:
+        gradient("Hello, world", seed=1)
+        gradient("Hello again", seed=2)
+    assert list(timings.totals()["gradient"]) == GRADIENT_STAGES
+    assert all(timings.timings[("gradient", stage)][0] == 2 for stage in GRADIENT_STAGES)
+    assert timings.total_ns == sum(timings.totals()["gradient"].values()) > 0
+
+
+def test_panel_stages_are_timed():
+    with profile() as timings:
+        gradient_panel("Hello, world", title="Title", seed=1)
+    assert list(timings.totals()["gradient_panel"]) == [*GRADIENT_STAGES, "title", "panel"]
+
+
+def test_active_only_while_something_listens():
+    assert not profiling.active
+    with profile():
+        assert profiling.active
+        with profile():
+            assert profiling.active
+        assert profiling.active
+    assert not profiling.active
+
+    def hook(source, stage, nanoseconds):
+        pass
+
+    add_hook(hook)
+    assert profiling.active
+    remove_hook(hook)
+    assert not profiling.active
+
+
+def test_nested_profiles_and_user_stages():
+    with profile() as outer:
+        with profile() as inner:
+            gradient("Hello", seed=1)
+        with outer.stage("render"):
+            gradient("Hello", seed=1)
+    assert list(inner.totals()) == ["gradient"]
+    assert outer.timings[("gradient", "text")][0] == 2
+    assert outer.timings[("user", "render")][0] == 1
+
+
+def test_profiles_are_per_thread_and_hooks_are_global():
+    calls = []
+
+    def hook(source, stage, nanoseconds):
+        calls.append((threading.current_thread().name, source, stage))
+
+    add_hook(hook)
+    try:
+        with profile() as timings:
+            thread = threading.Thread(target=gradient, args=("Hello",), kwargs={"seed": 1}, name="other")
+            thread.start()
+            thread.join()
+    finally:
+        remove_hook(hook)
+    assert timings.timings == {}
+    assert calls == [("other", "gradient", stage) for stage in GRADIENT_STAGES]
+
+
+def test_profile_hook():
+    calls = []
+    with profile(lambda *timing: calls.append(timing)) as timings:
+        gradient("Hello", seed=1)
+    assert [(source, stage) for source, stage, _ in calls] == list(timings.timings)
+    assert all(nanoseconds >= 0 for _, _, nanoseconds in calls)
+
+
+def test_profile_renders_as_a_table():
+    with profile() as timings:
+        gradient("Hello", seed=1)
+    console = Console(file=StringIO(), width=120)
+    console.print(timings)
+    output = console.file.getvalue()
+    assert "maxcolor profile" in output
+    assert all(stage in output for stage in GRADIENT_STAGES)
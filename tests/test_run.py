@@ -0,0 +1,89 @@
+import pytest
+
+from maxcolor.run import PassthroughColorizer, _child_colored
+
+
+@pytest.mark.parametrize(
+    "params, colored",
+    [
+        (b"31", True),
+        (b"1;91", True),
+        (b"38;5;33", True),
+        (b"38;2;30;60;90", True),
+        (b"38:2::30:60:90", True),
+        (b"48;2;30;60;90", False),
+        (b"48;5;33", False),
+        (b"48;5;97", False),
+        (b"58;2;31;32;33", False),
+        (b"1;4", False),
+    ],
+)
+def test_child_colored(params, colored):
+    assert _child_colored(params, False) is colored
+
+
+@pytest.mark.parametrize("params", [b"", b"0", b"39", b"31;0", b"1;39"])
+def test_child_color_handed_back(params):
+    assert _child_colored(params, True) is False
+
+
+def test_background_keeps_the_child_color():
+    assert _child_colored(b"48;5;33", True) is True
+
+
+@pytest.mark.parametrize("escape", [b"\x1b[48;2;30;60;90m", b"\x1b[48;5;33m"])
+def test_background_only_sequences_keep_passthrough(escape):
+    passthrough = PassthroughColorizer()
+    output = passthrough.feed(escape + b"hello")
+    assert not passthrough.child_colored
+    assert output.startswith(escape)
+    assert output[len(escape) :] != b"hello"  # The text is colored by the gradient
+
+
+def test_child_foreground_disables_coloring():
+    passthrough = PassthroughColorizer()
+    assert passthrough.feed(b"\x1b[31mhello") == b"\x1b[31mhello"
+    assert passthrough.child_colored
+
+
+SIXEL = b"\x1bPq#0;2;0;0;0#1;2;100;100;0~~@@vv@@~~@@~~$-\x1b\\"
+STRING_SEQUENCES = [
+    SIXEL,
+    b"\x1b_Gf=100,a=T;iVBORw0KGgo=\x1b\\",  # kitty graphics (APC)
+    b"\x1b^private message\x1b\\",  # PM
+    b"\x1bXstart of string\x1b\\",  # SOS
+    b"\x1bPtmux;\x1b\x1b]52;c;aGVsbG8=\x07\x1b\x1b\\\x1b\\",  # tmux passthrough, escapes doubled
+]
+
+
+def _split(output: bytes, sequence: bytes) -> tuple[bytes, bytes]:
+    assert output.count(sequence) == 1
+    return output.split(sequence)
+
+
+@pytest.mark.parametrize("sequence", STRING_SEQUENCES)
+def test_string_sequences_pass_through(sequence):
+    passthrough = PassthroughColorizer()
+    output = passthrough.feed(b"before " + sequence + b" after") + passthrough.finish()
+    before, after = _split(output, sequence)
+    assert b"before" in before and before != b"before "
+    assert b"after" in after and after != b" after"
+
+
+@pytest.mark.parametrize("sequence", STRING_SEQUENCES)
+@pytest.mark.parametrize("size", [1, 3, 7])
+def test_string_sequences_split_across_chunks(sequence, size):
+    data = b"before " + sequence + b" after"
+    passthrough = PassthroughColorizer()
+    output = b"".join(passthrough.feed(data[index : index + size]) for index in range(0, len(data), size))
+    output += passthrough.finish()
+    _split(output, sequence)
+
+
+def test_string_sequences_longer_than_the_buffer_still_pass_through(monkeypatch):
+    monkeypatch.setattr("maxcolor.run.MAX_PENDING_STRING", 16)
+    passthrough = PassthroughColorizer()
+    output = passthrough.feed(b"\x1bPq" + b"~" * 64)
+    assert output == b"\x1bPq" + b"~" * 64
+    output = passthrough.feed(b"-@@\x1b") + passthrough.feed(b"\\after")
+    assert output.startswith(b"-@@\x1b\\") and output != b"-@@\x1b\\after"
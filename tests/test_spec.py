@@ -0,0 +1,101 @@
+import asyncio
+import re
+
+import pytest
+
+from maxcolor.aio import acolorize, agradient
+from maxcolor.kernel import gradient_spans
+from maxcolor.spec import GradientSpec
+
+TEXT = "The quick brown fox\njumps over  the lazy dog. " * 40
+
+
+def _colors(output: str) -> list[tuple[str, str]]:
+    """Every character of colored output with the escape that is in effect for it, resets dropped."""
+    cells = []
+    escape = ""
+    for index, part in enumerate(re.split(r"(\x1b\[[0-9;]*m)", output)):
+        if index % 2:
+            escape = "" if part in ("\x1b[0m", "\x1b[39m") else part
+        else:
+            cells.extend((character, escape) for character in part if not character.isspace())
+    return cells
+
+
+@pytest.mark.parametrize(
+    "granularity, max_spans", [("char", None), (3, None), ("word", None), ("line", None), ("char", 50), ("word", 7)]
+)
+def test_render_colors_like_the_kernel(granularity, max_spans):
+    stops = ["#ff0000", (0, 0, 255), "green"]
+    spec = GradientSpec(stops, granularity, max_spans)
+    expected = []
+    for start, end, color in gradient_spans(TEXT, spec.stops, granularity, max_spans):
+        red, green, blue = (int(color[index : index + 2], 16) for index in (1, 3, 5))
+        expected.extend((character, f"\x1b[38;2;{red};{green};{blue}m") for character in TEXT[start:end])
+    assert _colors(spec.render(TEXT)) == [cell for cell in expected if not cell[0].isspace()]
+
+
+@pytest.mark.parametrize("granularity, max_spans", [("char", None), (4, None), ("word", None), ("char", 100)])
+@pytest.mark.parametrize("chunk", [1, 7, 4096])
+def test_pieces_join_to_the_render(granularity, max_spans, chunk):
+    spec = GradientSpec(granularity=granularity, max_spans=max_spans)
+    pieces = list(spec.iter_render(TEXT, chunk))
+    assert all(piece.endswith("\x1b[0m") for piece in pieces if "\x1b[38" in piece)
+    joined = "".join(pieces)
+    assert re.sub(r"\x1b\[[0-9;]*m", "", joined) == TEXT
+    assert _colors(joined) == _colors(spec.render(TEXT))
+
+
+@pytest.mark.parametrize("text", ["", "   ", "\n\n"])
+def test_render_without_bands(text):
+    for granularity in ("char", "word", "line"):
+        assert re.sub(r"\x1b\[[0-9;]*m", "", GradientSpec(granularity=granularity).render(text)) == text
+
+
+def test_equal_specs_share_a_key():
+    spec = GradientSpec(["red", "blue"], "word")
+    same = GradientSpec([(255, 0, 0), "#0000ff"], "word")
+    assert spec == same and hash(spec) == hash(same)
+    assert spec != GradientSpec(["red", "blue"], "word", color_system="256")
+    assert len({spec, same, GradientSpec()}) == 2
+
+
+@pytest.mark.parametrize(
+    "settings, match",
+    [
+        ({"stops": ["mauve"]}, "Unable to parse color"),
+        ({"granularity": "sentence"}, "Invalid granularity"),
+        ({"max_spans": 0}, "Invalid max_spans"),
+        ({"color_system": "cga"}, "Invalid color system"),
+        ({"precision": 0}, "Invalid precision"),
+    ],
+)
+def test_invalid_settings(settings, match):
+    with pytest.raises(ValueError, match=match):
+        GradientSpec(**settings)
+
+
+@pytest.mark.parametrize("executor_threshold", [None, 1])
+def test_acolorize_renders_like_the_spec(executor_threshold):
+    spec = GradientSpec(["red", "blue"])
+    output = asyncio.run(acolorize(TEXT, spec, chunk=16, executor_threshold=executor_threshold))
+    assert _colors(output) == _colors(spec.render(TEXT))
+
+
+def test_agradient_pulls_one_line_at_a_time():
+    pulled = []
+
+    async def source():
+        for number in range(5):
+            pulled.append(number)
+            yield f"line {number}"
+
+    async def consume():
+        lines = agradient(source(), GradientSpec(["red", "blue"]))
+        first = await lines.__anext__()
+        assert pulled == [0]
+        rest = [line async for line in lines]
+        return [first, *rest]
+
+    colored = asyncio.run(consume())
+    assert [re.sub(r"\x1b\[[0-9;]*m", "", line) for line in colored] == [f"line {number}" for number in range(5)]
@@ -0,0 +1,92 @@
+import io
+import re
+
+import pytest
+
+from maxcolor.encoder import RESET
+from maxcolor.stream import StreamColorizer
+
+
+@pytest.mark.parametrize("text", ["a\n\nb\n", "\n", "\n\n", "one line", "a\nb", "trailing\n\n\n"])
+@pytest.mark.parametrize("line", [0, 5])
+def test_line_mode_bytes_match_text(text, line):
+    colorizer = StreamColorizer(mode="line", period=8)
+    expected = colorizer.colorize(text, line=line).encode("ascii")
+    assert colorizer.colorize_bytes(text.encode("ascii"), line=line) == expected
+
+
+def test_line_mode_skips_empty_lines():
+    colorizer = StreamColorizer(mode="line", period=8)
+    escapes = colorizer.escapes
+    assert colorizer.colorize_bytes(b"a\n\nb\n") == f"{escapes[0]}a\n\n{escapes[2]}b\n".encode("ascii")
+
+
+def _colors(output: str) -> list[tuple[str, str]]:
+    """Every character of colored output with the escape that is in effect for it."""
+    cells = []
+    escape = ""
+    for index, part in enumerate(re.split(r"(\x1b\[[0-9;]*m)", output)):
+        if index % 2:
+            escape = part
+        else:
+            cells.extend((character, escape) for character in part)
+    return cells
+
+
+TEXT = "".join(f"line {number}: {'lorem ipsum ' * (number % 7)}\n" for number in range(300))
+
+
+@pytest.mark.parametrize("offset", [0, 1, 15, 16, 239, 1000])
+@pytest.mark.parametrize("band", [1, 16])
+def test_period_mode_bytes_match_text(offset, band):
+    colorizer = StreamColorizer(period=48, band=band)
+    assert colorizer.colorize_bytes(TEXT.encode("ascii"), offset) == colorizer.colorize(TEXT, offset).encode("ascii")
+
+
+@pytest.mark.parametrize("mode", ["period", "line"])
+def test_every_character_gets_the_color_of_its_position(mode):
+    colorizer = StreamColorizer(mode=mode, period=12, band=3)
+    cells = _colors(colorizer.colorize(TEXT[:500], offset=7, line=2))
+    line = 2
+    for offset, (character, escape) in enumerate(cells, 7):
+        if character != "\n":
+            assert escape == colorizer.color(offset, line)
+        else:
+            line += 1
+
+
+@pytest.mark.parametrize("mode", ["period", "line"])
+@pytest.mark.parametrize("size", [1, 7, 4096])
+def test_chunks_color_like_the_whole_stream(mode, size):
+    text = TEXT[:3000].replace("ipsum", "ïpsüm ✓")
+    data = text.encode("utf-8")
+    whole = StreamColorizer(mode=mode, period=20, band=4)
+    colorizer = StreamColorizer(mode=mode, period=20, band=4)
+    # Chunks that split multibyte characters are decoded incrementally
+    chunks = [colorizer.feed_bytes(data[start : start + size]) for start in range(0, len(data), size)]
+    output = b"".join(chunks) + colorizer.feed_bytes(b"", final=True)
+    expected = whole.colorize(text)
+    assert _colors(output.decode("utf-8")) == _colors(expected)
+
+
+def test_pipe():
+    colorizer = StreamColorizer(period=8, band=2)
+    target = io.BytesIO()
+    written = colorizer.pipe(io.BytesIO(TEXT.encode("ascii")), target, chunk_size=100)
+    output = target.getvalue()
+    assert written == len(output)
+    assert output.endswith(RESET.encode("ascii"))
+    assert _colors(output.decode("ascii")[: -len(RESET)]) == _colors(StreamColorizer(period=8, band=2).colorize(TEXT))
+    assert StreamColorizer().pipe(io.BytesIO(), target) == 0
+
+
+def test_rich_encoder_resets_before_every_color():
+    assert all(escape.startswith(RESET) for escape in StreamColorizer(encoder="rich").escapes)
+
+
+@pytest.mark.parametrize(
+    "settings", [{"mode": "word"}, {"encoder": "plain"}, {"period": 0}, {"band": 0}, {"precision": 9}]
+)
+def test_invalid_settings(settings):
+    with pytest.raises(ValueError, match="Invalid"):
+        StreamColorizer(**settings)
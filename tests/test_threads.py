@@ -0,0 +1,89 @@
+import random
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from io import StringIO
+
+import pytest
+from rich.console import Console
+
+from maxcolor.maxcolor import get_console, get_rng, gradient, gradient_panel, not_gradient, rainbow
+
+MESSAGE = "Sunt sit est labore elit ut laboris est."
+ENTRY_POINTS = {
+    "gradient": lambda seed: gradient(MESSAGE, seed=seed),
+    "rainbow": lambda seed: rainbow(MESSAGE, seed=seed),
+    "not_gradient": lambda seed: not_gradient(MESSAGE, seed=seed),
+    "gradient_panel": lambda seed: gradient_panel(MESSAGE, title="Title", width=60, seed=seed),
+}
+_local = threading.local()
+
+
+def _render(renderable) -> str:
+    """Render with the calling thread's own console."""
+    console = getattr(_local, "console", None)
+    if console is None:
+        console = _local.console = Console(file=StringIO(), force_terminal=True, color_system="truecolor", width=80)
+    with console.capture() as capture:
+        console.print(renderable)
+    return capture.get()
+
+
+@pytest.mark.parametrize("name", ENTRY_POINTS)
+def test_seeded_calls_match_from_many_threads(name):
+    call = ENTRY_POINTS[name]
+    reference = [_render(call(seed)) for seed in range(8)]
+    stdout = StringIO()
+    with redirect_stdout(stdout), ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(lambda index: (index % 8, _render(call(index % 8))), range(400)))
+    assert not stdout.getvalue()
+    assert all(output == reference[seed] for seed, output in results)
+    assert len(set(reference)) > 1
+
+
+def test_unseeded_calls_leave_the_global_generator_alone():
+    random.seed(5)
+    state = random.getstate()
+    for call in ENTRY_POINTS.values():
+        call(None)
+    assert random.getstate() == state
+
+
+def test_each_thread_has_its_own_generator():
+    generators = []
+
+    def collect():
+        generators.append(get_rng())
+        generators.append(get_rng())
+
+    threads = [threading.Thread(target=collect) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(generator) for generator in generators}) == 4
+    explicit = random.Random(1)
+    assert get_rng(explicit, seed=2) is explicit
+    assert get_rng(seed=2).random() == random.Random(2).random()
+
+
+def test_console_is_created_once_on_first_use():
+    with ThreadPoolExecutor(8) as executor:
+        consoles = list(executor.map(lambda _: get_console(), range(32)))
+    assert all(console is consoles[0] for console in consoles)
+
+
+def test_import_has_no_side_effects():
+    code = (
+        "import sys\n"
+        "from loguru import logger\n"
+        "handlers = dict(logger._core.handlers)\n"
+        "import maxcolor.maxcolor as module\n"
+        "assert module._console is None\n"
+        "assert dict(logger._core.handlers) == handlers\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout == ""
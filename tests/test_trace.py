@@ -0,0 +1,80 @@
+import json
+import threading
+from io import StringIO
+
+import pytest
+from rich.console import Console
+
+from maxcolor import maxcolor, trace
+from maxcolor.maxcolor import generate_color_range, random_color_index
+
+
+def test_generate_color_range_records_every_step():
+    with trace.trace() as events:
+        colors = generate_color_range("red", "blue")
+    assert ("validate_range_input", "mode", None, "color") in events.events
+    steps = [event for event in events if event.function == "generate_color_range"]
+    assert [event.step for event in steps] == ["start"] + ["next"] * (len(colors) - 1)
+    assert [event.color for event in steps] == colors
+    assert steps[0].color == "red" and steps[-1].color == "blue"
+
+
+def test_random_color_index_records_its_indexes():
+    with trace.trace() as events:
+        indexes = random_color_index(4, seed=3)
+    assert [event.index for event in events if event.function == "random_color_index"] == indexes
+
+
+def test_nothing_is_recorded_without_a_trace():
+    assert not trace.active and trace.current() is None
+    trace.record("function", "step")
+    with trace.trace() as events:
+        assert trace.active and trace.current() is events
+        with trace.trace() as inner:
+            trace.record("function", "step", 1, "red")
+        trace.record("function", "other")
+    assert not trace.active
+    assert list(inner) == [trace.Event("function", "step", 1, "red")]
+    assert [event.step for event in events] == ["step", "other"]
+
+
+def test_traces_are_per_thread():
+    with trace.trace() as events:
+        thread = threading.Thread(target=generate_color_range, args=("red", "blue"))
+        thread.start()
+        thread.join()
+    assert len(events) == 0
+
+
+def test_the_buffer_keeps_the_most_recent_events():
+    with trace.trace(size=3) as events:
+        for number in range(10):
+            trace.record("function", "step", number)
+    assert [event.index for event in events] == [7, 8, 9]
+    assert (len(events), events.size, events.dropped) == (3, 3, 7)
+    events.clear()
+    assert (len(events), events.dropped) == (0, 0)
+    with pytest.raises(ValueError, match="Invalid trace size"):
+        trace.Trace(0)
+
+
+def test_export():
+    with trace.trace() as events:
+        trace.record("function", "step", 2, (255, 0, 0))
+    assert events.export() == [{"function": "function", "step": "step", "index": 2, "color": (255, 0, 0)}]
+    assert json.loads(events.to_json()) == [{"function": "function", "step": "step", "index": 2, "color": [255, 0, 0]}]
+
+
+def test_test_flag_prints_the_trace_once(monkeypatch):
+    console = Console(file=StringIO(), width=120)
+    monkeypatch.setattr(maxcolor, "get_console", lambda: console)
+    generate_color_range("red", "blue", test=True)
+    output = console.file.getvalue()
+    assert output.count("maxcolor trace") == 1 and "generate_color_range" in output
+
+    # Inside an open trace, the call records into it and prints nothing
+    console.file = StringIO()
+    with trace.trace() as events:
+        generate_color_range("red", "blue", test=True)
+    assert console.file.getvalue() == ""
+    assert any(event.function == "generate_color_range" for event in events)